@@ -704,10 +704,15 @@ def create_parser():
     return parser
 
 
-def main():
-    """Main entry point for Mango CLI."""
+def main(argv: Optional[List[str]] = None):
+    """
+    Main entry point for Mango CLI.
+    
+    Args:
+        argv: Command-line arguments, defaulting to sys.argv[1:]
+    """
     parser = create_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if not args.command:
         parser.print_help()
@@ -7,15 +7,38 @@ A Python library for extracting historical price data from Polymarket prediction
 __version__ = "1.0.0"
 __author__ = "Polymarket Data Team"
 
+import importlib
+from typing import Any
+
 from .models import Market, Event, PriceHistory, PricePoint, MarketHistoricalData, TimeInterval, EventHistoricalData
 from .models.orderbook import OrderBook, OrderLevel, MarketOrderBooks
-from .api import PolymarketAPI
-from .api.data_api import DataAPIClient
 from .utils.parser import PolymarketURLParser
-from .utils.processor import DataProcessor
 from .utils import get_column_prefix, format_price, format_volume
-from .cli.extractor import PolymarketExtractor
-from .cli.cli_output import CLIReporter
+
+# Names backed by httpx/pandas are imported on first access, so entry points
+# that only need models or configuration (e.g. `--help`) start quickly
+_LAZY_IMPORTS = {
+    "PolymarketAPI": ".api",
+    "DataAPIClient": ".api.data_api",
+    "DataProcessor": ".utils.processor",
+    "EventCSVWriter": ".utils.processor",
+    "PolymarketExtractor": ".cli.extractor",
+    "CLIReporter": ".cli.cli_output",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a lazily exported name on first access."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 __all__ = [
     "Market",
@@ -28,6 +51,7 @@ __all__ = [
     "PolymarketAPI",
     "PolymarketURLParser",
     "DataProcessor",
+    "EventCSVWriter",
     "OrderBook",
     "OrderLevel",
     "MarketOrderBooks",
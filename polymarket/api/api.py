@@ -6,10 +6,16 @@ including CLOB, Gamma, and price history endpoints.
 """
 
 import httpx
+import importlib.util
 import asyncio
 import time
 import logging
 import json
+import re
+import ssl
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional, Dict, List, Any, Union
 from abc import ABC, abstractmethod
 from datetime import datetime
@@ -17,50 +23,193 @@ from datetime import datetime
 from ..models import Market, Event, PriceHistory, PricePoint, TimeInterval
 from ..utils.config import (
     CLOB_BASE_URL, GAMMA_BASE_URL, DATA_API_URL, DEFAULT_TIMEOUT,
-    MAX_RETRIES, RETRY_DELAY, USER_AGENT
+    MAX_RETRIES, RETRY_DELAY, USER_AGENT, MAX_CONCURRENT_REQUESTS,
+    HTTP_MAX_CONNECTIONS, HTTP_KEEPALIVE_EXPIRY, HTTP2_ENABLED
+)
+from ..utils.constants import (
+    RATE_LIMIT_LOW_WATERMARK, RATE_LIMIT_REMAINING_HEADER,
+    RATE_LIMIT_RESET_HEADER, RATE_LIMIT_RETRY_AFTER_HEADER
+)
+from ..utils.exceptions import (
+    APIError, RateLimitError, MarketNotFoundError, IntervalTooLongError
 )
-from ..utils.exceptions import APIError, RateLimitError, MarketNotFoundError
 from ..models.orderbook import OrderBook, MarketOrderBooks
+from ..utils.cache import MetadataCache
+from ..utils.utils import loads_json
 
 
 logger = logging.getLogger(__name__)
 
+# CLOB rejects over-long startTs/endTs ranges with an HTTP 400 carrying this text
+INTERVAL_TOO_LONG_PATTERN = re.compile(r"interval is too long", re.IGNORECASE)
+
+# httpx needs the optional h2 package for HTTP/2 (see the 'http2' extra); checked
+# without importing it
+HTTP2_AVAILABLE = HTTP2_ENABLED and importlib.util.find_spec("h2") is not None
+
+
+class RateLimiter:
+    """
+    Adaptive, thread-safe rate limiter driven by server rate-limit headers.
+    
+    Requests proceed without delay while the server reports a healthy
+    remaining budget. Once the budget drops to the low watermark, calls are
+    spread evenly over the time left until the window resets. A Retry-After
+    header blocks all callers until it expires.
+    
+    Each caller reserves its send slot under the lock before sleeping, so
+    concurrent callers wake one interval apart instead of all at once.
+    """
+    
+    def __init__(self, low_watermark: int = RATE_LIMIT_LOW_WATERMARK):
+        self.low_watermark = low_watermark
+        self._lock = threading.Lock()
+        self._remaining: Optional[int] = None
+        self._reset_at = 0.0
+        self._blocked_until = 0.0
+        self._next_slot = 0.0
+    
+    def acquire(self) -> None:
+        """Block until the next request may be sent."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot, self._blocked_until)
+            
+            if (self._remaining is not None and
+                    self._remaining <= self.low_watermark and
+                    self._reset_at > slot):
+                slot += (self._reset_at - slot) / max(self._remaining, 1)
+            
+            self._next_slot = slot
+            if self._remaining is not None:
+                self._remaining = max(self._remaining - 1, 0)
+        
+        delay = slot - now
+        if delay > 0:
+            logger.debug("Rate limiter pacing request by %.2fs", delay)
+            time.sleep(delay)
+    
+    @property
+    def blocked(self) -> bool:
+        """Whether callers are currently held back by a Retry-After header."""
+        return self._blocked_until > time.monotonic()
+    
+    def update(self, headers: Any) -> None:
+        """Record the rate-limit state reported by a response."""
+        remaining = self._parse_number(headers, RATE_LIMIT_REMAINING_HEADER)
+        reset = self._parse_number(headers, RATE_LIMIT_RESET_HEADER)
+        retry_after = self._parse_number(headers, RATE_LIMIT_RETRY_AFTER_HEADER)
+        
+        with self._lock:
+            now = time.monotonic()
+            if remaining is not None:
+                self._remaining = int(remaining)
+            if reset is not None:
+                # Servers report either seconds-until-reset or an epoch timestamp
+                seconds = reset - time.time() if reset > 1_000_000_000 else reset
+                self._reset_at = now + max(seconds, 0.0)
+            if retry_after is not None:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+    
+    @staticmethod
+    def _parse_number(headers: Any, name: str) -> Optional[float]:
+        """Read a numeric header value, ignoring missing or malformed values."""
+        try:
+            value = headers.get(name)
+            return float(value) if value is not None else None
+        except (AttributeError, TypeError, ValueError):
+            return None
+
+
+@lru_cache(maxsize=1)
+def _ssl_context() -> ssl.SSLContext:
+    """Build the TLS context once; loading the CA bundle dominates client setup."""
+    return httpx.create_ssl_context()
+
+
+def create_http_client(timeout: float = DEFAULT_TIMEOUT, **kwargs) -> httpx.Client:
+    """
+    Create an HTTP client with keep-alive connection pooling.
+    
+    A single client can serve every Polymarket API host; connections are
+    pooled per host and reused across requests, avoiding a TLS handshake
+    per call. Clients share one SSL context, so creating further clients
+    does not reload the CA bundle. With h2 installed, requests to a host are
+    multiplexed over one HTTP/2 connection.
+    """
+    kwargs.setdefault('verify', _ssl_context())
+    kwargs.setdefault('http2', HTTP2_AVAILABLE)
+    return httpx.Client(
+        timeout=timeout,
+        headers={
+            'User-Agent': USER_AGENT,
+            'Accept': 'application/json'
+        },
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY
+        ),
+        **kwargs
+    )
+
 
 class BaseAPIClient(ABC):
     """Base class for all API clients with common functionality."""
     
-    def __init__(self, base_url: str, timeout: float = DEFAULT_TIMEOUT):
+    def __init__(self, base_url: str, timeout: float = DEFAULT_TIMEOUT,
+                 http_client: Optional[httpx.Client] = None):
+        """
+        Initialize the client.
+        
+        Args:
+            base_url: API base URL
+            timeout: Request timeout in seconds
+            http_client: Shared HTTP client to send requests through. When
+                omitted, the client lazily creates (and owns) its own.
+        """
         self.base_url = base_url
         self.timeout = timeout
-        self._client = None
+        self.headers: Dict[str, str] = {}
+        self._client = http_client
+        self._owns_client = http_client is None
+        self._client_lock = threading.Lock()
+        self.rate_limiter = RateLimiter()
+        self.metadata_cache = MetadataCache()
         
     @property
     def client(self) -> httpx.Client:
-        """Get or create the HTTP client."""
+        """Get or create the HTTP client (safe to share across threads)."""
         if self._client is None:
-            self._client = httpx.Client(
-                base_url=self.base_url,
-                timeout=self.timeout,
-                headers={
-                    'User-Agent': USER_AGENT,
-                    'Accept': 'application/json'
-                }
-            )
+            with self._client_lock:
+                if self._client is None:
+                    self._client = create_http_client(self.timeout, base_url=self.base_url)
+                    self._owns_client = True
         return self._client
     
     def _request_with_retry(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
         """Make a request with retry logic."""
         for attempt in range(MAX_RETRIES):
             try:
-                response = self.client.request(method, endpoint, **kwargs)
+                self.rate_limiter.acquire()
+                if self.headers:
+                    kwargs['headers'] = {**self.headers, **kwargs.get('headers', {})}
+                response = self.client.request(method, f"{self.base_url.rstrip('/')}{endpoint}", **kwargs)
+                self.rate_limiter.update(response.headers)
+                if response.status_code == 304:  # Conditional GET: cached copy still valid
+                    return response
                 response.raise_for_status()
                 return response
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == 429:  # Rate limited
                     if attempt < MAX_RETRIES - 1:
-                        delay = RETRY_DELAY * (2 ** attempt)
-                        logger.warning(f"Rate limited, retrying in {delay}s...")
-                        time.sleep(delay)
+                        if self.rate_limiter.blocked:
+                            # Server sent Retry-After; the limiter waits it out
+                            logger.warning("Rate limited, honouring Retry-After...")
+                        else:
+                            delay = RETRY_DELAY * (2 ** attempt)
+                            logger.warning(f"Rate limited, retrying in {delay}s...")
+                            time.sleep(delay)
                         continue
                     raise RateLimitError("Rate limit exceeded")
                 raise APIError(f"HTTP {e.response.status_code}: {e.response.text}")
@@ -71,11 +220,35 @@ class BaseAPIClient(ABC):
                     continue
                 raise APIError(f"Request failed: {e}")
     
+    def _get_revalidated(self, namespace: str, key: str, endpoint: str,
+                         params: Dict[str, Any]) -> Union[httpx.Response, Dict[str, Any]]:
+        """
+        GET an endpoint, revalidating an expired cache entry by its ETag.
+        
+        Args:
+            namespace: Metadata cache namespace of the entry
+            key: Metadata cache key of the entry
+            endpoint: API endpoint to request
+            params: Query parameters
+            
+        Returns:
+            The full response, or the cached payload when the server answered
+            304 Not Modified and the entry still holds
+        """
+        stale = self.metadata_cache.get_stale(namespace, key)
+        headers = {'If-None-Match': stale[1]} if stale else {}
+        response = self._request_with_retry('GET', endpoint, params=params, headers=headers)
+        if stale and response.status_code == 304:
+            logger.debug("Cache revalidated: %s/%s", namespace, key)
+            self.metadata_cache.touch(namespace, key)
+            return stale[0]
+        return response
+    
     def close(self):
-        """Close the HTTP client."""
-        if self._client:
+        """Close the HTTP client if this instance owns it."""
+        if self._client and self._owns_client:
             self._client.close()
-            self._client = None
+        self._client = None
     
     def __enter__(self):
         return self
@@ -87,21 +260,32 @@ class BaseAPIClient(ABC):
 class GammaAPIClient(BaseAPIClient):
     """Client for Polymarket's Gamma API (market metadata)."""
     
-    def __init__(self, timeout: float = DEFAULT_TIMEOUT):
-        super().__init__(GAMMA_BASE_URL, timeout)
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT,
+                 http_client: Optional[httpx.Client] = None):
+        super().__init__(GAMMA_BASE_URL, timeout, http_client)
     
     def get_market_by_slug(self, slug: str) -> Optional[Market]:
         """Fetch a market by its slug."""
+        cached = self.metadata_cache.get('gamma-markets', slug)
+        if cached:
+            return Market.from_gamma_response(cached)
+        
         try:
             # First try direct query
-            response = self._request_with_retry('GET', '/markets', params={'slug': slug})
-            data = response.json()
+            response = self._get_revalidated(
+                'gamma-markets', slug, '/markets', {'slug': slug}
+            )
+            if not isinstance(response, httpx.Response):
+                return Market.from_gamma_response(response)
+            data = loads_json(response.content)
             
             if data and isinstance(data, list) and len(data) > 0:
+                self.metadata_cache.set('gamma-markets', slug, data[0],
+                                        etag=response.headers.get('ETag'))
                 return Market.from_gamma_response(data[0])
             
             # If not found, search through all markets
-            logger.debug(f"Market not found by slug query, searching all markets...")
+            logger.debug("Market not found by slug query, searching all markets...")
             markets = self.get_markets(limit=1000, active=True)
             for market in markets:
                 if market.slug == slug or slug in market.slug:
@@ -228,7 +412,7 @@ class GammaAPIClient(BaseAPIClient):
             
         try:
             response = self._request_with_retry('GET', '/markets', params=params)
-            data = response.json()
+            data = loads_json(response.content)
             return [Market.from_gamma_response(market) for market in data]
         except Exception as e:
             logger.error(f"Error fetching markets: {e}")
@@ -252,12 +436,20 @@ class GammaAPIClient(BaseAPIClient):
     
     def get_event_by_slug(self, slug: str) -> Optional[Event]:
         """Fetch an event by its slug."""
+        cached = self.metadata_cache.get('events', slug)
+        if cached:
+            return Event.from_gamma_response(cached)
+        
         try:
             # Direct query by slug
-            response = self._request_with_retry('GET', '/events', params={'slug': slug})
-            data = response.json()
+            response = self._get_revalidated('events', slug, '/events', {'slug': slug})
+            if not isinstance(response, httpx.Response):
+                return Event.from_gamma_response(response)
+            data = loads_json(response.content)
             
             if data and isinstance(data, list) and len(data) > 0:
+                self.metadata_cache.set('events', slug, data[0],
+                                        etag=response.headers.get('ETag'))
                 return Event.from_gamma_response(data[0])
             
             return None
@@ -375,7 +567,7 @@ class GammaAPIClient(BaseAPIClient):
             
         try:
             response = self._request_with_retry('GET', '/events', params=params)
-            data = response.json()
+            data = loads_json(response.content)
             return [Event.from_gamma_response(event) for event in data]
         except Exception as e:
             logger.error(f"Error fetching events: {e}")
@@ -453,13 +645,40 @@ class GammaAPIClient(BaseAPIClient):
 class CLOBAPIClient(BaseAPIClient):
     """Client for Polymarket's CLOB API (trading and price data)."""
     
-    def __init__(self, api_key: Optional[str] = None, timeout: float = DEFAULT_TIMEOUT):
-        super().__init__(CLOB_BASE_URL, timeout)
+    def __init__(self, api_key: Optional[str] = None, timeout: float = DEFAULT_TIMEOUT,
+                 http_client: Optional[httpx.Client] = None):
+        super().__init__(CLOB_BASE_URL, timeout, http_client)
         self.api_key = api_key
         
-        # Add API key to headers if provided
-        if api_key and self._client:
-            self._client.headers['Authorization'] = f'Bearer {api_key}'
+        # Send API key with every CLOB request if provided
+        if api_key:
+            self.headers['Authorization'] = f'Bearer {api_key}'
+        
+        self._executor: Optional[ThreadPoolExecutor] = None
+    
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """
+        Get or create the pool shared by all per-outcome price requests.
+        
+        Callers fetching several markets at once (e.g. the extractor's own
+        pool) all fan out through this one pool, so price requests in flight
+        stay capped at MAX_CONCURRENT_REQUESTS instead of multiplying.
+        """
+        if self._executor is None:
+            with self._client_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=MAX_CONCURRENT_REQUESTS, thread_name_prefix='clob-prices'
+                    )
+        return self._executor
+    
+    def close(self):
+        """Shut down the price request pool, then close the HTTP client."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        super().close()
     
     def get_markets(self, next_cursor: Optional[str] = None) -> Dict[str, Any]:
         """Get markets from CLOB API with pagination."""
@@ -469,13 +688,17 @@ class CLOBAPIClient(BaseAPIClient):
             
         try:
             response = self._request_with_retry('GET', '/markets', params=params)
-            return response.json()
+            return loads_json(response.content)
         except Exception as e:
             logger.error(f"Error fetching CLOB markets: {e}")
             return {}
     
     def find_market_by_slug(self, slug: str) -> Optional[Market]:
         """Find a market by its slug in CLOB API."""
+        cached = self.metadata_cache.get('clob-markets', slug)
+        if cached:
+            return Market.from_clob_response(cached)
+        
         next_cursor = None
         
         while True:
@@ -485,6 +708,7 @@ class CLOBAPIClient(BaseAPIClient):
                 
             for market_data in data['data']:
                 if market_data.get('market_slug') == slug:
+                    self.metadata_cache.set('clob-markets', slug, market_data)
                     return Market.from_clob_response(market_data)
             
             next_cursor = data.get('next_cursor')
@@ -549,8 +773,13 @@ class CLOBAPIClient(BaseAPIClient):
                 params['fidelity'] = fidelity
             
         try:
-            response = self._request_with_retry('GET', '/prices-history', params=params)
-            data = response.json()
+            try:
+                response = self._request_with_retry('GET', '/prices-history', params=params)
+            except APIError as e:
+                if INTERVAL_TOO_LONG_PATTERN.search(str(e)):
+                    raise IntervalTooLongError(str(e)) from e
+                raise
+            data = loads_json(response.content)
             
             price_points = [PricePoint.from_api_response(point) 
                           for point in data.get('history', [])]
@@ -564,6 +793,9 @@ class CLOBAPIClient(BaseAPIClient):
                 end_time=datetime.fromtimestamp(end_ts) if end_ts else None,
                 price_points=price_points
             )
+        except IntervalTooLongError:
+            # Callers narrow the time range and retry
+            raise
         except Exception as e:
             logger.error(f"Error fetching price history for market {market_id}: {e}")
             return None
@@ -575,11 +807,27 @@ class CLOBAPIClient(BaseAPIClient):
                                      start_ts: Optional[int] = None,
                                      end_ts: Optional[int] = None,
                                      fidelity: Optional[int] = None) -> Dict[str, PriceHistory]:
-        """Fetch price history for all outcomes of a market."""
+        """
+        Fetch price history for all outcomes of a market.
+        
+        The prices-history endpoint accepts a single token per request, so
+        the per-outcome requests are issued concurrently rather than batched,
+        through the client's shared bounded pool (see executor).
+        """
+        if isinstance(interval, str):
+            interval = TimeInterval.from_string(interval)
+        
         results = {}
+        pairs = list(zip(token_ids, outcomes))
+        
+        def fetch(token_id: str) -> Optional[PriceHistory]:
+            return self.get_price_history(token_id, interval, start_ts, end_ts, fidelity)
         
-        for token_id, outcome in zip(token_ids, outcomes):
-            history = self.get_price_history(token_id, interval, start_ts, end_ts, fidelity)
+        # Even single-outcome markets go through the shared pool, so the
+        # calling thread never adds a request beyond its cap
+        histories = list(self.executor.map(fetch, [token_id for token_id, _ in pairs]))
+        
+        for (_, outcome), history in zip(pairs, histories):
             if history:
                 history.outcome = outcome
                 results[outcome] = history
@@ -598,7 +846,7 @@ class CLOBAPIClient(BaseAPIClient):
         """
         try:
             response = self._request_with_retry('GET', '/book', params={'token_id': token_id})
-            return response.json()
+            return loads_json(response.content)
         except Exception as e:
             logger.error(f"Error fetching order book for token {token_id}: {e}")
             return None
@@ -620,7 +868,7 @@ class CLOBAPIClient(BaseAPIClient):
             
         try:
             response = self._request_with_retry('GET', '/books', params=params)
-            data = response.json()
+            data = loads_json(response.content)
             
             # Map response to token IDs
             result = {}
@@ -645,7 +893,7 @@ class CLOBAPIClient(BaseAPIClient):
         """
         try:
             response = self._request_with_retry('GET', '/midpoint', params={'token_id': token_id})
-            data = response.json()
+            data = loads_json(response.content)
             return float(data.get('mid', 0)) if data else None
         except Exception as e:
             logger.error(f"Error fetching midpoint for token {token_id}: {e}")
@@ -663,7 +911,7 @@ class CLOBAPIClient(BaseAPIClient):
         """
         try:
             response = self._request_with_retry('GET', '/spread', params={'token_id': token_id})
-            data = response.json()
+            data = loads_json(response.content)
             if data:
                 return {
                     'spread': float(data.get('spread', 0)),
@@ -690,7 +938,7 @@ class CLOBAPIClient(BaseAPIClient):
         
         try:
             response = self._request_with_retry('GET', endpoint, params=params)
-            data = response.json()
+            data = loads_json(response.content)
             
             # Handle different response formats
             if isinstance(data, dict):
@@ -706,7 +954,7 @@ class CLOBAPIClient(BaseAPIClient):
             logger.warning(f"Unexpected response format for {token_id}: {data}")
             return None
         except Exception as e:
-            logger.debug(f"Error fetching {side} price for {token_id}: {e}")
+            logger.debug("Error fetching %s price for %s: %s", side, token_id, e)
             return None
     
     def get_prices(self, token_ids: List[str], side: str = 'mid') -> Dict[str, float]:
@@ -731,7 +979,7 @@ class CLOBAPIClient(BaseAPIClient):
                     prices[token_id] = price
                 else:
                     # Fallback: try to get from order book
-                    logger.debug(f"Falling back to order book for {token_id}")
+                    logger.debug("Falling back to order book for %s", token_id)
                     order_book = self.get_order_book(token_id)
                     
                     if order_book:
@@ -751,11 +999,6 @@ class CLOBAPIClient(BaseAPIClient):
                 logger.error(f"Failed to get price for token {token_id}: {e}")
                 continue
                 
-            # Small delay to respect rate limits
-            if len(token_ids) > 1:
-                import time
-                time.sleep(0.1)  # 100ms delay between requests
-                
         return prices
 
 
@@ -767,12 +1010,24 @@ class PolymarketAPI:
     Polymarket APIs, handling fallbacks and providing a consistent interface.
     """
     
-    def __init__(self, api_key: Optional[str] = None):
-        self.gamma_client = GammaAPIClient()
-        self.clob_client = CLOBAPIClient(api_key=api_key)
+    def __init__(self, api_key: Optional[str] = None,
+                 http_client: Optional[httpx.Client] = None):
+        """
+        Initialize the API clients.
+        
+        Args:
+            api_key: Optional CLOB API key
+            http_client: Shared HTTP client to send requests through. When
+                omitted, one is created (and closed by close()).
+        """
+        # One keep-alive connection pool shared by every API client
+        self._owns_http_client = http_client is None
+        self.http_client = http_client or create_http_client()
+        self.gamma_client = GammaAPIClient(http_client=self.http_client)
+        self.clob_client = CLOBAPIClient(api_key=api_key, http_client=self.http_client)
         # Import here to avoid circular dependency
         from .data_api import DataAPIClient
-        self.data_client = DataAPIClient()
+        self.data_client = DataAPIClient(http_client=self.http_client)
         
     def get_market(self, slug: str) -> Optional[Market]:
         """
@@ -785,14 +1040,14 @@ class PolymarketAPI:
             Market object or None if not found
         """
         # Try CLOB API first (most up-to-date)
-        logger.debug(f"Searching for market '{slug}' in CLOB API...")
+        logger.debug("Searching for market '%s' in CLOB API...", slug)
         market = self.clob_client.find_market_by_slug(slug)
         if market:
             logger.info(f"Found market in CLOB API: {market.question}")
             return market
         
         # Fallback to Gamma API
-        logger.debug(f"Market not found in CLOB API, trying Gamma API...")
+        logger.debug("Market not found in CLOB API, trying Gamma API...")
         market = self.gamma_client.get_market_by_slug(slug)
         if market:
             logger.info(f"Found market in Gamma API: {market.question}")
@@ -866,7 +1121,7 @@ class PolymarketAPI:
         Returns:
             Event object or None if not found
         """
-        logger.debug(f"Fetching event '{slug}' from Gamma API...")
+        logger.debug("Fetching event '%s' from Gamma API...", slug)
         return self.gamma_client.get_event_by_slug(slug)
     
     def get_market_from_direct_url(self, slug: str) -> Optional[Market]:
@@ -979,10 +1234,12 @@ class PolymarketAPI:
         return self.data_client.get_market_holders(market_id, **kwargs)
     
     def close(self):
-        """Close all API clients."""
+        """Close all API clients and the shared connection pool if owned."""
         self.gamma_client.close()
         self.clob_client.close()
         self.data_client.close()
+        if self._owns_http_client:
+            self.http_client.close()
         
     def __enter__(self):
         return self
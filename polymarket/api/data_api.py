@@ -6,12 +6,14 @@ user positions, on-chain activity, and market holder information.
 """
 
 import logging
+import httpx
 from typing import Optional, List, Dict, Any, Literal
 from datetime import datetime
 
 from .api import BaseAPIClient
 from ..utils.config import DATA_API_URL, DEFAULT_TIMEOUT
 from ..utils.exceptions import APIError, AuthenticationError
+from ..utils.utils import loads_json
 
 
 logger = logging.getLogger(__name__)
@@ -26,8 +28,9 @@ SortOrder = Literal["ASC", "DESC"]
 class DataAPIClient(BaseAPIClient):
     """Client for Polymarket's Data API (user positions and activity)."""
     
-    def __init__(self, timeout: float = DEFAULT_TIMEOUT):
-        super().__init__(DATA_API_URL, timeout)
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT,
+                 http_client: Optional[httpx.Client] = None):
+        super().__init__(DATA_API_URL, timeout, http_client)
     
     def get_user_positions(self,
                           address: str,
@@ -80,7 +83,7 @@ class DataAPIClient(BaseAPIClient):
             
         try:
             response = self._request_with_retry('GET', '/positions', params=params)
-            return response.json()
+            return loads_json(response.content)
         except Exception as e:
             logger.error(f"Error fetching user positions: {e}")
             raise APIError(f"Failed to fetch positions: {e}")
@@ -135,7 +138,7 @@ class DataAPIClient(BaseAPIClient):
             
         try:
             response = self._request_with_retry('GET', '/activity', params=params)
-            return response.json()
+            return loads_json(response.content)
         except Exception as e:
             logger.error(f"Error fetching user activity: {e}")
             raise APIError(f"Failed to fetch activity: {e}")
@@ -171,7 +174,7 @@ class DataAPIClient(BaseAPIClient):
             
         try:
             response = self._request_with_retry('GET', '/holders', params=params)
-            return response.json()
+            return loads_json(response.content)
         except Exception as e:
             logger.error(f"Error fetching market holders: {e}")
             raise APIError(f"Failed to fetch holders: {e}")
@@ -205,7 +208,7 @@ class DataAPIClient(BaseAPIClient):
             
         try:
             response = self._request_with_retry('GET', '/holdings-value', params=params)
-            return response.json()
+            return loads_json(response.content)
         except Exception as e:
             logger.error(f"Error fetching holdings value: {e}")
             raise APIError(f"Failed to fetch holdings value: {e}")
@@ -243,7 +246,7 @@ class DataAPIClient(BaseAPIClient):
             
         try:
             response = self._request_with_retry('GET', '/trades', params=params)
-            return response.json()
+            return loads_json(response.content)
         except Exception as e:
             logger.error(f"Error fetching user trades: {e}")
             raise APIError(f"Failed to fetch trades: {e}")
\ No newline at end of file
@@ -8,22 +8,25 @@ from Polymarket markets and events.
 import logging
 import time
 import gc
-from datetime import datetime
-from typing import Optional, Union
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Optional, Tuple, Union
 
 from ..api import PolymarketAPI
 from ..utils.parser import PolymarketURLParser
-from ..models import MarketHistoricalData, EventHistoricalData, TimeInterval
+from ..utils.utils import date_to_timestamp
+from ..models import Event, Market, MarketHistoricalData, EventHistoricalData, TimeInterval
 from .cli_output import CLIReporter
 from ..utils.constants import (
-    MAX_RETRIES, RATE_LIMIT_CHUNK_DELAY,
-    MAX_MARKET_QUESTION_DISPLAY,
+    MAX_RETRIES, MAX_MARKET_QUESTION_DISPLAY, SECONDS_PER_DAY,
     SUCCESS_EXTRACTION_COMPLETE
 )
 from ..utils.exceptions import (
-    PolymarketError, InvalidURLError, MarketNotFoundError
+    PolymarketError, InvalidURLError, MarketNotFoundError, IntervalTooLongError
+)
+from ..utils.config import (
+    DEFAULT_API_KEY, DEFAULT_INTERVAL, DEFAULT_DAYS_BACK, MAX_CONCURRENT_REQUESTS
 )
-from ..utils.config import DEFAULT_API_KEY, DEFAULT_INTERVAL, DEFAULT_DAYS_BACK
 
 
 logger = logging.getLogger(__name__)
@@ -46,7 +49,7 @@ class PolymarketExtractor:
     
     def extract_from_url(self,
                         url: str,
-                        interval: str = DEFAULT_INTERVAL,
+                        interval: Union[str, TimeInterval] = DEFAULT_INTERVAL,
                         days_back: int = DEFAULT_DAYS_BACK,
                         start_date: Optional[str] = None,
                         end_date: Optional[str] = None,
@@ -65,8 +68,10 @@ class PolymarketExtractor:
             MarketHistoricalData object or None if extraction fails
         """
         try:
+            interval = self._normalize_interval(interval)
+            
             # Parse the URL
-            logger.info(f"Parsing URL: {url}")
+            logger.info("Parsing URL: %s", url)
             parsed_url = self.parser.parse(url)
             
             # Handle event URLs
@@ -90,6 +95,7 @@ class PolymarketExtractor:
             start_ts, end_ts = self._calculate_time_range(start_date, end_date, days_back, market)
             
             # Fetch price history
+            self.reporter.print("\nFetching price history...")
             price_histories = self._fetch_price_history_with_retry(
                 market, interval, start_ts, end_ts, fidelity
             )
@@ -111,16 +117,16 @@ class PolymarketExtractor:
             return data
             
         except InvalidURLError as e:
-            logger.error(f"Invalid URL: {e}")
+            logger.error("Invalid URL: %s", e)
             self.reporter.error(str(e))
             return None
         except MarketNotFoundError as e:
-            logger.error(f"Market not found: {e}")
+            logger.error("Market not found: %s", e)
             self.reporter.error(str(e))
             self.reporter.print("Tip: Make sure you're using the exact market URL from Polymarket.com")
             return None
         except PolymarketError as e:
-            logger.error(f"Polymarket error: {e}")
+            logger.error("Polymarket error: %s", e)
             self.reporter.error(str(e))
             return None
         except Exception as e:
@@ -135,7 +141,10 @@ class PolymarketExtractor:
                                  start_date: Optional[str] = None,
                                  end_date: Optional[str] = None,
                                  enable_gc: bool = False,
-                                 fidelity: Optional[int] = None) -> Optional[EventHistoricalData]:
+                                 fidelity: Optional[int] = None,
+                                 event: Optional[Event] = None,
+                                 market_callback: Optional[Callable[[MarketHistoricalData], None]] = None
+                                 ) -> Optional[EventHistoricalData]:
         """
         Extract historical data for all markets in an event.
         
@@ -146,13 +155,19 @@ class PolymarketExtractor:
             start_date: Start date in YYYY-MM-DD format
             end_date: End date in YYYY-MM-DD format
             enable_gc: Enable garbage collection between markets for memory efficiency
+            event: Already-fetched Event to reuse instead of querying the API again
+            market_callback: Called with each market's data as soon as it is
+                fetched (e.g. EventCSVWriter.add_market). Market data handed
+                to the callback is not retained on the returned object.
             
         Returns:
             EventHistoricalData object or None if extraction fails
         """
         try:
-            # Fetch the event
-            event = self._fetch_event(event_slug)
+            interval = self._normalize_interval(interval)
+            
+            # Fetch the event (unless the caller already has it)
+            event = self._fetch_event(event_slug, event)
             if not event or not event.markets:
                 return None
             
@@ -166,23 +181,24 @@ class PolymarketExtractor:
                 inactive_negrisk, other_inactive
             )
             
-            # Calculate time range
-            start_ts, end_ts = self._calculate_time_range(start_date, end_date, days_back)
+            # Calculate time range from one clock snapshot shared by all markets
+            now = int(time.time())
+            start_ts, end_ts = self._calculate_time_range(start_date, end_date, days_back, now=now)
             
             # Create result object
             event_data = EventHistoricalData(event=event)
             
             # Extract data for each market
             successful, failed = self._extract_markets(
-                event.markets, event_data, interval, 
+                active_markets, event_data, interval, 
                 start_ts, end_ts, enable_gc, fidelity,
-                days_back, start_date, end_date
+                days_back, start_date, end_date, market_callback, now
             )
             
             # Display final statistics
             self.reporter.print(f"\n\n{SUCCESS_EXTRACTION_COMPLETE.format(successful=successful, failed=failed)}")
             
-            if event_data.has_data:
+            if event_data.has_data or (market_callback and successful):
                 return event_data
             else:
                 self.reporter.print("\nNo data was successfully extracted.")
@@ -193,10 +209,17 @@ class PolymarketExtractor:
             self.reporter.error(f"Error extracting event markets: {e}")
             return None
     
+    @staticmethod
+    def _normalize_interval(interval: Union[str, TimeInterval]) -> TimeInterval:
+        """Convert an interval string to TimeInterval once, at the entry point."""
+        if isinstance(interval, TimeInterval):
+            return interval
+        return TimeInterval.from_string(interval)
+    
     def _handle_event_url(self, parsed_url: dict, url: str) -> None:
         """Handle event URL by displaying available markets."""
         event_slug = parsed_url['event_slug']
-        logger.info(f"Event URL detected. Fetching event: {event_slug}")
+        logger.info("Event URL detected. Fetching event: %s", event_slug)
         
         event = self.api.get_event(event_slug)
         if not event:
@@ -225,7 +248,7 @@ class PolymarketExtractor:
     def _fetch_market(self, parsed_url: dict):
         """Fetch market data from API."""
         slug = self.parser.get_api_slug(parsed_url['url'])
-        logger.info(f"Extracted slug: {slug}")
+        logger.info("Extracted slug: %s", slug)
         
         logger.info("Fetching market metadata...")
         market = self.api.get_market(slug)
@@ -233,21 +256,22 @@ class PolymarketExtractor:
         if not market:
             raise MarketNotFoundError(slug)
         
-        logger.info(f"Found market: {market.question}")
+        logger.info("Found market: %s", market.question)
         return market
     
-    def _fetch_event(self, event_slug: str):
-        """Fetch event data from API."""
-        logger.info(f"Fetching event: {event_slug}")
-        event = self.api.get_event(event_slug)
+    def _fetch_event(self, event_slug: str, event: Optional[Event] = None):
+        """Fetch event data from API, reusing a prefetched event if given."""
+        if event is None:
+            logger.info("Fetching event: %s", event_slug)
+            event = self.api.get_event(event_slug)
         
         if not event:
-            logger.warning(f"Event not found: {event_slug}")
+            logger.warning("Event not found: %s", event_slug)
             self.reporter.error(f"Event not found: {event_slug}")
             return None
         
         if not event.markets:
-            logger.warning(f"No markets found in event: {event_slug}")
+            logger.warning("No markets found in event: %s", event_slug)
             self.reporter.print("\nNo markets found in this event.")
             return None
         
@@ -255,7 +279,7 @@ class PolymarketExtractor:
     
     def _validate_market_tokens(self, market) -> bool:
         """Validate that market has tradeable tokens."""
-        if not market.token_ids or all(not tid for tid in market.token_ids):
+        if not market.has_tradeable_tokens:
             logger.warning("Market has no valid token IDs")
             
             if market.is_inactive_negrisk_option():
@@ -269,40 +293,42 @@ class PolymarketExtractor:
     def _calculate_time_range(self, start_date: Optional[str], 
                              end_date: Optional[str], 
                              days_back: int,
-                             market: Optional['Market'] = None) -> tuple:
-        """Calculate timestamp range for data extraction with smart market age detection."""
+                             market: Optional['Market'] = None,
+                             now: Optional[int] = None) -> tuple:
+        """
+        Calculate timestamp range for data extraction with smart market age detection.
+        
+        Pass a single `now` snapshot when computing ranges for several markets
+        so they all share the same end time.
+        """
+        if now is None:
+            now = int(time.time())
+        
         # If explicit dates are provided, use them
         if start_date:
-            start_ts = int(datetime.strptime(start_date, "%Y-%m-%d").timestamp())
+            start_ts = date_to_timestamp(start_date)
         else:
+            start_ts = now - days_back * SECONDS_PER_DAY
+            
             # Smart detection based on market age
             if market and market.created_at:
-                market_age_days = (datetime.now(market.created_at.tzinfo) - market.created_at).days
+                created_ts = int(market.created_at.timestamp())
+                market_age_days = (now - created_ts) // SECONDS_PER_DAY
                 
                 if market_age_days <= days_back:
                     # Market is younger than requested range, use creation date
-                    start_ts = int(market.created_at.timestamp())
-                    logger.info(f"Market is {market_age_days} days old, using creation date as start")
-                else:
-                    # Market is older, use requested range
-                    start_ts = int(time.time()) - (days_back * 24 * 60 * 60)
-            else:
-                # Fallback to standard calculation
-                start_ts = int(time.time()) - (days_back * 24 * 60 * 60)
+                    start_ts = created_ts
+                    logger.info("Market is %s days old, using creation date as start", market_age_days)
             
-        if end_date:
-            end_ts = int(datetime.strptime(end_date, "%Y-%m-%d").timestamp())
-        else:
-            end_ts = int(time.time())
+        end_ts = date_to_timestamp(end_date) if end_date else now
         
         return start_ts, end_ts
     
-    def _fetch_price_history_with_retry(self, market, interval: str, 
+    def _fetch_price_history_with_retry(self, market, interval: TimeInterval, 
                                       start_ts: int, end_ts: int,
                                       fidelity: Optional[int] = None):
         """Fetch price history with retry logic for API limits."""
-        logger.info(f"Fetching price history (interval: {interval})...")
-        self.reporter.print("\nFetching price history...")
+        logger.info("Fetching price history (interval: %s)...", interval.value)
         
         retry_count = 0
         current_start = start_ts
@@ -317,20 +343,23 @@ class PolymarketExtractor:
                 if price_histories:
                     return price_histories
                     
-            except Exception as e:
-                if "interval is too long" in str(e) and retry_count < MAX_RETRIES - 1:
+            except IntervalTooLongError:
+                # The API rejects the range itself rather than throttling,
+                # so the narrower request is sent straight away; rate limits
+                # are already paced by the client's RateLimiter and retries
+                if retry_count < MAX_RETRIES - 1:
                     # Reduce the time range by 50%
                     time_span = current_end - current_start
                     new_span = time_span // 2
                     current_start = current_end - new_span
                     
-                    days = new_span // (24*60*60)
-                    logger.warning(f"Time range too long, reducing to {days} days...")
+                    days = new_span // SECONDS_PER_DAY
+                    logger.warning("Time range too long, reducing to %s days...", days)
                     self.reporter.print(f"API limit reached, adjusting to {days} days...")
                     retry_count += 1
                     continue
                 else:
-                    # Re-raise other errors or if we've exhausted retries
+                    # Re-raise once retries are exhausted
                     raise
             
             # If we get here with no data and no exception, break
@@ -345,7 +374,7 @@ class PolymarketExtractor:
         other_inactive = 0
         
         for market in markets:
-            if market.token_ids and any(tid for tid in market.token_ids):
+            if market.has_tradeable_tokens:
                 active_markets.append(market)
             elif market.is_inactive_negrisk_option():
                 inactive_negrisk += 1
@@ -355,75 +384,118 @@ class PolymarketExtractor:
         return active_markets, inactive_negrisk, other_inactive
     
     def _extract_markets(self, markets: list, event_data: EventHistoricalData,
-                        interval: str, start_ts: int, end_ts: int, 
+                        interval: TimeInterval, start_ts: int, end_ts: int, 
                         enable_gc: bool, fidelity: Optional[int] = None,
                         days_back: Optional[int] = None,
                         start_date: Optional[str] = None,
-                        end_date: Optional[str] = None) -> tuple:
-        """Extract price data for all markets in an event."""
+                        end_date: Optional[str] = None,
+                        market_callback: Optional[Callable[[MarketHistoricalData], None]] = None,
+                        now: Optional[int] = None) -> tuple:
+        """
+        Extract price data for the active markets of an event.
+        
+        Markets must already be filtered to those with tradeable tokens
+        (see _analyze_markets). Price history requests are dispatched
+        concurrently over a bounded thread pool sharing the API client's
+        connection pool, with the next market submitted only as each one is
+        consumed. Results are consumed in event order so progress output
+        stays deterministic.
+        Each market's data goes to market_callback when given, otherwise it
+        is stored on event_data.
+        """
         successful = 0
         failed = 0
         
-        for i, market in enumerate(markets, 1):
-            market_name = market.group_item_title or market.question[:MAX_MARKET_QUESTION_DISPLAY]
-            self.reporter.market_extraction_progress(i, len(markets), market_name)
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            upcoming = iter(markets)
+            pending: Deque[Tuple[Market, Future]] = deque()
             
-            # Skip markets without valid token IDs
-            if not market.token_ids or all(not tid for tid in market.token_ids):
-                if market.is_inactive_negrisk_option():
-                    self.reporter.market_skip_reason("Inactive negRisk option (placeholder)")
-                else:
-                    self.reporter.market_skip_reason("No tradeable tokens available")
-                failed += 1
-                continue
+            def submit_next() -> None:
+                market = next(upcoming, None)
+                if market is not None:
+                    pending.append((market, executor.submit(
+                        self._fetch_market_price_history, market, interval,
+                        fidelity, days_back, start_date, end_date, now
+                    )))
             
-            try:
-                # Calculate time range specific to this market
-                market_start_ts, market_end_ts = self._calculate_time_range(
-                    start_date, end_date, days_back or DEFAULT_DAYS_BACK, market
-                )
-                
-                # Fetch price history for this market
-                price_histories = self._fetch_price_history_with_retry(
-                    market, interval, market_start_ts, market_end_ts, fidelity
-                )
+            # Keep at most MAX_CONCURRENT_REQUESTS fetches in flight, so only
+            # that many markets' histories are held in memory at once
+            for _ in range(MAX_CONCURRENT_REQUESTS):
+                submit_next()
+            
+            for i in range(1, len(markets) + 1):
+                market, future = pending.popleft()
+                market_name = market.group_item_title or market.question[:MAX_MARKET_QUESTION_DISPLAY]
+                self.reporter.market_extraction_progress(i, len(markets), market_name)
                 
-                if price_histories:
-                    # Create MarketHistoricalData
-                    market_data = MarketHistoricalData(
-                        market=market,
-                        price_histories=price_histories
-                    )
-                    event_data.market_data[market.slug] = market_data
-                    successful += 1
-                    
-                    # Show brief summary
-                    for outcome, history in price_histories.items():
-                        if history.price_points:
-                            self.reporter.print(
-                                f"  {outcome}: {history.data_points_count} data points, "
-                                f"latest: ${history.latest_price:.4f}"
-                            )
-                else:
-                    self.reporter.print("  Warning: No data available")
+                try:
+                    if self._store_market_result(market, future.result(),
+                                                 event_data, market_callback):
+                        successful += 1
+                    else:
+                        failed += 1
+                except Exception as e:
+                    logger.error("Failed to extract market %s: %s", market.slug, e)
+                    self.reporter.print(f"  Error: {e}")
                     failed += 1
-                    
-            except Exception as e:
-                logger.error(f"Failed to extract market {market.slug}: {e}")
-                self.reporter.print(f"  Error: {e}")
-                failed += 1
-            
-            # Memory management and rate limiting
-            if enable_gc:
-                gc.collect()
-                logger.debug(f"Garbage collection after market {i}/{len(markets)}")
-            
-            # Rate limiting - small delay between markets
-            if i < len(markets):
-                time.sleep(RATE_LIMIT_CHUNK_DELAY)
+                
+                # The finished future holds this market's histories; drop it
+                # before fetching the next market
+                del future
+                submit_next()
+                
+                # Memory management
+                if enable_gc:
+                    gc.collect()
+                    logger.debug("Garbage collection after market %s/%s", i, len(markets))
         
         return successful, failed
     
+    def _store_market_result(self, market: Market, price_histories,
+                             event_data: EventHistoricalData,
+                             market_callback: Optional[Callable[[MarketHistoricalData], None]]) -> bool:
+        """
+        Hand one market's fetched histories to the callback or the event data.
+        
+        Returns:
+            True if the market had price data, False otherwise
+        """
+        if not price_histories:
+            self.reporter.print("  Warning: No data available")
+            return False
+        
+        market_data = MarketHistoricalData(
+            market=market,
+            price_histories=price_histories
+        )
+        if market_callback:
+            market_callback(market_data)
+        else:
+            event_data.market_data[market.slug] = market_data
+        
+        # Show brief summary
+        for outcome, history in price_histories.items():
+            if history.price_points:
+                self.reporter.print(
+                    f"  {outcome}: {history.data_points_count} data points, "
+                    f"latest: ${history.latest_price:.4f}"
+                )
+        return True
+    
+    def _fetch_market_price_history(self, market, interval: TimeInterval,
+                                    fidelity: Optional[int] = None,
+                                    days_back: Optional[int] = None,
+                                    start_date: Optional[str] = None,
+                                    end_date: Optional[str] = None,
+                                    now: Optional[int] = None):
+        """Fetch price history for one event market using its own time range."""
+        market_start_ts, market_end_ts = self._calculate_time_range(
+            start_date, end_date, days_back or DEFAULT_DAYS_BACK, market, now
+        )
+        return self._fetch_price_history_with_retry(
+            market, interval, market_start_ts, market_end_ts, fidelity
+        )
+    
     def close(self):
         """Close API connections."""
         self.api.close()
\ No newline at end of file
@@ -5,11 +5,20 @@ This module contains all the data models used across the Polymarket library,
 providing a consistent interface regardless of the underlying API.
 """
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Union
+from typing import TYPE_CHECKING, List, Optional, Dict, Any, Union
 from enum import Enum
 
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# Models are created per market and per price point, so they drop the
+# per-instance __dict__ where dataclasses support it (Python 3.10+)
+DATACLASS_SLOTS: Dict[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
 class TimeInterval(Enum):
     """Supported time intervals for historical data."""
@@ -23,13 +32,13 @@ class TimeInterval(Enum):
     @classmethod
     def from_string(cls, value: str) -> 'TimeInterval':
         """Convert string to TimeInterval enum."""
-        for interval in cls:
-            if interval.value == value:
-                return interval
-        raise ValueError(f"Invalid interval: {value}")
+        try:
+            return cls(value)
+        except ValueError:
+            raise ValueError(f"Invalid interval: {value}") from None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PricePoint:
     """Represents a single price point in time."""
     timestamp: datetime
@@ -44,7 +53,7 @@ class PricePoint:
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PriceHistory:
     """Represents the complete price history for a market outcome."""
     market_id: str
@@ -55,6 +64,31 @@ class PriceHistory:
     end_time: Optional[datetime]
     price_points: List[PricePoint] = field(default_factory=list)
     
+    @property
+    def prices(self) -> 'np.ndarray':
+        """
+        Get the prices as a float64 array, in point order.
+        
+        Built on each access rather than cached, since price_points is a
+        mutable list and a stored copy could go stale.
+        """
+        # Imported here so loading the models (e.g. for --help) skips numpy
+        import numpy as np
+        return np.fromiter(
+            (point.price for point in self.price_points),
+            dtype=np.float64,
+            count=len(self.price_points)
+        )
+    
+    @property
+    def timestamps(self) -> 'np.ndarray':
+        """Get the timestamps as a datetime64[us] array, in point order."""
+        import numpy as np
+        return np.array(
+            [point.timestamp for point in self.price_points],
+            dtype='datetime64[us]'
+        )
+    
     @property
     def latest_price(self) -> Optional[float]:
         """Get the most recent price."""
@@ -85,7 +119,7 @@ class PriceHistory:
         return len(self.price_points)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Market:
     """
     Unified market representation across all Polymarket APIs.
@@ -123,12 +157,18 @@ class Market:
     # Additional fields for flexibility
     metadata: Dict[str, Any] = field(default_factory=dict)
     
+    # Whether the market has at least one non-empty token ID (derived once)
+    has_tradeable_tokens: bool = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.has_tradeable_tokens = bool(self.token_ids) and any(self.token_ids)
+    
     def is_inactive_negrisk_option(self) -> bool:
         """Check if this is an inactive option in a negRisk market."""
         return (
             self.neg_risk and 
             self.neg_risk_market_id and
-            (not self.token_ids or all(not tid for tid in self.token_ids))
+            not self.has_tradeable_tokens
         )
     
     @classmethod
@@ -201,10 +241,10 @@ class Market:
         logger = logging.getLogger(__name__)
         
         # Debug log for negRisk markets
-        if data.get('neg_risk'):
-            logger.debug(f"Processing negRisk market: {data.get('market_slug')}")
-            logger.debug(f"neg_risk_market_id: {data.get('neg_risk_market_id')}")
-            logger.debug(f"tokens: {data.get('tokens', [])}")
+        if data.get('neg_risk') and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Processing negRisk market: %s", data.get('market_slug'))
+            logger.debug("neg_risk_market_id: %s", data.get('neg_risk_market_id'))
+            logger.debug("tokens: %s", data.get('tokens', []))
         
         # Extract token IDs and outcomes from tokens array
         token_ids = []
@@ -244,7 +284,7 @@ class Market:
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Event:
     """Represents a Polymarket event containing multiple markets."""
     id: str
@@ -309,7 +349,7 @@ class Event:
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MarketHistoricalData:
     """Complete historical data for a market including all outcomes."""
     market: Market
@@ -356,7 +396,7 @@ class MarketHistoricalData:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class EventHistoricalData:
     """Complete historical data for all markets in an event."""
     event: Event
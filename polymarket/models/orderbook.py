@@ -10,8 +10,10 @@ from typing import List, Dict, Any, Optional, Tuple
 from decimal import Decimal
 from datetime import datetime
 
+from .models import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class OrderLevel:
     """Represents a single price level in the order book."""
     price: Decimal
@@ -31,7 +33,7 @@ class OrderLevel:
         return self.price * self.size
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class OrderBook:
     """Complete order book for a market outcome."""
     market_id: str
@@ -170,7 +172,7 @@ class OrderBook:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MarketOrderBooks:
     """Order books for all outcomes in a market."""
     market_id: str
@@ -2,16 +2,45 @@
 Polymarket utility functions and processors.
 """
 
-from .utils import get_column_prefix, format_price, format_volume
+import importlib
+from typing import Any
+
+from .utils import (
+    get_column_prefix, date_to_timestamp, estimate_price_points,
+    available_memory, exceeds_memory_budget, loads_json, format_price, format_volume
+)
 from .parser import PolymarketURLParser
-from .processor import DataProcessor
 from .config import *
 from .constants import *
 
-__all__ = [
+# The processor pulls in pandas; defer it until first use
+_LAZY_IMPORTS = {
+    "DataProcessor": ".processor",
+    "EventCSVWriter": ".processor",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a lazily exported name on first access."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+# DataProcessor and EventCSVWriter are served by __getattr__ above
+__all__ = [  # noqa: F405
     "get_column_prefix",
+    "date_to_timestamp",
+    "estimate_price_points",
+    "available_memory",
+    "exceeds_memory_budget",
+    "loads_json",
     "format_price",
     "format_volume",
     "PolymarketURLParser",
     "DataProcessor",
+    "EventCSVWriter",
 ]
\ No newline at end of file
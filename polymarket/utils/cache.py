@@ -0,0 +1,152 @@
+"""
+On-disk cache for Polymarket API metadata.
+
+This module stores raw API payloads (events, markets) as JSON files so that
+repeated CLI invocations can skip metadata round trips. Entries expire based
+on the file's modification time; an expired entry that was stored with an
+ETag can still be revalidated with a conditional GET.
+"""
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Optional, Tuple, Union
+from urllib.parse import quote
+
+from .config import CACHE_DIR, CACHE_TTL_SECONDS, ENABLE_CACHE
+
+
+logger = logging.getLogger(__name__)
+
+
+class MetadataCache:
+    """File-based JSON cache keyed by namespace and slug."""
+
+    def __init__(self,
+                 cache_dir: Union[str, Path] = CACHE_DIR,
+                 ttl: int = CACHE_TTL_SECONDS,
+                 enabled: bool = ENABLE_CACHE):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Root directory for cache files
+            ttl: Time-to-live for entries in seconds
+            enabled: Whether reads and writes are performed at all
+        """
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.ttl = ttl
+        self.enabled = enabled
+
+    def _path(self, namespace: str, key: str) -> Path:
+        """Build the file path for a cache entry."""
+        return self.cache_dir / namespace / f"{quote(key, safe='')}.json"
+
+    def _etag_path(self, namespace: str, key: str) -> Path:
+        """Build the file path for an entry's ETag."""
+        return self._path(namespace, key).with_suffix('.etag')
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """
+        Read a cached payload if present and not expired.
+
+        Args:
+            namespace: Entry category (e.g. 'events', 'markets')
+            key: Entry identifier, usually a slug
+
+        Returns:
+            Cached payload or None on miss
+        """
+        if not self.enabled:
+            return None
+
+        path = self._path(namespace, key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                return None
+            with open(path, encoding='utf-8') as f:
+                payload = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug("Ignoring unreadable cache entry %s: %s", path, e)
+            return None
+
+        logger.debug("Cache hit: %s/%s", namespace, key)
+        return payload
+
+    def get_stale(self, namespace: str, key: str) -> Optional[Tuple[Any, str]]:
+        """
+        Read an entry and its ETag regardless of age, for revalidation.
+
+        Args:
+            namespace: Entry category (e.g. 'events', 'markets')
+            key: Entry identifier, usually a slug
+
+        Returns:
+            (payload, etag) tuple, or None if there is no entry with an ETag
+        """
+        if not self.enabled:
+            return None
+
+        path = self._path(namespace, key)
+        try:
+            etag = self._etag_path(namespace, key).read_text(encoding='utf-8')
+            with open(path, encoding='utf-8') as f:
+                payload = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug("Ignoring unreadable cache entry %s: %s", path, e)
+            return None
+
+        return payload, etag
+
+    def touch(self, namespace: str, key: str) -> None:
+        """
+        Mark an entry as fresh again after the server confirmed it unchanged.
+
+        Args:
+            namespace: Entry category (e.g. 'events', 'markets')
+            key: Entry identifier, usually a slug
+        """
+        if not self.enabled:
+            return
+
+        try:
+            self._path(namespace, key).touch()
+        except OSError as e:
+            logger.debug("Failed to refresh cache entry %s/%s: %s", namespace, key, e)
+
+    def set(self, namespace: str, key: str, payload: Any,
+            etag: Optional[str] = None) -> None:
+        """
+        Store a payload in the cache.
+
+        Args:
+            namespace: Entry category (e.g. 'events', 'markets')
+            key: Entry identifier, usually a slug
+            payload: JSON-serializable data
+            etag: Response ETag, kept so the entry can be revalidated once it
+                expires
+        """
+        if not self.enabled:
+            return
+
+        path = self._path(namespace, key)
+        etag_path = self._etag_path(namespace, key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Per-process temp name: concurrent writers never share a file
+            tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f)
+            os.replace(tmp_path, path)
+            if etag:
+                etag_path.write_text(etag, encoding='utf-8')
+            elif etag_path.exists():
+                etag_path.unlink()
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug("Failed to write cache entry %s: %s", path, e)
@@ -19,6 +19,10 @@ DEFAULT_TIMEOUT = float(os.getenv("POLYMARKET_TIMEOUT", "30.0"))
 MAX_RETRIES = int(os.getenv("POLYMARKET_MAX_RETRIES", "3"))
 RETRY_DELAY = float(os.getenv("POLYMARKET_RETRY_DELAY", "1.0"))
 USER_AGENT = os.getenv("POLYMARKET_USER_AGENT", "PolymarketDataExtractor/1.0")
+HTTP_MAX_CONNECTIONS = int(os.getenv("POLYMARKET_HTTP_MAX_CONNECTIONS", "64"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("POLYMARKET_HTTP_KEEPALIVE", "75.0"))
+# HTTP/2 is used when h2 is installed (the 'http2' extra) unless disabled here
+HTTP2_ENABLED = os.getenv("POLYMARKET_HTTP2", "true").lower() == "true"
 
 # API Keys
 DEFAULT_API_KEY: Optional[str] = os.getenv("POLYMARKET_API_KEY")
@@ -48,9 +52,13 @@ MAX_CSV_SIZE_MB = int(os.getenv("POLYMARKET_MAX_CSV_MB", "100"))
 # Rate Limiting
 RATE_LIMIT_CALLS_PER_MINUTE = int(os.getenv("POLYMARKET_RATE_LIMIT", "60"))
 
+# Concurrency Settings
+MAX_CONCURRENT_REQUESTS = int(os.getenv("POLYMARKET_MAX_CONCURRENCY", "8"))
+
 # Cache Settings
 ENABLE_CACHE = os.getenv("POLYMARKET_ENABLE_CACHE", "false").lower() == "true"
 CACHE_TTL_SECONDS = int(os.getenv("POLYMARKET_CACHE_TTL", "300"))
+CACHE_DIR = os.getenv("POLYMARKET_CACHE_DIR", os.path.join("~", ".cache", "mango"))
 
 # Validation Settings
 MIN_PRICE = 0.0
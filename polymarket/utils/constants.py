@@ -12,7 +12,14 @@ RETRY_BACKOFF_FACTOR = 2  # exponential backoff multiplier
 
 # Rate limiting
 RATE_LIMIT_DELAY = 0.1  # 100ms between requests
-RATE_LIMIT_CHUNK_DELAY = 0.5  # 500ms between market extractions
+RATE_LIMIT_LOW_WATERMARK = 5  # remaining calls before pacing kicks in
+RATE_LIMIT_REMAINING_HEADER = "X-RateLimit-Remaining"
+RATE_LIMIT_RESET_HEADER = "X-RateLimit-Reset"
+RATE_LIMIT_RETRY_AFTER_HEADER = "Retry-After"
+
+# Time conversion
+SECONDS_PER_DAY = 24 * 60 * 60
+MINUTES_PER_DAY = 24 * 60
 
 # Data extraction limits
 MAX_COLUMN_PREFIX_LENGTH = 20
@@ -20,8 +27,19 @@ MAX_MARKET_QUESTION_DISPLAY = 50
 DEFAULT_FLOAT_PRECISION = 4
 
 # Memory optimization thresholds
-AUTO_STREAMING_THRESHOLD = 10  # markets
+AUTO_STREAMING_THRESHOLD = 500_000  # projected price points
+BYTES_PER_PRICE_POINT = 160  # approximate in-memory size of one fetched PricePoint
+MEMORY_BUDGET_FRACTION = 0.5  # share of available memory an in-memory extraction may use
+POINTS_PER_DAY = {  # price points per day returned for each interval
+    "1m": 1440,
+    "1h": 24,
+    "6h": 4,
+    "1d": 1,
+    "1w": 1 / 7,
+}
 GARBAGE_COLLECTION_INTERVAL = 5  # markets
+CSV_WRITER_QUEUE_SIZE = 4  # markets awaiting spill before add_market blocks
+CSV_WRITE_BUFFER_SIZE = 1 << 20  # bytes of merged rows buffered per file write
 
 # Progress display
 PROGRESS_UPDATE_INTERVAL = 10  # seconds
@@ -26,6 +26,11 @@ class AuthenticationError(APIError):
     pass
 
 
+class IntervalTooLongError(APIError):
+    """Raised when a price history request spans more time than the API allows."""
+    pass
+
+
 class MarketNotFoundError(PolymarketError):
     """Raised when a requested market cannot be found."""
     def __init__(self, slug: str):
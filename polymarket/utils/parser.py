@@ -6,8 +6,9 @@ identifiers for API queries.
 """
 
 import re
+from functools import lru_cache
 from urllib.parse import urlparse, unquote
-from typing import Optional, Dict, Union
+from typing import Optional, Dict, Tuple, Union
 
 from .exceptions import InvalidURLError
 
@@ -22,6 +23,9 @@ class PolymarketURLParser:
     MARKET_DIRECT_PATTERN = re.compile(r'/market/([^/?]+)')
     DIRECT_SLUG_PATTERN = re.compile(r'^/?([^/?]+)$')  # Direct market URLs like /will-jd-vance-win...
     
+    # Site pages that match DIRECT_SLUG_PATTERN but are not markets
+    NON_MARKET_PATHS = frozenset({'markets', 'elections', 'leaderboard', 'about', 'docs', 'help'})
+    
     def parse(self, url: str) -> Dict[str, Union[str, None]]:
         """
         Parse a Polymarket URL and extract relevant identifiers.
@@ -40,9 +44,33 @@ class PolymarketURLParser:
         Raises:
             InvalidURLError: If the URL is not a valid Polymarket URL
         """
+        url_type, event_slug, market_slug, path = self._parse_cached(url)
+        return {
+            'url': url,
+            'type': url_type,
+            'event_slug': event_slug,
+            'market_slug': market_slug,
+            'path': path
+        }
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parse_cached(url: str) -> Tuple[Optional[str], Optional[str], Optional[str], str]:
+        """
+        Parse a URL into (type, event_slug, market_slug, path).
+        
+        Results are cached so the CLI's repeated parse/is_*/slug calls on
+        the same URL only run the regexes once. Invalid URLs raise and
+        are not cached.
+        """
         if not url:
             raise InvalidURLError("URL cannot be empty")
-            
+        
+        # A Polymarket netloc implies the substring, so foreign URLs are
+        # rejected here without paying for urlparse
+        if 'polymarket.com' not in url:
+            raise InvalidURLError(url)
+        
         # Parse the URL
         parsed = urlparse(url)
         
@@ -53,42 +81,26 @@ class PolymarketURLParser:
         # Clean up the path
         path = parsed.path.strip('/')
         
-        # Initialize result
-        result = {
-            'url': url,
-            'type': None,
-            'event_slug': None,
-            'market_slug': None,
-            'path': path
-        }
-        
         # Try to match event/market pattern
-        event_match = self.EVENT_MARKET_PATTERN.search(parsed.path)
+        event_match = PolymarketURLParser.EVENT_MARKET_PATTERN.search(parsed.path)
         if event_match:
-            result['event_slug'] = unquote(event_match.group(1))
+            event_slug = unquote(event_match.group(1))
             if event_match.group(2):
-                result['type'] = 'market'
-                result['market_slug'] = unquote(event_match.group(2))
-            else:
-                result['type'] = 'event'
-            return result
+                return 'market', event_slug, unquote(event_match.group(2)), path
+            return 'event', event_slug, None, path
             
         # Try to match direct market pattern
-        market_match = self.MARKET_DIRECT_PATTERN.search(parsed.path)
+        market_match = PolymarketURLParser.MARKET_DIRECT_PATTERN.search(parsed.path)
         if market_match:
-            result['type'] = 'market'
-            result['market_slug'] = unquote(market_match.group(1))
-            return result
+            return 'market', None, unquote(market_match.group(1)), path
             
         # Try to match direct slug pattern (e.g., /will-jd-vance-win-the-2028-us-presidential-election)
-        direct_match = self.DIRECT_SLUG_PATTERN.match(parsed.path)
+        direct_match = PolymarketURLParser.DIRECT_SLUG_PATTERN.match(parsed.path)
         if direct_match:
             slug = unquote(direct_match.group(1))
             # Exclude common non-market paths
-            if slug not in ['markets', 'elections', 'leaderboard', 'about', 'docs', 'help']:
-                result['type'] = 'market'
-                result['market_slug'] = slug
-                return result
+            if slug not in PolymarketURLParser.NON_MARKET_PATHS:
+                return 'market', None, slug, path
             
         # If no patterns match, it's an invalid URL
         raise InvalidURLError(f"Cannot parse Polymarket URL: {url}")
@@ -109,8 +121,8 @@ class PolymarketURLParser:
         Raises:
             InvalidURLError: If the URL is invalid
         """
-        parsed = self.parse(url)
-        return parsed.get('market_slug') or parsed.get('event_slug')
+        _, event_slug, market_slug, _ = self._parse_cached(url)
+        return market_slug or event_slug
     
     def get_api_slug(self, url: str) -> Optional[str]:
         """
@@ -125,27 +137,26 @@ class PolymarketURLParser:
         Raises:
             InvalidURLError: If the URL is invalid
         """
-        parsed = self.parse(url)
+        url_type, event_slug, market_slug, _ = self._parse_cached(url)
         
-        if parsed['type'] == 'market':
-            return parsed['market_slug']
-        elif parsed['type'] == 'event':
-            return parsed['event_slug']
+        if url_type == 'market':
+            return market_slug
+        elif url_type == 'event':
+            return event_slug
         return None
     
     def is_event_url(self, url: str) -> bool:
         """Check if the URL is an event URL."""
         try:
-            parsed = self.parse(url)
-            return parsed['type'] == 'event' and not parsed['market_slug']
+            url_type, _, market_slug, _ = self._parse_cached(url)
+            return url_type == 'event' and not market_slug
         except InvalidURLError:
             return False
     
     def is_market_url(self, url: str) -> bool:
         """Check if the URL is a market URL."""
         try:
-            parsed = self.parse(url)
-            return parsed['type'] == 'market'
+            return self._parse_cached(url)[0] == 'market'
         except InvalidURLError:
             return False
     
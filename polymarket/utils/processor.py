@@ -6,13 +6,19 @@ and CSV export functionality for market historical data. Includes both
 DataFrame-based processing and memory-efficient streaming for large datasets.
 """
 
+import numpy as np
 import pandas as pd
 import csv
 import io
 import logging
-import gc
+import heapq
+import queue
+import tempfile
+import threading
+from itertools import groupby
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union, Iterator, Tuple
+from typing import Dict, List, Any, Optional, Union, Iterator, Tuple, TextIO
 from datetime import datetime
 from collections import defaultdict
 from tabulate import tabulate
@@ -21,6 +27,7 @@ from ..models import MarketHistoricalData, PriceHistory, EventHistoricalData
 from .config import (
     MAX_CSV_SIZE_MB, PRICE_PRECISION
 )
+from .constants import CSV_WRITER_QUEUE_SIZE, CSV_WRITE_BUFFER_SIZE
 from .exceptions import ExportError, DataProcessingError
 from .utils import get_column_prefix
 
@@ -31,6 +38,37 @@ logger = logging.getLogger(__name__)
 class DataProcessor:
     """Processes and formats Polymarket historical data for CSV export."""
     
+    @staticmethod
+    def history_to_frame(history: PriceHistory, column: str) -> pd.DataFrame:
+        """
+        Convert a price history to a single-column DataFrame indexed by timestamp.
+        
+        Timestamps and prices are extracted as two columns and handed to
+        pandas as arrays, rather than building one dict per point.
+        
+        Args:
+            history: PriceHistory object
+            column: Name of the price column
+            
+        Returns:
+            DataFrame with a 'timestamp' index and one price column
+        """
+        index = pd.DatetimeIndex(history.timestamps, name='timestamp')
+        return pd.DataFrame({column: history.prices}, index=index)
+    
+    @staticmethod
+    def _outer_align(frames: List[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Outer-join timestamp-indexed frames side by side, in column order.
+        
+        A single concat aligns every frame against the sorted union of
+        timestamps at once, instead of re-joining the growing result frame
+        by frame.
+        """
+        if len(frames) == 1:
+            return frames[0]
+        return pd.concat(frames, axis=1, sort=True)
+    
     @staticmethod
     def merge_price_histories(histories: Dict[str, PriceHistory]) -> pd.DataFrame:
         """
@@ -50,26 +88,17 @@ class DataProcessor:
             
         try:
             # Create individual DataFrames for each outcome
-            dfs = []
-            for outcome, history in histories.items():
-                if history.price_points:
-                    df = pd.DataFrame([
-                        {
-                            'timestamp': point.timestamp,
-                            f'{outcome}_price': point.price
-                        }
-                        for point in history.price_points
-                    ])
-                    df.set_index('timestamp', inplace=True)
-                    dfs.append(df)
+            dfs = [
+                DataProcessor.history_to_frame(history, f'{outcome}_price')
+                for outcome, history in histories.items()
+                if history.price_points
+            ]
             
             if not dfs:
                 return pd.DataFrame()
                 
-            # Merge all DataFrames on timestamp
-            result = dfs[0]
-            for df in dfs[1:]:
-                result = result.join(df, how='outer')
+            # Align all outcomes on the union of their timestamps in one pass
+            result = DataProcessor._outer_align(dfs)
                 
             # Forward fill missing values
             result.ffill(inplace=True)
@@ -107,23 +136,15 @@ class DataProcessor:
                 # Create DataFrame for this market
                 for outcome, history in market_data.price_histories.items():
                     if history.price_points:
-                        df = pd.DataFrame([
-                            {
-                                'timestamp': point.timestamp,
-                                f'{prefix}_{outcome.lower()}': point.price
-                            }
-                            for point in history.price_points
-                        ])
-                        df.set_index('timestamp', inplace=True)
-                        all_dfs.append(df)
+                        all_dfs.append(
+                            DataProcessor.history_to_frame(history, f'{prefix}_{outcome.lower()}')
+                        )
             
             if not all_dfs:
                 return pd.DataFrame()
             
             # Merge all DataFrames
-            result = all_dfs[0]
-            for df in all_dfs[1:]:
-                result = result.join(df, how='outer')
+            result = DataProcessor._outer_align(all_dfs)
             
             # Forward fill missing values
             result.ffill(inplace=True)
@@ -135,7 +156,14 @@ class DataProcessor:
             raise DataProcessingError(f"Failed to merge event price histories: {e}")
     
     @staticmethod
-    def calculate_statistics(history: PriceHistory) -> Dict[str, float]:
+    def _sample_std(values: np.ndarray) -> float:
+        """Sample standard deviation (ddof=1), NaN for fewer than two values."""
+        if len(values) < 2:
+            return float('nan')
+        return float(values.std(ddof=1))
+    
+    @staticmethod
+    def calculate_statistics(history: PriceHistory) -> Dict[str, Optional[float]]:
         """
         Calculate statistical metrics for a price history.
         
@@ -143,33 +171,35 @@ class DataProcessor:
             history: PriceHistory object
             
         Returns:
-            Dictionary with statistical metrics
+            Dictionary with statistical metrics; 'change' and 'change_percent'
+            are None when the history has fewer than two points to compare
         """
         if not history.price_points:
             return {
                 'count': 0,
-                'mean': 0,
-                'std': 0,
-                'min': 0,
-                'max': 0,
-                'median': 0,
-                'volatility': 0
+                'mean': 0.0,
+                'std': 0.0,
+                'min': 0.0,
+                'max': 0.0,
+                'median': 0.0,
+                'volatility': 0.0
             }
         
-        prices = [p.price for p in history.price_points]
-        df = pd.DataFrame(prices, columns=['price'])
+        prices = history.prices
         
         # Calculate returns for volatility
-        returns = df['price'].pct_change().dropna()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            returns = np.diff(prices) / prices[:-1]
+        returns = returns[~np.isnan(returns)]
         
         return {
             'count': len(prices),
-            'mean': round(df['price'].mean(), PRICE_PRECISION),
-            'std': round(df['price'].std(), PRICE_PRECISION),
-            'min': round(df['price'].min(), PRICE_PRECISION),
-            'max': round(df['price'].max(), PRICE_PRECISION),
-            'median': round(df['price'].median(), PRICE_PRECISION),
-            'volatility': round(returns.std(), PRICE_PRECISION) if len(returns) > 0 else 0,
+            'mean': round(float(prices.mean()), PRICE_PRECISION),
+            'std': round(DataProcessor._sample_std(prices), PRICE_PRECISION),
+            'min': round(float(prices.min()), PRICE_PRECISION),
+            'max': round(float(prices.max()), PRICE_PRECISION),
+            'median': round(float(np.median(prices)), PRICE_PRECISION),
+            'volatility': round(DataProcessor._sample_std(returns), PRICE_PRECISION) if len(returns) > 0 else 0.0,
             'latest': history.latest_price,
             'oldest': history.oldest_price,
             'change': history.price_change,
@@ -257,9 +287,29 @@ class DataProcessor:
         Raises:
             ExportError: If CSV generation fails
         """
-        try:
-            output = io.StringIO()
+        output = io.StringIO()
+        DataProcessor.write_csv(data, output, include_metadata=include_metadata)
+        return output.getvalue()
+    
+    @staticmethod
+    def write_csv(data: MarketHistoricalData,
+                  output: TextIO,
+                  include_metadata: bool = True) -> None:
+        """
+        Write market historical data as CSV to an open text stream.
+        
+        Rows go straight to the stream (e.g. sys.stdout or an open file), so
+        the full CSV is never materialized as a single string.
+        
+        Args:
+            data: MarketHistoricalData object
+            output: Writable text stream
+            include_metadata: Whether to include market metadata
             
+        Raises:
+            ExportError: If CSV generation fails
+        """
+        try:
             # Write metadata if requested
             if include_metadata:
                 writer = csv.writer(output)
@@ -285,8 +335,6 @@ class DataProcessor:
                 
                 df.to_csv(output, index=False)
             
-            return output.getvalue()
-            
         except Exception as e:
             raise ExportError(f"Failed to generate CSV: {e}")
     
@@ -306,9 +354,10 @@ class DataProcessor:
             filepath = Path(filepath)
             filepath.parent.mkdir(parents=True, exist_ok=True)
             
-            csv_data = DataProcessor.to_csv(data, include_metadata=include_metadata)
-            filepath.write_text(csv_data)
-                
+            # Stream rows into the file rather than building the CSV string first
+            with open(filepath, 'w', newline='') as f:
+                DataProcessor.write_csv(data, f, include_metadata=include_metadata)
+
             logger.info(f"Saved CSV to: {filepath}")
             
         except Exception as e:
@@ -316,20 +365,22 @@ class DataProcessor:
     
     @staticmethod
     def save_event_to_file(data: EventHistoricalData,
-                          filepath: Union[str, Path]) -> None:
+                          filepath: Union[str, Path],
+                          chunksize: Optional[int] = None) -> None:
         """
         Save event historical data to a CSV file.
         
         Args:
             data: EventHistoricalData object
             filepath: Output file path
+            chunksize: Maximum rows buffered per file write (see EventCSVWriter)
         """
         try:
             filepath = Path(filepath)
             filepath.parent.mkdir(parents=True, exist_ok=True)
             
             # Use streaming for better memory efficiency
-            DataProcessor.stream_event_to_csv(data, filepath)
+            DataProcessor.stream_event_to_csv(data, filepath, chunksize)
                 
             logger.info(f"Saved event data ({data.total_markets} markets) to: {filepath}")
             
@@ -338,89 +389,29 @@ class DataProcessor:
     
     @staticmethod
     def stream_event_to_csv(event_data: EventHistoricalData,
-                           filepath: Union[str, Path]) -> None:
+                           filepath: Union[str, Path],
+                           chunksize: Optional[int] = None) -> None:
         """
         Stream event data directly to CSV without loading all data into memory.
         
-        This method processes one timestamp at a time across all markets,
-        dramatically reducing memory usage for large events.
+        Each market's series are spilled to temporary files and merged one
+        timestamp at a time, dramatically reducing memory usage for large
+        events. See EventCSVWriter.
         
         Args:
             event_data: EventHistoricalData containing all market data
             filepath: Output CSV file path
+            chunksize: Maximum rows buffered per file write (see EventCSVWriter)
             
         Raises:
             ExportError: If streaming fails
         """
         try:
-            filepath = Path(filepath)
-            filepath.parent.mkdir(parents=True, exist_ok=True)
-            
             logger.info(f"Starting streaming CSV export for {event_data.total_markets} markets")
             
-            # Step 1: Collect all unique timestamps across all markets
-            logger.debug("Collecting timestamps...")
-            timestamp_data = defaultdict(dict)  # timestamp -> {column: price}
-            
-            # Process each market
-            for market_slug, market_data in event_data.market_data.items():
-                market = market_data.market
-                
-                # Determine column prefix using utility function
-                prefix = get_column_prefix(market, market_slug)
-                
-                # Process each outcome's price history
-                for outcome, history in market_data.price_histories.items():
-                    column_name = f'{prefix}_{outcome.lower()}'
-                    
-                    # Add each price point to our timestamp map
-                    for point in history.price_points:
-                        timestamp_data[point.timestamp][column_name] = point.price
-            
-            # Step 2: Get sorted timestamps and column names
-            timestamps = sorted(timestamp_data.keys())
-            all_columns = set()
-            for ts_data in timestamp_data.values():
-                all_columns.update(ts_data.keys())
-            columns = sorted(all_columns)
-            
-            logger.info(f"Writing {len(timestamps)} timestamps with {len(columns)} columns")
-            
-            # Step 3: Write CSV file row by row
-            with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-                # Write header
-                writer = csv.writer(csvfile)
-                writer.writerow(['timestamp'] + columns)
-                
-                # Write data rows
-                prev_row = {}  # For forward-filling
-                for timestamp in timestamps:
-                    row_data = timestamp_data[timestamp]
-                    
-                    # Forward-fill missing values
-                    for col in columns:
-                        if col in row_data:
-                            prev_row[col] = row_data[col]
-                        else:
-                            row_data[col] = prev_row.get(col, '')
-                    
-                    # Write row
-                    row = [timestamp.isoformat()]
-                    for col in columns:
-                        value = row_data.get(col, '')
-                        if isinstance(value, float):
-                            value = round(value, PRICE_PRECISION)
-                        row.append(value)
-                    writer.writerow(row)
-                    
-                    # Clear row data to free memory
-                    del row_data
-                    
-            # Clear the timestamp data
-            del timestamp_data
-            gc.collect()
-            
-            logger.info(f"Successfully streamed {len(timestamps)} rows to {filepath}")
+            with EventCSVWriter(filepath, chunksize) as writer:
+                for market_slug, market_data in event_data.market_data.items():
+                    writer.add_market(market_data, market_slug)
             
         except Exception as e:
             raise ExportError(f"Failed to stream event data to CSV: {e}")
@@ -465,4 +456,226 @@ class DataProcessor:
             # Update previous values
             prev_values.update(current_row)
             
-            yield timestamp, current_row
\ No newline at end of file
+            yield timestamp, current_row
+
+
+class EventCSVWriter:
+    """
+    Incremental writer for wide-format event CSV files.
+    
+    Markets are added one at a time, as soon as their data is available.
+    A single background thread spills each outcome's price series to a
+    temporary file sorted by timestamp, so serialization overlaps with
+    network fetches while file writes stay on one thread. The hand-off
+    queue is bounded, so only a few markets' histories are held in memory.
+    Closing the writer k-way merges the spilled series into the final CSV,
+    one timestamp row at a time, forward-filling missing values.
+    
+    Usage:
+        with EventCSVWriter(filepath) as writer:
+            for market_data in markets:
+                writer.add_market(market_data)
+    """
+    
+    def __init__(self, filepath: Union[str, Path], chunksize: Optional[int] = None):
+        """
+        Initialize the writer.
+        
+        Args:
+            filepath: Output CSV file path
+            chunksize: Maximum merged rows buffered per file write; rows are
+                otherwise flushed every CSV_WRITE_BUFFER_SIZE bytes
+        """
+        self.filepath = Path(filepath)
+        self.chunksize = chunksize
+        self.markets_written = 0
+        self.rows_written = 0
+        self._tmpdir = tempfile.TemporaryDirectory(prefix='mango-')
+        self._spill_files: Dict[str, List[Path]] = {}
+        self._spill_count = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=CSV_WRITER_QUEUE_SIZE)
+        self._worker: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+    
+    @property
+    def has_data(self) -> bool:
+        """Check if any market with price data has been added."""
+        self.flush()
+        return self.markets_written > 0
+    
+    def add_market(self, market_data: MarketHistoricalData,
+                   market_slug: Optional[str] = None) -> None:
+        """
+        Queue one market's price histories for spilling to temporary storage.
+        
+        Blocks only when the background writer falls behind by more than
+        CSV_WRITER_QUEUE_SIZE markets.
+        
+        Args:
+            market_data: MarketHistoricalData for a single market
+            market_slug: Slug used for column naming (defaults to the market's slug)
+            
+        Raises:
+            ExportError: If spilling a previously queued market failed
+        """
+        self._raise_worker_error()
+        if self._worker is None:
+            self._worker = threading.Thread(
+                target=self._run, name='EventCSVWriter', daemon=True
+            )
+            self._worker.start()
+        self._queue.put((market_data, market_slug))
+    
+    def flush(self) -> None:
+        """
+        Block until every queued market has been spilled.
+        
+        Raises:
+            ExportError: If spilling a queued market failed
+        """
+        if self._worker is not None:
+            self._queue.join()
+        self._raise_worker_error()
+    
+    def _run(self) -> None:
+        """Background loop spilling queued markets until the stop sentinel."""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                # After a failure, keep draining so producers never block
+                if self._error is None:
+                    self._spill_market(*item)
+            except Exception as e:
+                self._error = e
+            finally:
+                self._queue.task_done()
+    
+    def _stop_worker(self) -> None:
+        """Signal the background thread to finish and wait for it."""
+        if self._worker is not None:
+            self._queue.put(None)
+            self._worker.join()
+            self._worker = None
+    
+    def _raise_worker_error(self) -> None:
+        """Re-raise a failure from the background thread on the caller's thread."""
+        if self._error is not None:
+            raise ExportError(f"Failed to spill market data: {self._error}") from self._error
+    
+    def _spill_market(self, market_data: MarketHistoricalData,
+                      market_slug: Optional[str]) -> None:
+        """Write one market's sorted price series to spill files."""
+        market_slug = market_slug or market_data.market.slug
+        prefix = get_column_prefix(market_data.market, market_slug)
+        added = False
+        
+        for outcome, history in market_data.price_histories.items():
+            if not history.price_points:
+                continue
+            
+            column_name = f'{prefix}_{outcome.lower()}'
+            spill_path = Path(self._tmpdir.name) / f'{self._spill_count}.csv'
+            self._spill_count += 1
+            
+            points = sorted(history.price_points, key=attrgetter('timestamp'))
+            with open(spill_path, 'w', buffering=CSV_WRITE_BUFFER_SIZE,
+                      newline='', encoding='utf-8') as f:
+                csv.writer(f).writerows(
+                    (point.timestamp.isoformat(), repr(point.price)) for point in points
+                )
+            
+            self._spill_files.setdefault(column_name, []).append(spill_path)
+            added = True
+        
+        if added:
+            self.markets_written += 1
+    
+    def close(self) -> None:
+        """Merge all spilled series into the output CSV and clean up."""
+        try:
+            self._stop_worker()
+            self._raise_worker_error()
+            self._write_merged()
+        finally:
+            self._tmpdir.cleanup()
+    
+    def discard(self) -> None:
+        """Remove spilled data without writing the output file."""
+        self._stop_worker()
+        self._tmpdir.cleanup()
+    
+    def __enter__(self) -> 'EventCSVWriter':
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+    
+    @staticmethod
+    def _read_spill(handle, position: int) -> Iterator[Tuple[str, int, str]]:
+        """Yield (timestamp, column position, price) records from a spill file."""
+        for timestamp, price in csv.reader(handle):
+            yield timestamp, position, price
+    
+    def _write_merged(self) -> None:
+        """K-way merge the spilled series into wide CSV rows."""
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        columns = sorted(self._spill_files)
+        
+        # Spill files are merged in insertion order so that, as with a dict
+        # update, later markets win when two series share a column name
+        spills = [
+            (column, path)
+            for column in columns
+            for path in self._spill_files[column]
+        ]
+        spills.sort(key=lambda item: int(item[1].stem))
+        
+        handles = []
+        try:
+            positions = {column: i for i, column in enumerate(columns)}
+            streams = []
+            for column, path in spills:
+                handle = open(path, newline='', encoding='utf-8')
+                handles.append(handle)
+                streams.append(self._read_spill(handle, positions[column]))
+            
+            logger.info(f"Merging {len(spills)} series into {len(columns)} columns")
+            
+            # Header cells may need quoting, so they go through the csv module
+            header = io.StringIO()
+            csv.writer(header).writerow(['timestamp'] + columns)
+            buffer = bytearray(header.getvalue().encode('utf-8'))
+            
+            # Cells hold the formatted last-seen price of each column and are
+            # only re-rounded when that column's price changes
+            cells = [''] * len(columns)
+            pending_rows = 0
+            merged = heapq.merge(
+                *streams, key=lambda item: datetime.fromisoformat(item[0])
+            )
+            with open(self.filepath, 'wb', buffering=0) as csvfile:
+                for timestamp, group in groupby(merged, key=itemgetter(0)):
+                    for _, position, price in group:
+                        cells[position] = repr(round(float(price), PRICE_PRECISION))
+                    
+                    buffer += ','.join([timestamp, *cells]).encode('utf-8')
+                    buffer += b'\r\n'
+                    self.rows_written += 1
+                    pending_rows += 1
+                    
+                    if len(buffer) >= CSV_WRITE_BUFFER_SIZE or pending_rows == self.chunksize:
+                        csvfile.write(buffer)
+                        buffer.clear()
+                        pending_rows = 0
+                
+                csvfile.write(buffer)
+        finally:
+            for handle in handles:
+                handle.close()
+        
+        logger.info(f"Successfully streamed {self.rows_written} rows to {self.filepath}")
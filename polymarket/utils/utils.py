@@ -4,8 +4,29 @@ Utility functions for Polymarket data extraction.
 This module contains shared utility functions used across the codebase.
 """
 
-from typing import Optional
+import json
+import os
+import re
+import time
+from datetime import date, datetime
+from functools import lru_cache
+from types import ModuleType
+from typing import Any, Iterable, Optional, Union
 from ..models import Market
+from .constants import (
+    MINUTES_PER_DAY, POINTS_PER_DAY, SECONDS_PER_DAY,
+    BYTES_PER_PRICE_POINT, MEMORY_BUDGET_FRACTION
+)
+
+# date.fromisoformat also accepts compact and week dates (20240101,
+# 2024-W01-1), so the documented YYYY-MM-DD form is checked first
+DATE_PATTERN = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}')
+
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # optional speedup, see the 'fast' extra
+    orjson = None
 
 
 def get_column_prefix(market: Market, market_slug: str, max_length: int = 20) -> str:
@@ -23,9 +44,15 @@ def get_column_prefix(market: Market, market_slug: str, max_length: int = 20) ->
     Returns:
         Column prefix string
     """
+    return _column_prefix(market_slug, market.group_item_title, max_length)
+
+
+@lru_cache(maxsize=512)
+def _column_prefix(market_slug: str, group_item_title: Optional[str], max_length: int) -> str:
+    """Derive a column prefix from primitive (hashable) market fields."""
     # Use group item title if available (e.g., team names in sports markets)
-    if market.group_item_title:
-        return market.group_item_title.lower().replace(' ', '_')
+    if group_item_title:
+        return group_item_title.lower().replace(' ', '_')
     
     # Try to extract meaningful prefix from slug
     parts = market_slug.split('-')
@@ -40,6 +67,124 @@ def get_column_prefix(market: Market, market_slug: str, max_length: int = 20) ->
     return market_slug[:max_length]
 
 
+def loads_json(content: Union[bytes, str]) -> Any:
+    """
+    Decode a JSON document, using orjson when it is installed.
+    
+    Args:
+        content: Raw JSON bytes or text (e.g. httpx Response.content)
+        
+    Returns:
+        Decoded JSON value
+        
+    Raises:
+        ValueError: If the content is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def date_to_timestamp(date_str: str) -> int:
+    """
+    Convert a YYYY-MM-DD date string to a Unix timestamp at local midnight.
+    
+    Uses the C-level ISO parser rather than strptime's regex/locale path.
+    
+    Args:
+        date_str: Date in YYYY-MM-DD format
+        
+    Returns:
+        Unix timestamp in seconds
+        
+    Raises:
+        ValueError: If the date string is invalid
+    """
+    if not DATE_PATTERN.fullmatch(date_str):
+        raise ValueError(f"Invalid date {date_str!r}, expected YYYY-MM-DD")
+    return int(datetime.combine(date.fromisoformat(date_str), datetime.min.time()).timestamp())
+
+
+def estimate_price_points(markets: Iterable[Market],
+                          interval: str,
+                          days_back: float,
+                          start_date: Optional[str] = None,
+                          end_date: Optional[str] = None,
+                          fidelity: Optional[int] = None) -> int:
+    """
+    Estimate how many price points an extraction of these markets will return.
+    
+    Only markets with tradeable tokens are counted, one series per outcome.
+    
+    Args:
+        markets: Markets to be extracted
+        interval: Time interval string (e.g. '1h')
+        days_back: Days of history when no start date is given
+        start_date: Start date in YYYY-MM-DD format
+        end_date: End date in YYYY-MM-DD format (defaults to now)
+        fidelity: Resolution in minutes, overriding the interval's density
+        
+    Returns:
+        Projected number of price points across all outcomes
+    """
+    if start_date:
+        end_ts = date_to_timestamp(end_date) if end_date else time.time()
+        days = max(end_ts - date_to_timestamp(start_date), 0) / SECONDS_PER_DAY
+    else:
+        days = days_back
+    
+    if fidelity:
+        points_per_day = MINUTES_PER_DAY / fidelity
+    else:
+        points_per_day = POINTS_PER_DAY.get(interval, POINTS_PER_DAY["1h"])
+    
+    series = sum(len(market.outcomes) for market in markets if market.has_tradeable_tokens)
+    return int(series * days * points_per_day)
+
+
+def available_memory() -> Optional[int]:
+    """
+    Get the memory available to new allocations, in bytes.
+    
+    Reads MemAvailable from /proc/meminfo (which counts reclaimable page
+    cache) and falls back to free physical pages from sysconf.
+    
+    Returns:
+        Available memory in bytes, or None if it cannot be determined
+    """
+    try:
+        with open('/proc/meminfo', encoding='ascii') as f:
+            for line in f:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    
+    try:
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def exceeds_memory_budget(price_points: int, memory: Optional[int] = None) -> bool:
+    """
+    Check whether holding this many price points in memory is too much.
+    
+    Args:
+        price_points: Projected number of price points
+        memory: Available memory in bytes (detected when omitted)
+        
+    Returns:
+        True if the points would use more than MEMORY_BUDGET_FRACTION of
+        available memory; False if they fit or memory cannot be determined
+    """
+    if memory is None:
+        memory = available_memory()
+    if memory is None:
+        return False
+    return price_points * BYTES_PER_PRICE_POINT > memory * MEMORY_BUDGET_FRACTION
+
+
 def format_price(price: float, precision: int = 4) -> str:
     """
     Format a price value for display.
@@ -6,29 +6,99 @@ Command-line interface for extracting historical price data from Polymarket mark
 """
 
 import argparse
+import shlex
 import sys
 import logging
 from pathlib import Path
+from typing import Callable, List, Optional
 
-from polymarket import (
-    PolymarketExtractor, DataProcessor, CLIReporter
-)
+# Only configuration and constants are imported at module load; the extractor,
+# API clients and pandas are imported in main() once the arguments have been parsed
 from polymarket.utils.config import (
     DEFAULT_DAYS_BACK, DEFAULT_INTERVAL,
     LOG_LEVEL, LOG_FORMAT
 )
-from polymarket.utils.constants import (
-    AUTO_STREAMING_THRESHOLD, SUCCESS_DATA_SAVED
-)
+from polymarket.utils.constants import AUTO_STREAMING_THRESHOLD, SUCCESS_DATA_SAVED
 
 
-# Configure logging
-logging.basicConfig(level=LOG_LEVEL, format=LOG_FORMAT)
 logger = logging.getLogger(__name__)
 
 
-def main():
-    """Main CLI entry point."""
+def _resolve_output(user_path: str) -> str:
+    """
+    Resolve the CSV output path and create its parent directory.
+    
+    Bare file names are placed under data/; paths with a directory
+    component are used as given. The .csv extension is appended unless
+    already present.
+    
+    Args:
+        user_path: Output path from the command line (without extension)
+        
+    Returns:
+        Path of the CSV file to write
+        
+    Raises:
+        OSError: If the output directory cannot be created
+    """
+    path = Path(user_path)
+    if not path.is_absolute() and len(path.parts) == 1:
+        path = Path("data") / path
+    if path.suffix != ".csv":
+        path = path.with_name(f"{path.name}.csv")
+    
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return str(path)
+
+
+def _parse_fast_args(argv: List[str]) -> Optional[argparse.Namespace]:
+    """
+    Parse the common `url [-o OUTPUT] [-v]` invocation without argparse.
+    
+    Args:
+        argv: Command-line arguments excluding the program name
+        
+    Returns:
+        Namespace with the same fields and defaults as the full parser, or
+        None if the arguments need the full parser (other options, --help,
+        malformed input)
+    """
+    if not argv or len(argv) > 4 or not argv[0].startswith("http"):
+        return None
+    
+    args = argparse.Namespace(
+        url=argv[0],
+        interval=DEFAULT_INTERVAL,
+        days=DEFAULT_DAYS_BACK,
+        start=None,
+        end=None,
+        fidelity=None,
+        output=None,
+        api_key=None,
+        extract_all_markets=False,
+        streaming=False,
+        chunksize=None,
+        summary=False,
+        verbose=False,
+        batch=None
+    )
+    
+    rest = iter(argv[1:])
+    for arg in rest:
+        if arg in ("-v", "--verbose") and not args.verbose:
+            args.verbose = True
+        elif arg in ("-o", "--output") and args.output is None:
+            args.output = next(rest, None)
+            if not args.output or args.output.startswith("-"):
+                return None
+        else:
+            return None
+    
+    return args
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the full argument parser."""
     parser = argparse.ArgumentParser(
         description="Extract historical price data from Polymarket markets",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -53,6 +123,7 @@ Examples:
     
     parser.add_argument(
         "url",
+        nargs="?",
         help="Polymarket market or event URL"
     )
     
@@ -108,6 +179,14 @@ Examples:
         help="Use memory-efficient streaming mode for CSV exports (auto-enabled for large events)"
     )
     
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        metavar="ROWS",
+        help="Maximum CSV rows buffered per write for event exports "
+             "(default: flush every 1 MiB)"
+    )
+    
     parser.add_argument(
         "--summary",
         action="store_true",
@@ -120,17 +199,166 @@ Examples:
         help="Enable verbose logging"
     )
     
-    args = parser.parse_args()
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="Run one extraction per line of FILE ('-' for stdin), reusing one "
+             "connection pool; each line holds the arguments of one invocation"
+    )
+    
+    return parser
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Main CLI entry point.
+    
+    Args:
+        argv: Command-line arguments, defaulting to sys.argv[1:]
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    # The plain `url [-o OUTPUT] [-v]` form skips building the full parser
+    args = _parse_fast_args(argv)
+    if args is None:
+        parser = _build_parser()
+        args = parser.parse_args(argv)
+        if not args.url and not args.batch:
+            parser.error("a URL or --batch FILE is required")
+        if args.url and args.batch:
+            parser.error("a URL cannot be combined with --batch FILE")
+        if args.chunksize is not None and args.chunksize < 1:
+            parser.error("--chunksize must be a positive number of rows")
+    
+    from polymarket import PolymarketExtractor
+    
+    # Configure logging
+    logging.basicConfig(level=LOG_LEVEL, format=LOG_FORMAT)
+    # LOG_FORMAT uses none of these record fields, so skip collecting them
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
     
     # Set logging level
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
-    # Create extractor and reporter
     extractor = PolymarketExtractor(api_key=args.api_key, verbose=args.verbose)
+    try:
+        if args.batch:
+            return _run_batch(args.batch, extractor)
+        return _run(args, extractor)
+    finally:
+        extractor.close()
+
+
+def _export_csv(save: Callable[[], None], filepath: str, reporter, message: str) -> None:
+    """
+    Run a CSV export and report the outcome.
+    
+    Export failures are reported but do not abort the CLI.
+    
+    Args:
+        save: Callable that writes the CSV file
+        filepath: Path being written, for the success message
+        reporter: CLIReporter for console output
+        message: Progress message printed before exporting
+    """
+    reporter.print(f"\n{message}")
+    try:
+        save()
+    except Exception as e:
+        logger.error("Failed to save CSV: %s", e)
+        reporter.error(f"Failed to save CSV: {e}")
+        return
+    
+    reporter.print("  " + SUCCESS_DATA_SAVED.format(format='CSV', filepath=filepath))
+
+
+def _run_batch(batch_file: str, extractor) -> int:
+    """
+    Run one extraction per line of a batch file with a shared extractor.
+    
+    Each non-blank line not starting with '#' holds the shell-quoted
+    arguments of one invocation. All jobs share the extractor's HTTP
+    connection pool, so imports and TLS handshakes are paid once per batch.
+    The API key comes from the batch invocation, not from individual lines.
+    
+    Args:
+        batch_file: Path of the batch file, or '-' for stdin
+        extractor: PolymarketExtractor shared by all jobs
+        
+    Returns:
+        0 if every job succeeded, 1 otherwise
+    """
+    parser = _build_parser()
+    failures = 0
+    jobs = 0
+    
+    try:
+        handle = sys.stdin if batch_file == '-' else open(batch_file, encoding='utf-8')
+    except OSError as e:
+        logger.error("Cannot read batch file %s: %s", batch_file, e)
+        return 1
+    
+    try:
+        for line_number, line in enumerate(handle, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            
+            jobs += 1
+            try:
+                args = parser.parse_args(shlex.split(line))
+            except (SystemExit, ValueError):
+                # argparse has already printed the usage error
+                logger.error("Invalid arguments on batch line %s: %s", line_number, line)
+                failures += 1
+                continue
+            
+            if not args.url or args.batch:
+                logger.error("Batch line %s needs a URL and cannot nest --batch", line_number)
+                failures += 1
+                continue
+            
+            if _run(args, extractor) != 0:
+                failures += 1
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+    
+    logger.info("Batch complete: %s jobs, %s failed", jobs, failures)
+    return 1 if failures else 0
+
+
+def _run(args: argparse.Namespace, extractor) -> int:
+    """
+    Run a single extraction job.
+    
+    Args:
+        args: Parsed command-line arguments for the job
+        extractor: PolymarketExtractor to fetch with
+        
+    Returns:
+        Process exit code (0 on success)
+    """
+    from polymarket import DataProcessor, EventCSVWriter, CLIReporter, TimeInterval
+    from polymarket.utils import estimate_price_points, exceeds_memory_budget
+    
+    interval = TimeInterval.from_string(args.interval)
     reporter = CLIReporter(verbose=args.verbose)
     
     try:
+        # Resolve the output path before any network I/O so a bad path fails fast
+        filepath = None
+        if args.output:
+            try:
+                filepath = _resolve_output(args.output)
+            except OSError as e:
+                reporter.error(f"Cannot create output directory for {args.output}: {e}")
+                return 1
+        
         # Check if we should extract all markets from an event
         if args.extract_all_markets:
             # Parse URL to get event slug
@@ -144,65 +372,77 @@ Examples:
             
             # Check if we should auto-enable streaming for large events
             event = extractor.api.get_event(event_slug)
-            auto_streaming = event and len(event.markets) > AUTO_STREAMING_THRESHOLD and not args.streaming
+            auto_streaming = False
+            if event and not args.streaming:
+                estimated_points = estimate_price_points(
+                    event.markets, args.interval, args.days,
+                    args.start, args.end, args.fidelity
+                )
+                logger.info("Estimated %s price points for %s markets",
+                            f"{estimated_points:,}", len(event.markets))
+                auto_streaming = (
+                    estimated_points > AUTO_STREAMING_THRESHOLD
+                    or exceeds_memory_budget(estimated_points)
+                )
             
             if auto_streaming:
-                reporter.print(f"\nAuto-enabling streaming mode for {len(event.markets)} markets")
+                reporter.print(
+                    f"\nAuto-enabling streaming mode for ~{estimated_points:,} price points "
+                    f"across {len(event.markets)} markets"
+                )
             
             # Enable optimizations if requested
             use_streaming = args.streaming or auto_streaming
             
-            # Extract all markets
-            event_data = extractor.extract_all_event_markets(
-                event_slug,
-                interval=args.interval,
-                days_back=args.days,
-                start_date=args.start,
-                end_date=args.end,
-                enable_gc=use_streaming,
-                fidelity=args.fidelity
-            )
+            # In streaming mode, markets are written out as they are fetched
+            writer = None
+            if filepath and use_streaming:
+                reporter.print("Using memory-efficient streaming mode...")
+                writer = EventCSVWriter(filepath, args.chunksize)
             
-            if not event_data:
-                logger.error("Failed to extract event data")
-                return 1
+            try:
+                # Extract all markets
+                event_data = extractor.extract_all_event_markets(
+                    event_slug,
+                    interval=interval,
+                    days_back=args.days,
+                    start_date=args.start,
+                    end_date=args.end,
+                    enable_gc=use_streaming,
+                    fidelity=args.fidelity,
+                    event=event,
+                    market_callback=writer.add_market if writer else None
+                )
                 
-            if not event_data.has_data:
-                logger.warning("No historical price data available")
-                reporter.warning("No historical price data available for any markets")
-                return 1
-            
-            # Export event data
-            if args.output:
-                reporter.print("\nExporting event data...")
-                
-                try:
-                    # If output path doesn't start with / or contain /, prepend data/
-                    if not args.output.startswith('/') and '/' not in args.output:
-                        filepath = f"data/{args.output}.csv"
-                    else:
-                        filepath = f"{args.output}.csv"
+                if not event_data:
+                    logger.error("Failed to extract event data")
+                    return 1
                     
-                    # Check if we should use streaming
-                    if use_streaming:
-                        reporter.print("Using memory-efficient streaming mode...")
-                        DataProcessor.stream_event_to_csv(event_data, filepath)
+                has_data = writer.has_data if writer else event_data.has_data
+                if not has_data:
+                    logger.warning("No historical price data available")
+                    reporter.warning("No historical price data available for any markets")
+                    return 1
+                
+                # Export event data
+                if filepath:
+                    if writer:
+                        save = writer.close
                     else:
-                        DataProcessor.save_event_to_file(event_data, filepath)
-                    
-                    reporter.print(f"  {SUCCESS_DATA_SAVED.format(format='CSV', filepath=filepath)}")
-                    
-                except Exception as e:
-                    logger.error(f"Failed to save CSV: {e}")
-                    reporter.error(f"Failed to save CSV: {e}")
-            else:
-                reporter.print("\nExtraction complete. Use -o to specify output path.")
+                        save = lambda: DataProcessor.save_event_to_file(event_data, filepath, args.chunksize)
+                    _export_csv(save, filepath, reporter, "Exporting event data...")
+                else:
+                    reporter.print("\nExtraction complete. Use -o to specify output path.")
+            finally:
+                # Removes spilled data if the writer was never closed
+                if writer:
+                    writer.discard()
         
         else:
             # Single market extraction (original behavior)
             data = extractor.extract_from_url(
                 args.url,
-                interval=args.interval,
+                interval=interval,
                 days_back=args.days,
                 start_date=args.start,
                 end_date=args.end,
@@ -223,30 +463,16 @@ Examples:
                 reporter.print("\n" + DataProcessor.create_summary_report(data))
             
             # Export data if output path provided
-            if args.output:
-                reporter.print("\nExporting data...")
-                
-                try:
-                    # If output path doesn't start with / or contain /, prepend data/
-                    if not args.output.startswith('/') and '/' not in args.output:
-                        filepath = f"data/{args.output}.csv"
-                    else:
-                        filepath = f"{args.output}.csv"
-                    
-                    DataProcessor.save_to_file(
-                        data, 
-                        filepath, 
-                        include_metadata=True
-                    )
-                        
-                    reporter.print(f"  {SUCCESS_DATA_SAVED.format(format='CSV', filepath=filepath)}")
-                    
-                except Exception as e:
-                    logger.error(f"Failed to save CSV: {e}")
-                    reporter.error(f"Failed to save CSV: {e}")
+            if filepath:
+                _export_csv(
+                    lambda: DataProcessor.save_to_file(data, filepath, include_metadata=True),
+                    filepath, reporter, "Exporting data..."
+                )
             else:
-                # If no output specified, print CSV to console
-                reporter.print("\n" + DataProcessor.to_csv(data, include_metadata=True))
+                # If no output specified, stream CSV to console
+                reporter.print()
+                DataProcessor.write_csv(data, sys.stdout, include_metadata=True)
+                reporter.print()
                 
         return 0
         
@@ -257,8 +483,6 @@ Examples:
         logger.exception("Unexpected error in main")
         reporter.error(f"Error: {e}")
         return 1
-    finally:
-        extractor.close()
 
 
 if __name__ == "__main__":
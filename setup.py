@@ -33,6 +33,7 @@ setup(
     python_requires=">=3.9",
     install_requires=[
         "httpx>=0.25.0",
+        "numpy>=1.24.0",
         "pandas>=2.0.0",
         "tabulate>=0.9.0",
     ],
@@ -41,11 +42,21 @@ setup(
             "pytest>=7.0.0",
             "pytest-asyncio>=0.21.0",
             "pytest-cov>=4.0.0",
+            "pytest-xdist>=3.5.0",
             "black>=23.0.0",
             "isort>=5.12.0",
             "mypy>=1.5.0",
             "flake8>=6.0.0",
         ],
+        "fast": [
+            "orjson>=3.9",
+        ],
+        "http2": [
+            "h2>=4.0",
+        ],
+        "bin": [
+            "nuitka>=1.8",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -2,15 +2,42 @@
 Pytest configuration and shared fixtures.
 """
 
+import httpx
 import pytest
+from contextlib import ExitStack
 from datetime import datetime
-from unittest.mock import Mock, MagicMock
+from unittest.mock import patch
 
 from polymarket.models.models import Market, Event, PriceHistory, PricePoint
 from polymarket.models.orderbook import OrderBook, OrderLevel
+from polymarket.api.api import GammaAPIClient
+from polymarket.cli.extractor import PolymarketExtractor
+from polymarket.utils.parser import PolymarketURLParser
+from tests.fixtures.transport import mock_http_client
 
 
-@pytest.fixture
+# Standalone demo script (no tests); run it with python directly
+collect_ignore = ["test_gamma_api_summary.py"]
+
+
+def pytest_configure(config):
+    # Registered here too so the marker is known when pytest-xdist is absent
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run the marked tests on one pytest-xdist worker"
+    )
+
+
+# Pure-data fixtures are built once per session; tests must treat them as
+# read-only. Fixtures that tests configure (mock clients) stay function-scoped.
+
+
+@pytest.fixture(scope="session")
+def url_parser():
+    """Create one URL parser for the session; it holds no per-instance state."""
+    return PolymarketURLParser()
+
+
+@pytest.fixture(scope="session")
 def sample_market():
     """Create a sample market for testing."""
     return Market(
@@ -27,7 +54,7 @@ def sample_market():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_negrisk_market():
     """Create a sample negRisk market for testing."""
     return Market(
@@ -44,7 +71,7 @@ def sample_negrisk_market():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_event():
     """Create a sample event for testing."""
     return Event(
@@ -59,7 +86,7 @@ def sample_event():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_price_history():
     """Create sample price history data."""
     price_points = [
@@ -86,7 +113,7 @@ def sample_price_history():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_order_book():
     """Create a sample order book."""
     bids = [
@@ -110,7 +137,7 @@ def sample_order_book():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_api_response():
     """Create a mock API response."""
     return {
@@ -126,44 +153,96 @@ def mock_api_response():
     }
 
 
+@pytest.fixture(scope="class")
+def extractor():
+    """Create one extractor per test class; tests patch its API calls."""
+    extractor = PolymarketExtractor(api_key="test-key", verbose=True)
+    yield extractor
+    # Teardown doubles as the close() smoke test for every extractor class
+    extractor.close()
+
+
 @pytest.fixture
-def mock_httpx_client():
-    """Create a mock httpx client."""
-    mock_client = MagicMock()
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {}
-    mock_response.raise_for_status = MagicMock()
-    mock_client.get.return_value = mock_response
-    mock_client.post.return_value = mock_response
-    return mock_client
+def gamma_client():
+    """Create a GammaAPIClient; construction is cheap since its HTTP client is lazy."""
+    client = GammaAPIClient()
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="module")
+def mocked_api_clients():
+    """Patch the clients PolymarketAPI builds, for one module's tests."""
+    with ExitStack() as stack:
+        stack.enter_context(patch('polymarket.api.api.GammaAPIClient'))
+        stack.enter_context(patch('polymarket.api.api.CLOBAPIClient'))
+        stack.enter_context(patch('polymarket.api.data_api.DataAPIClient'))
+        yield
+
+
+@pytest.fixture(scope="module")
+def mocked_polymarket_api():
+    """Patch the PolymarketAPI class MangoCLI builds, for one module's tests."""
+    with patch('mango_cli.PolymarketAPI') as api_class:
+        yield api_class
+
+
+@pytest.fixture(scope="module")
+def module_cli(mocked_polymarket_api):
+    """Create one MangoCLI with a mocked api for one module's tests."""
+    from mango_cli import MangoCLI
+    
+    return MangoCLI()
+
+
+@pytest.fixture
+def cli(module_cli):
+    """
+    Hand each test the module's MangoCLI with its mocked api reset.
+    
+    The Gamma list methods the commands call answer with no results until a
+    test sets their return_value.
+    """
+    module_cli.api.reset_mock(return_value=True, side_effect=True)
+    gamma_client = module_cli.api.gamma_client
+    for method in ('get_markets', 'get_markets_by_tags', 'get_events_by_tags'):
+        getattr(gamma_client, method).return_value = []
+    return module_cli
 
 
 @pytest.fixture
+def mock_httpx_client():
+    """Create an HTTP client that answers every request with 200 and {}."""
+    client = mock_http_client(lambda request: httpx.Response(200, json={}))
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
 def valid_market_urls():
     """Valid Polymarket URLs for testing."""
-    return [
+    return (
         "https://polymarket.com/event/presidential-election-2028/will-jd-vance-win",
         "https://polymarket.com/market/will-btc-hit-100k",
         "https://polymarket.com/will-btc-hit-100k",
-    ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_event_urls():
     """Valid event URLs for testing."""
-    return [
+    return (
         "https://polymarket.com/event/presidential-election-2028",
         "https://polymarket.com/event/english-premier-league-winner",
-    ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_urls():
     """Invalid URLs for testing."""
-    return [
+    return (
         "https://example.com/market",
         "not-a-url",
         "https://polymarket.com/",
         "",
-    ]
\ No newline at end of file
+    )
\ No newline at end of file
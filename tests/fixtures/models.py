@@ -0,0 +1,84 @@
+"""
+Shared model instances for tests.
+
+These are built once at import time. Tests must treat them as read-only and
+derive variants with dataclasses.replace().
+"""
+
+from dataclasses import replace
+from datetime import datetime
+from functools import lru_cache
+from typing import Tuple
+
+from polymarket.models.models import Event, Market, PricePoint
+
+
+SAMPLE_MARKET = Market(
+    id="1",
+    slug="test",
+    condition_id="0x1",
+    question="Test?",
+    outcomes=["Yes", "No"],
+    token_ids=["0x1", "0x2"],
+    active=True,
+    closed=False
+)
+
+SAMPLE_PRICE_POINTS = tuple(
+    PricePoint(timestamp=datetime(2024, 1, 1, i), price=0.45 + i * 0.01)
+    for i in range(3)
+)
+
+
+def make_market(**overrides) -> Market:
+    """Build a Market from SAMPLE_MARKET with the given fields overridden."""
+    return replace(SAMPLE_MARKET, **overrides)
+
+
+@lru_cache(maxsize=32)
+def _league_markets(n_active: int, include_placeholder: bool) -> Tuple[Market, ...]:
+    """Build (once per arguments) the read-only team markets of a league event."""
+    markets = [
+        make_market(
+            id=str(i),
+            slug=f"team-{i}-win",
+            condition_id=f"0x{i}",
+            question=f"Will Team {i} win?",
+            token_ids=[f"0x{i}a", f"0x{i}b"],
+            group_item_title=f"Team {i}"
+        )
+        for i in range(n_active)
+    ]
+    if include_placeholder:
+        markets.append(make_market(
+            id=str(n_active),
+            slug="placeholder-team",
+            condition_id=f"0x{n_active}",
+            question="Will Placeholder win?",
+            token_ids=["", ""],
+            neg_risk=True,
+            neg_risk_market_id="league"
+        ))
+    return tuple(markets)
+
+
+def league_event(n_active: int, include_placeholder: bool = False) -> Event:
+    """
+    Build a 'league' event with one market per team.
+    
+    Each call returns a new Event with its own markets list, so tests may
+    mutate it; the markets themselves are cached and shared read-only.
+    
+    Args:
+        n_active: Number of tradeable team markets, slugged team-{i}-win
+        include_placeholder: Whether to add an inactive negRisk option with
+            empty token IDs, slugged placeholder-team
+    """
+    return Event(
+        id="event-123",
+        ticker="league",
+        slug="league",
+        title="League Winner",
+        description="Who will win?",
+        markets=list(_league_markets(n_active, include_placeholder))
+    )
@@ -0,0 +1,171 @@
+"""
+HTTP transports for tests.
+
+mock_http_client() answers requests from an in-process handler for unit tests,
+and json_response() builds canned responses for tests that stub a request method.
+RecordReplayTransport serves the live API integration tests.
+
+Record/replay modes are chosen from the environment:
+
+- USE_MOCK_PROVIDER=true replays recorded responses from disk, with no network
+- UPDATE_MOCK_CACHE=true sends requests live and records each response
+- otherwise requests go live
+
+In every mode repeated GETs within a session are answered from memory. Live
+runs can also keep a local on-disk cache, so reruns within its max age skip the
+network. Under pytest-xdist each worker keeps its own memory cache, and they
+share the on-disk files.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import httpx
+import pytest
+
+from polymarket.api.api import create_http_client
+
+
+GAMMA_MOCKS_DIR = Path(__file__).parent / "gamma_mocks"
+
+# Headers describing the wire encoding; recorded bodies are stored decoded
+_WIRE_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+_Recording = Tuple[int, List[Tuple[str, str]], bytes]
+
+# How long live runs reuse locally cached responses, in seconds
+DEV_CACHE_MAX_AGE = 3600
+
+
+def mock_http_client(handler: Callable[[httpx.Request], httpx.Response]) -> httpx.Client:
+    """Create a pooled HTTP client whose requests are answered by handler."""
+    return create_http_client(transport=httpx.MockTransport(handler))
+
+
+def json_response(payload) -> httpx.Response:
+    """Build a 200 response carrying payload as its JSON body."""
+    return httpx.Response(200, json=payload)
+
+
+def is_offline_mode() -> bool:
+    """Check whether responses are replayed from recordings."""
+    return os.getenv("USE_MOCK_PROVIDER") == "true"
+
+
+def is_recording_mode() -> bool:
+    """Check whether live responses are written back as recordings."""
+    return os.getenv("UPDATE_MOCK_CACHE") == "true"
+
+
+def request_key(request: httpx.Request) -> str:
+    """Hash a request's method, URL, sorted query params and body."""
+    params = sorted(request.url.params.multi_items())
+    url = str(request.url.copy_with(query=None))
+    digest = hashlib.sha256(
+        json.dumps([request.method, url, params]).encode() + request.content
+    )
+    return digest.hexdigest()[:16]
+
+
+class RecordReplayTransport(httpx.BaseTransport):
+    """HTTP transport that records live responses and replays them offline."""
+    
+    def __init__(self, directory: Path = GAMMA_MOCKS_DIR,
+                 offline: Optional[bool] = None, record: Optional[bool] = None,
+                 cache_dir: Optional[Path] = None, max_age: float = DEV_CACHE_MAX_AGE):
+        """
+        Initialize the transport.
+        
+        Args:
+            directory: Where recordings are read from and written to
+            offline: Replay only; defaults to USE_MOCK_PROVIDER
+            record: Write live responses to disk; defaults to UPDATE_MOCK_CACHE
+            cache_dir: Local cache that live runs read and refresh; not used
+                offline or while recording, so recordings are always fresh
+            max_age: Seconds a cached response in cache_dir stays usable
+        """
+        self.directory = directory
+        self.offline = is_offline_mode() if offline is None else offline
+        self.record = is_recording_mode() if record is None else record
+        self.cache_dir = None if self.offline or self.record else cache_dir
+        self.max_age = max_age
+        self._live = None if self.offline else httpx.HTTPTransport()
+        self._memory: Dict[str, _Recording] = {}
+    
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        key = request_key(request)
+        recording = self._memory.get(key)
+        if recording is None and self.cache_dir is not None:
+            recording = self._load_fresh(key)
+            if recording is not None:
+                self._memory[key] = recording
+        if recording is None:
+            recording = self._replay(request, key) if self.offline else self._fetch(request)
+            if request.method == "GET" and recording[0] == 200:
+                self._memory[key] = recording
+                if self.record:
+                    self._save(self.directory, request, key, recording)
+                elif self.cache_dir is not None:
+                    self._save(self.cache_dir, request, key, recording)
+        
+        status_code, headers, body = recording
+        return httpx.Response(status_code, headers=headers, content=body, request=request)
+    
+    def close(self) -> None:
+        if self._live is not None:
+            self._live.close()
+    
+    def _fetch(self, request: httpx.Request) -> _Recording:
+        """Send the request live and read the decoded response."""
+        response = self._live.handle_request(request)
+        try:
+            response.read()
+        finally:
+            response.close()
+        headers = [(k, v) for k, v in response.headers.multi_items()
+                   if k.lower() not in _WIRE_HEADERS]
+        return response.status_code, headers, response.content
+    
+    def _replay(self, request: httpx.Request, key: str) -> _Recording:
+        """Load a recorded response, skipping the test when none exists."""
+        path = self.directory / f"{key}.json"
+        if not path.exists():
+            pytest.skip(f"No recorded response for {request.method} {request.url}")
+        return self._load(path)
+    
+    def _load_fresh(self, key: str) -> Optional[_Recording]:
+        """Load a locally cached response younger than max_age, if any."""
+        path = self.cache_dir / f"{key}.json"
+        try:
+            if time.time() - path.stat().st_mtime > self.max_age:
+                return None
+        except OSError:
+            return None
+        return self._load(path)
+    
+    @staticmethod
+    def _load(path: Path) -> _Recording:
+        """Read a response recording."""
+        data = json.loads(path.read_text())
+        headers = [tuple(header) for header in data["headers"]]
+        return data["status_code"], headers, data["body"].encode()
+    
+    @staticmethod
+    def _save(directory: Path, request: httpx.Request, key: str, recording: _Recording) -> None:
+        """Write a response recording next to the others."""
+        status_code, headers, body = recording
+        directory.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so parallel test workers never read a partial file
+        tmp_path = directory / f"{key}.{os.getpid()}.tmp"
+        tmp_path.write_text(json.dumps({
+            "method": request.method,
+            "url": str(request.url),
+            "status_code": status_code,
+            "headers": headers,
+            "body": body.decode()
+        }, indent=2))
+        os.replace(tmp_path, directory / f"{key}.json")
@@ -1 +1,6 @@
-"""Integration tests for Polymarket workflows."""
\ No newline at end of file
+"""
+Integration tests for Polymarket workflows.
+
+These tests rely only on pytest's built-in fixtures (monkeypatch, tmp_path), so
+they can run with PYTEST_DISABLE_PLUGIN_AUTOLOAD=1 to skip plugin discovery.
+"""
@@ -2,307 +2,375 @@
 Integration tests for CLI commands.
 """
 
-import pytest
+import json
+import subprocess
 import sys
-from io import StringIO
-from unittest.mock import patch, Mock
+import pytest
+from unittest.mock import Mock
 from pathlib import Path
+from types import SimpleNamespace
 
-from polymarket_extract import main as extract_main
+from polymarket_extract import (
+    main as extract_main, _resolve_output, _parse_fast_args, _build_parser
+)
 from mango_cli import main as mango_main
-from polymarket.models.models import Market, Event, PriceHistory, PricePoint
+from polymarket.models.models import Event, PriceHistory, PricePoint, TimeInterval
+from polymarket.models.orderbook import OrderBook
+from polymarket.utils.exceptions import InvalidURLError
+from polymarket.utils.processor import DataProcessor
+from tests.fixtures.models import SAMPLE_MARKET, make_market
 from datetime import datetime
 
 
+# Empty order books for the book export test, built once per module
+ORDER_BOOKS = {
+    outcome: OrderBook(market_id="1", token_id=token_id, outcome=outcome)
+    for outcome, token_id in (("Yes", "0x1"), ("No", "0x2"))
+}
+
+MARKET_URL = "https://polymarket.com/test"
+EVENT_URL = "https://polymarket.com/event/test-event"
+INVALID_URL = "https://invalid.com/market"
+INVALID_URL_ERROR = InvalidURLError(INVALID_URL)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _stub_csv_writers():
+    """Keep CLI tests off the real CSV writers; processor tests cover them."""
+    with pytest.MonkeyPatch.context() as mp:
+        for name in ('write_csv', 'save_to_file', 'save_event_to_file', 'stream_event_to_csv'):
+            mp.setattr(DataProcessor, name, Mock())
+        yield
+
+
+@pytest.fixture
+def extractor_class(monkeypatch):
+    """Replace PolymarketExtractor with a Mock class."""
+    extractor_class = Mock()
+    monkeypatch.setattr('polymarket.PolymarketExtractor', extractor_class)
+    return extractor_class
+
+
+@pytest.fixture
+def api_class(monkeypatch):
+    """Replace the mango CLI's PolymarketAPI with a Mock class."""
+    api_class = Mock()
+    monkeypatch.setattr('mango_cli.PolymarketAPI', api_class)
+    return api_class
+
+
 class TestPolymarketExtractCLI:
     """Test polymarket-extract CLI."""
     
-    @patch('polymarket_extract.PolymarketExtractor')
-    def test_basic_extraction(self, mock_extractor_class):
-        """Test basic market extraction."""
-        # Mock extractor instance
-        mock_extractor = Mock()
-        mock_extractor_class.return_value = mock_extractor
-        
-        # Mock extraction result
-        mock_market = Market(
-            id="1",
-            slug="test",
-            condition_id="0x1",
-            question="Test?",
-            outcomes=["Yes", "No"],
-            token_ids=["0x1", "0x2"]
-        )
-        
-        mock_data = Mock()
-        mock_data.market = mock_market
-        mock_data.has_data = True
-        mock_data.price_histories = {"Yes": Mock()}
-        
-        mock_extractor.extract_from_url.return_value = mock_data
-        
-        # Test command
-        test_args = [
-            'polymarket_extract.py',
-            'https://polymarket.com/test-market'
-        ]
-        
-        with patch.object(sys, 'argv', test_args):
-            with patch('polymarket_extract.DataProcessor.to_csv', return_value="timestamp,Yes_price\n2024-01-01,0.5"):
-                result = extract_main()
-        
-        assert result == 0
-        mock_extractor.extract_from_url.assert_called_once()
-    
-    @patch('polymarket_extract.PolymarketExtractor')
-    def test_event_extraction_with_streaming(self, mock_extractor_class):
+    def test_event_extraction_with_streaming(self, extractor_class, monkeypatch, tmp_path):
         """Test event extraction with streaming."""
         # Mock extractor instance
-        mock_extractor = Mock()
-        mock_extractor_class.return_value = mock_extractor
+        mock_extractor = extractor_class.return_value
         
         # Mock parser
         mock_extractor.parser.parse.return_value = {'event_slug': 'test-event'}
-        mock_extractor.parser.is_event_url.return_value = False  # It's a market within event
+        mock_extractor.parser.is_event_url.return_value = True
         
         # Mock event
         mock_event = Event(
             id="1",
+            ticker="test-event",
             slug="test-event",
             title="Test Event",
             description="Test",
-            markets=[Mock() for _ in range(15)]  # More than threshold
+            markets=[SAMPLE_MARKET] * 15  # More than threshold
         )
         
         mock_extractor.api.get_event.return_value = mock_event
         
         # Mock event data
-        mock_event_data = Mock()
-        mock_event_data.has_data = True
-        mock_event_data.total_markets = 15
+        mock_event_data = SimpleNamespace(has_data=True, total_markets=15)
         
         mock_extractor.extract_all_event_markets.return_value = mock_event_data
         
-        # Test command with streaming
+        # Streaming writes through EventCSVWriter; keep it off the filesystem
+        writer_class = Mock()
+        monkeypatch.setattr('polymarket.EventCSVWriter', writer_class)
+        
+        # 15 markets x 2 outcomes x 30 days of minute data is well past the
+        # auto-streaming threshold
         test_args = [
-            'polymarket_extract.py',
-            'https://polymarket.com/event/test-event',
+            EVENT_URL,
             '--extract-all-markets',
-            '-o', 'test_output'
+            '-i', '1m',
+            '-d', '30',
+            '-o', str(tmp_path / 'test_output')
         ]
         
-        with patch.object(sys, 'argv', test_args):
-            with patch('polymarket_extract.DataProcessor.stream_event_to_csv'):
-                result = extract_main()
+        result = extract_main(test_args)
         
         assert result == 0
         # Should auto-enable streaming for large event
         mock_extractor.extract_all_event_markets.assert_called_once()
         call_args = mock_extractor.extract_all_event_markets.call_args
         assert call_args.kwargs['enable_gc'] is True  # Streaming enabled
+        writer = writer_class.return_value
+        assert call_args.kwargs['market_callback'] == writer.add_market
+        writer.close.assert_called_once()
     
-    @patch('polymarket_extract.PolymarketExtractor')
-    def test_cli_with_parameters(self, mock_extractor_class):
-        """Test CLI with various parameters."""
-        mock_extractor = Mock()
-        mock_extractor_class.return_value = mock_extractor
+    def test_event_extraction_passes_prefetched_event(self, extractor_class):
+        """Test the event fetched for the streaming check is reused for extraction."""
+        mock_extractor = extractor_class.return_value
+        mock_extractor.parser.parse.return_value = {'event_slug': 'test-event'}
+        mock_extractor.parser.is_event_url.return_value = True
         
-        mock_extractor.extract_from_url.return_value = None  # No data
+        mock_event = Event(
+            id="1",
+            ticker="test-event",
+            slug="test-event",
+            title="Test Event",
+            description="Test",
+            markets=[]
+        )
+        mock_extractor.api.get_event.return_value = mock_event
+        mock_extractor.extract_all_event_markets.return_value = SimpleNamespace(has_data=True)
         
         test_args = [
-            'polymarket_extract.py',
-            'https://polymarket.com/test',
-            '-i', '1h',
-            '-d', '7',
-            '--start', '2024-01-01',
-            '--end', '2024-01-07',
-            '--api-key', 'test-key',
-            '-v'
+            EVENT_URL,
+            '--extract-all-markets'
         ]
         
-        with patch.object(sys, 'argv', test_args):
-            result = extract_main()
+        result = extract_main(test_args)
         
-        assert result == 1  # No data
+        assert result == 0
+        mock_extractor.api.get_event.assert_called_once_with('test-event')
+        call_args = mock_extractor.extract_all_event_markets.call_args
+        assert call_args.kwargs['event'] is mock_event
+    
+    def test_resolve_output(self, tmp_path, monkeypatch):
+        """Test output paths are resolved and their directory created up front."""
+        monkeypatch.chdir(tmp_path)
+        
+        assert _resolve_output("market_data") == str(Path("data/market_data.csv"))
+        assert (tmp_path / "data").is_dir()
+        assert _resolve_output("out/nested/run.csv") == str(Path("out/nested/run.csv"))
+        assert (tmp_path / "out" / "nested").is_dir()
+        assert _resolve_output(str(tmp_path / "abs")) == str(tmp_path / "abs.csv")
+    
+    def test_help_skips_numpy_and_pandas(self):
+        """Test --help loads neither numpy nor pandas."""
+        script = (
+            "import sys\n"
+            "import polymarket_extract\n"
+            "try:\n"
+            "    polymarket_extract.main(['--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print(sorted({'numpy', 'pandas'} & set(sys.modules)))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True,
+            cwd=Path(__file__).resolve().parents[2], check=True
+        )
         
-        # Check parameters passed
-        call_args = mock_extractor.extract_from_url.call_args
-        assert call_args.kwargs['interval'] == '1h'
-        assert call_args.kwargs['days_back'] == 7
-        assert call_args.kwargs['start_date'] == '2024-01-01'
-        assert call_args.kwargs['end_date'] == '2024-01-07'
+        assert result.stdout.splitlines()[-1] == "[]"
+    
+    @pytest.mark.parametrize("argv", [
+        (MARKET_URL,),
+        (MARKET_URL, "-v"),
+        (MARKET_URL, "-o", "out"),
+        (MARKET_URL, "--output", "out", "--verbose"),
+    ])
+    def test_fast_args_match_full_parser(self, argv):
+        """Test the fast path produces the same namespace as argparse."""
+        assert vars(_parse_fast_args(argv)) == vars(_build_parser().parse_args(argv))
+    
+    @pytest.mark.parametrize("argv", [
+        (),
+        ("--help",),
+        (MARKET_URL, "-i", "1h"),
+        (MARKET_URL, "-o"),
+        (MARKET_URL, "-o", "-v"),
+        (MARKET_URL, "-v", "-v"),
+    ])
+    def test_fast_args_defer_to_full_parser(self, argv):
+        """Test anything beyond the plain form falls back to argparse."""
+        assert _parse_fast_args(argv) is None
     
-    @patch('polymarket_extract.PolymarketExtractor')
-    def test_invalid_url_handling(self, mock_extractor_class):
-        """Test handling of invalid URLs."""
-        mock_extractor = Mock()
-        mock_extractor_class.return_value = mock_extractor
+    def test_batch_reuses_one_extractor(self, extractor_class, tmp_path):
+        """Test batch jobs share a single extractor and report failures."""
+        mock_extractor = extractor_class.return_value
+        mock_extractor.extract_from_url.return_value = None  # No data
         
-        mock_extractor.extract_from_url.side_effect = Exception("Invalid URL")
+        batch_file = tmp_path / "jobs.txt"
+        batch_file.write_text(
+            "# daily and hourly runs\n"
+            "https://polymarket.com/a -d 7\n"
+            "\n"
+            "https://polymarket.com/b -i 1h\n"
+        )
         
-        test_args = [
-            'polymarket_extract.py',
-            'https://invalid.com/market'
-        ]
+        result = extract_main(['--batch', str(batch_file)])
         
-        with patch.object(sys, 'argv', test_args):
-            result = extract_main()
+        assert result == 1  # Both jobs found no data
+        extractor_class.assert_called_once()
+        mock_extractor.close.assert_called_once()
+        urls = [call.args[0] for call in mock_extractor.extract_from_url.call_args_list]
+        assert urls == ["https://polymarket.com/a", "https://polymarket.com/b"]
+        assert mock_extractor.extract_from_url.call_args_list[1].kwargs['interval'] == TimeInterval.ONE_HOUR
+    
+    def test_batch_rejects_url(self, extractor_class, tmp_path):
+        """Test a URL alongside --batch is an error rather than ignored."""
+        batch_file = tmp_path / "jobs.txt"
+        batch_file.write_text("https://polymarket.com/a\n")
+        
+        with pytest.raises(SystemExit) as exc_info:
+            extract_main([MARKET_URL, '--batch', str(batch_file)])
+        
+        assert exc_info.value.code == 2
+        extractor_class.assert_not_called()
+    
+    @pytest.mark.parametrize("argv, outcome, want_rc, want_kwargs", [
+        pytest.param(
+            ['https://polymarket.com/test-market'],
+            'data', 0, {},
+            id="basic"
+        ),
+        pytest.param(
+            [MARKET_URL, '-i', '1h', '-d', '7',
+             '--start', '2024-01-01', '--end', '2024-01-07',
+             '--api-key', 'test-key', '-v'],
+            None, 1,
+            {'interval': TimeInterval.ONE_HOUR, 'days_back': 7,
+             'start_date': '2024-01-01', 'end_date': '2024-01-07'},
+            id="parameters-no-data"
+        ),
+        pytest.param(
+            [INVALID_URL],
+            INVALID_URL_ERROR, 1, {},
+            id="invalid-url"
+        ),
+    ])
+    def test_market_extraction(self, extractor_class, argv, outcome, want_rc, want_kwargs):
+        """Test single-market extraction exit codes and forwarded arguments."""
+        mock_extractor = extractor_class.return_value
+        if outcome == 'data':
+            mock_extractor.extract_from_url.return_value = SimpleNamespace(
+                market=SAMPLE_MARKET, has_data=True, price_histories={"Yes": object()}
+            )
+        elif isinstance(outcome, Exception):
+            mock_extractor.extract_from_url.side_effect = outcome
+        else:
+            mock_extractor.extract_from_url.return_value = outcome
+        
+        result = extract_main(argv)
         
-        assert result == 1  # Error
+        assert result == want_rc
+        mock_extractor.extract_from_url.assert_called_once()
+        call_args = mock_extractor.extract_from_url.call_args
+        for key, value in want_kwargs.items():
+            assert call_args.kwargs[key] == value
 
 
 class TestMangoCLI:
     """Test mango CLI commands."""
     
-    @patch('mango_cli.PolymarketAPI')
-    def test_search_command(self, mock_api_class):
+    def test_search_command(self, api_class, capsys):
         """Test search command."""
-        mock_api = Mock()
-        mock_api_class.return_value = mock_api
+        mock_api = api_class.return_value
         
         mock_markets = [
-            Market(
-                id="1",
+            make_market(
                 slug="btc-100k",
-                condition_id="0x1",
                 question="Will BTC hit 100k?",
-                outcomes=["Yes", "No"],
-                token_ids=["0x1", "0x2"],
                 volume=1000000.0
             )
         ]
         
-        mock_api.search_markets.return_value = mock_markets
+        mock_api.gamma_client.get_markets.return_value = mock_markets
         
         test_args = [
-            'mango',
             'search',
-            'bitcoin',
+            'btc',
             '--min-volume', '10000'
         ]
         
-        with patch.object(sys, 'argv', test_args):
-            with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-                result = mango_main()
+        result = mango_main(test_args)
         
         assert result == 0
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         assert "BTC hit 100k" in output
-        assert "$1.0M" in output  # Volume formatting
+        assert "$1,000,000" in output  # Volume formatting
     
-    @patch('mango_cli.PolymarketAPI')
-    def test_market_info_command(self, mock_api_class):
+    def test_market_info_command(self, api_class, capsys):
         """Test market-info command."""
-        mock_api = Mock()
-        mock_api_class.return_value = mock_api
+        mock_api = api_class.return_value
         
-        mock_market = Market(
-            id="1",
+        mock_market = make_market(
             slug="test-market",
-            condition_id="0x1",
             question="Test market?",
-            outcomes=["Yes", "No"],
-            token_ids=["0x1", "0x2"],
             volume=500000.0,
             liquidity=250000.0
         )
         
         mock_api.get_market.return_value = mock_market
+        mock_api.get_market_prices.return_value = {"Yes": 0.45, "No": 0.55}
         
         test_args = [
-            'mango',
             'market-info',
             'test-market'
         ]
         
-        with patch.object(sys, 'argv', test_args):
-            with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-                result = mango_main()
+        result = mango_main(test_args)
         
         assert result == 0
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         assert "Test market?" in output
-        assert "Volume: $500.0k" in output
+        assert "Volume: $500,000.00" in output
+        assert "Yes: $0.4500" in output
     
-    @patch('mango_cli.PolymarketAPI')
-    def test_portfolio_command(self, mock_api_class):
+    def test_portfolio_command(self, api_class, capsys):
         """Test portfolio command."""
-        mock_api = Mock()
-        mock_api_class.return_value = mock_api
+        mock_api = api_class.return_value
         
         mock_positions = [
             {
-                "market": {"question": "Test market?"},
+                "market_title": "Test market?",
                 "outcome": "Yes",
-                "size": 1000.0,
-                "average_price": 0.45,
+                "shares": 1000.0,
+                "invested": 450.0,
                 "current_price": 0.50,
-                "current_value": 500.0,
-                "pnl": 50.0,
-                "pnl_percent": 11.11
+                "current_value": 500.0
             }
         ]
         
         mock_api.get_user_positions.return_value = mock_positions
         
         test_args = [
-            'mango',
             'portfolio',
             '0xuser123',
             '--min-size', '100'
         ]
         
-        with patch.object(sys, 'argv', test_args):
-            with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-                result = mango_main()
+        result = mango_main(test_args)
         
         assert result == 0
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         assert "Test market?" in output
-        assert "1000" in output  # Size
+        assert "1,000" in output  # Shares
         assert "$50.00" in output  # P&L
     
-    @patch('mango_cli.PolymarketAPI')
-    def test_book_command_json_export(self, mock_api_class):
+    def test_book_command_json_export(self, api_class, tmp_path):
         """Test book command with JSON export."""
-        mock_api = Mock()
-        mock_api_class.return_value = mock_api
-        
-        mock_market = Market(
-            id="1",
-            slug="test",
-            condition_id="0x1",
-            question="Test?",
-            outcomes=["Yes", "No"],
-            token_ids=["0x1", "0x2"]
-        )
-        
-        mock_books = Mock()
-        mock_books.to_dict.return_value = {
-            "market_id": "1",
-            "books": {
-                "Yes": {"bids": [], "asks": []},
-                "No": {"bids": [], "asks": []}
-            }
-        }
-        
-        mock_api.get_market.return_value = mock_market
-        mock_api.get_order_books.return_value = mock_books
+        mock_api = api_class.return_value
+        mock_api.get_market.return_value = SAMPLE_MARKET
+        mock_api.get_order_books.return_value = SimpleNamespace(books=ORDER_BOOKS)
         
+        output = tmp_path / "test_book.json"
         test_args = [
-            'mango',
             'book',
             'test',
             '--format', 'json',
-            '-o', 'test_book.json'
+            '-o', str(output)
         ]
         
-        with patch.object(sys, 'argv', test_args):
-            with patch('builtins.open', create=True) as mock_open:
-                mock_file = Mock()
-                mock_open.return_value.__enter__.return_value = mock_file
-                
-                result = mango_main()
+        result = mango_main(test_args)
         
         assert result == 0
-        mock_file.write.assert_called()  # JSON written to file
\ No newline at end of file
+        exported = json.loads(output.read_text())
+        assert set(exported["books"]) == {"Yes", "No"}
@@ -4,84 +4,145 @@ Integration tests for Gamma API parameter functionality.
 
 import pytest
 import os
+
+# Run live when explicitly enabled, or offline against recorded responses
+# (USE_MOCK_PROVIDER). Skipping here, before the imports below, keeps the
+# default run from importing anything this module alone needs.
+if os.getenv("RUN_INTEGRATION_TESTS") != "true" and os.getenv("USE_MOCK_PROVIDER") != "true":
+    pytest.skip(
+        "Integration tests disabled. Set RUN_INTEGRATION_TESTS=true to run live "
+        "or USE_MOCK_PROVIDER=true to replay recorded responses.",
+        allow_module_level=True
+    )
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from operator import attrgetter
+from typing import List
 
-from polymarket.api.api import GammaAPIClient, PolymarketAPI
+from polymarket.api.api import GammaAPIClient, PolymarketAPI, create_http_client
 from polymarket.models.models import Market, Event
+from tests.fixtures.transport import RecordReplayTransport
 
 
-# Skip integration tests if not explicitly enabled
-pytestmark = pytest.mark.skipif(
-    os.getenv("RUN_INTEGRATION_TESTS") != "true",
-    reason="Integration tests disabled. Set RUN_INTEGRATION_TESTS=true to run."
-)
+@pytest.fixture(scope="session")
+def http_client(request):
+    """Create one HTTP client per session that records, replays and caches GETs."""
+    # Live reruns reuse responses cached under .pytest_cache for an hour
+    cache_dir = request.config.rootpath / ".pytest_cache" / "gamma-responses"
+    client = create_http_client(transport=RecordReplayTransport(cache_dir=cache_dir))
+    yield client
+    client.close()
 
 
-class TestGammaAPIIntegration:
-    """Integration tests for Gamma API with real API calls."""
-    
-    @pytest.fixture
-    def gamma_client(self):
-        """Create a real GammaAPIClient instance."""
-        return GammaAPIClient()
-    
-    @pytest.fixture
-    def api(self):
-        """Create a real PolymarketAPI instance."""
-        return PolymarketAPI()
+@pytest.fixture(scope="session")
+def gamma_client(http_client):
+    """Create a real GammaAPIClient sharing the session client."""
+    return GammaAPIClient(http_client=http_client)
+
+
+@dataclass
+class SampleData:
+    """One page of markets plus the same markets looked up by ID and by slug."""
+    markets: List[Market]
+    by_ids: List[Market]
+    by_slugs: List[Market]
+
+
+@pytest.fixture(scope="module")
+def sample_data(gamma_client):
+    """Fetch a sample page, then look it up by ID and by slug concurrently."""
+    markets = gamma_client.get_markets(limit=5)
+    market_ids = [m.id for m in markets if m.id]
+    slugs = [m.slug for m in markets]
     
-    def test_get_markets_with_volume_filter(self, gamma_client):
-        """Test getting markets with volume filter."""
-        # Get high volume markets
-        markets = gamma_client.get_markets(
-            volume_num_min=1000000,  # 1M minimum
-            limit=5,
-            order='volume',
-            ascending=False
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        by_ids = executor.submit(gamma_client.get_markets_by_ids, market_ids)
+        by_slugs = executor.submit(gamma_client.get_markets, slug=slugs) if slugs else None
+        return SampleData(
+            markets=markets,
+            by_ids=by_ids.result(),
+            by_slugs=by_slugs.result() if by_slugs else []
         )
-        
-        assert len(markets) > 0
-        assert all(isinstance(m, Market) for m in markets)
-        assert all(m.volume >= 1000000 for m in markets)
-        
-        # Verify descending order
-        volumes = [m.volume for m in markets]
-        assert volumes == sorted(volumes, reverse=True)
-    
-    def test_get_markets_with_liquidity_filter(self, gamma_client):
-        """Test getting markets with liquidity filter."""
-        markets = gamma_client.get_markets(
-            liquidity_num_min=50000,  # 50k minimum
-            liquidity_num_max=500000,  # 500k maximum
-            limit=5
-        )
-        
-        assert len(markets) > 0
-        assert all(isinstance(m, Market) for m in markets)
-        assert all(50000 <= m.liquidity <= 500000 for m in markets)
+
+
+@pytest.fixture(scope="session")
+def api(http_client):
+    """Create one real PolymarketAPI instance sharing the session client."""
+    api = PolymarketAPI(api_key=os.getenv("POLYMARKET_API_KEY"), http_client=http_client)
+    yield api
+    api.close()
+
+
+class TestGammaAPIIntegration:
+    """Integration tests for Gamma API with real API calls."""
     
-    def test_get_markets_by_status(self, gamma_client):
-        """Test filtering markets by status."""
-        # Test active markets
-        active_markets = gamma_client.get_markets(
-            active=True,
-            closed=False,
-            limit=5
-        )
-        
-        assert len(active_markets) > 0
-        assert all(m.active and not m.closed for m in active_markets)
+    @pytest.mark.parametrize("method, kwargs, predicate, order_key, required", [
+        pytest.param(
+            'get_markets',
+            dict(volume_num_min=1000000, limit=5, order='volume', ascending=False),
+            lambda m: m.volume >= 1000000, 'volume', True,
+            id="markets-volume"
+        ),
+        pytest.param(
+            'get_markets',
+            dict(liquidity_num_min=50000, liquidity_num_max=500000, limit=5),
+            lambda m: 50000 <= m.liquidity <= 500000, None, True,
+            id="markets-liquidity"
+        ),
+        pytest.param(
+            'get_markets',
+            dict(active=True, closed=False, limit=5),
+            lambda m: m.active and not m.closed, None, True,
+            id="markets-active"
+        ),
+        # May or may not have closed markets
+        pytest.param(
+            'get_markets',
+            dict(active=False, closed=True, limit=5),
+            lambda m: not m.active and m.closed, None, False,
+            id="markets-closed"
+        ),
+        pytest.param(
+            'get_markets',
+            dict(enableOrderBook=True, active=True, limit=5),
+            lambda m: m.enable_order_book, None, True,
+            id="markets-order-book"
+        ),
+        pytest.param(
+            'get_markets',
+            dict(active=True, volume_num_min=10000, liquidity_num_min=1000,
+                 limit=10, order='volume', ascending=False),
+            lambda m: m.active and m.volume >= 10000 and m.liquidity >= 1000, 'volume', False,
+            id="markets-complex"
+        ),
+        pytest.param(
+            'get_events',
+            dict(volume_min=100000, limit=5, order='volume', ascending=False),
+            lambda e: e.volume >= 100000, None, True,
+            id="events-volume"
+        ),
+        pytest.param(
+            'get_events',
+            dict(active=True, closed=False, limit=5),
+            lambda e: e.active and not e.closed, None, True,
+            id="events-active"
+        ),
+    ])
+    def test_list_filters(self, gamma_client, method, kwargs, predicate, order_key, required):
+        """Test list queries return only matching results, in the requested order."""
+        results = getattr(gamma_client, method)(**kwargs)
+        model = Market if method == 'get_markets' else Event
         
-        # Test closed markets
-        closed_markets = gamma_client.get_markets(
-            active=False,
-            closed=True,
-            limit=5
-        )
+        if required:
+            assert len(results) > 0
+        assert all(isinstance(r, model) for r in results)
+        assert all(predicate(r) for r in results)
         
-        # May or may not have closed markets
-        if closed_markets:
-            assert all(not m.active and m.closed for m in closed_markets)
+        if order_key:
+            values = list(map(attrgetter(order_key), results))
+            assert values == sorted(values, reverse=True)
     
     def test_get_markets_with_tag_filter(self, gamma_client):
         """Test getting markets by tag."""
@@ -95,83 +156,21 @@ class TestGammaAPIIntegration:
         if markets:
             assert all(isinstance(m, Market) for m in markets)
     
-    def test_get_markets_by_multiple_ids(self, gamma_client):
+    def test_get_markets_by_multiple_ids(self, sample_data):
         """Test getting specific markets by IDs."""
-        # First get some markets to get valid IDs
-        sample_markets = gamma_client.get_markets(limit=3)
-        if len(sample_markets) < 3:
+        if len(sample_data.markets) < 3:
             pytest.skip("Not enough markets for test")
         
-        market_ids = [m.id for m in sample_markets if m.id]
-        
-        # Now fetch by those specific IDs
-        markets = gamma_client.get_markets_by_ids(market_ids)
+        market_ids = [m.id for m in sample_data.markets if m.id]
         
-        assert len(markets) > 0
-        fetched_ids = [m.id for m in markets]
+        assert len(sample_data.by_ids) > 0
+        fetched_ids = [m.id for m in sample_data.by_ids]
         assert any(mid in fetched_ids for mid in market_ids)
     
-    def test_get_markets_with_order_book_filter(self, gamma_client):
-        """Test filtering markets tradeable via CLOB."""
-        markets = gamma_client.get_markets(
-            enableOrderBook=True,
-            active=True,
-            limit=5
-        )
-        
-        assert len(markets) > 0
-        assert all(m.enable_order_book for m in markets)
-    
-    def test_get_events_with_volume_filter(self, gamma_client):
-        """Test getting events with volume filter."""
-        events = gamma_client.get_events(
-            volume_min=100000,  # 100k minimum
-            limit=5,
-            order='volume',
-            ascending=False
-        )
-        
-        assert len(events) > 0
-        assert all(isinstance(e, Event) for e in events)
-        assert all(e.volume >= 100000 for e in events)
-    
-    def test_get_events_by_status(self, gamma_client):
-        """Test filtering events by status."""
-        active_events = gamma_client.get_events(
-            active=True,
-            closed=False,
-            limit=5
-        )
-        
-        assert len(active_events) > 0
-        assert all(e.active and not e.closed for e in active_events)
-    
-    def test_complex_market_query(self, gamma_client):
-        """Test complex query with multiple filters."""
-        markets = gamma_client.get_markets(
-            active=True,
-            volume_num_min=10000,
-            liquidity_num_min=1000,
-            limit=10,
-            order='volume',
-            ascending=False
-        )
-        
-        if markets:
-            assert all(m.active for m in markets)
-            assert all(m.volume >= 10000 for m in markets)
-            assert all(m.liquidity >= 1000 for m in markets)
-            
-            # Check ordering
-            volumes = [m.volume for m in markets]
-            assert volumes == sorted(volumes, reverse=True)
-    
-    def test_pagination(self, gamma_client):
+    def test_pagination(self, gamma_client, sample_data):
         """Test pagination with offset."""
-        # Get first page
-        page1 = gamma_client.get_markets(limit=5, offset=0)
-        
-        # Get second page
+        # The sample is the first page (limit=5, offset=0); fetch only the second
+        page1 = sample_data.markets
         page2 = gamma_client.get_markets(limit=5, offset=5)
         
         assert len(page1) > 0
@@ -215,32 +214,21 @@ class TestGammaAPIIntegration:
         # Should handle date format correctly
         assert isinstance(markets, list)
     
-    def test_multiple_slugs_query(self, gamma_client):
+    def test_multiple_slugs_query(self, sample_data):
         """Test querying multiple markets by slug."""
-        # First get some markets to get valid slugs
-        sample_markets = gamma_client.get_markets(limit=2)
-        if len(sample_markets) < 2:
+        if len(sample_data.markets) < 2:
             pytest.skip("Not enough markets for test")
         
-        slugs = [m.slug for m in sample_markets]
+        slugs = [m.slug for m in sample_data.markets]
         
-        # Query by multiple slugs
-        markets = gamma_client.get_markets(slug=slugs)
-        
-        assert len(markets) > 0
-        fetched_slugs = [m.slug for m in markets]
+        assert len(sample_data.by_slugs) > 0
+        fetched_slugs = [m.slug for m in sample_data.by_slugs]
         assert any(slug in fetched_slugs for slug in slugs)
 
 
 class TestPolymarketAPIIntegration:
     """Integration tests for unified PolymarketAPI with new features."""
     
-    @pytest.fixture
-    def api(self):
-        """Create a real PolymarketAPI instance."""
-        api_key = os.getenv("POLYMARKET_API_KEY")
-        return PolymarketAPI(api_key=api_key)
-    
     def test_search_with_filters(self, api):
         """Test search functionality with new filters."""
         # Search using gamma client directly with filters
@@ -250,13 +238,12 @@ class TestPolymarketAPIIntegration:
             limit=10
         )
         
-        # Filter by search term
-        search_term = "bitcoin"
-        filtered = []
-        for market in markets:
-            if search_term.lower() in market.question.lower() or \
-               search_term.lower() in market.slug.lower():
-                filtered.append(market)
+        # Filter by search term, matching case-insensitively like search_markets
+        query_lower = "bitcoin"
+        filtered = [
+            m for m in markets
+            if query_lower in m.question.lower() or query_lower in m.slug.lower()
+        ]
         
         # Should find some markets (or none if no bitcoin markets meet criteria)
         assert isinstance(filtered, list)
@@ -271,10 +258,10 @@ class TestPolymarketAPIIntegration:
         )
         
         if markets:
-            assert all(m.liquidity >= 100000 for m in markets)
+            liquidities = list(map(attrgetter('liquidity'), markets))
+            assert min(liquidities) >= 100000
             
             # Verify ordering
-            liquidities = [m.liquidity for m in markets]
             assert liquidities == sorted(liquidities, reverse=True)
     
     def test_archived_markets_access(self, api):
@@ -286,7 +273,7 @@ class TestPolymarketAPIIntegration:
         
         # May or may not have archived markets
         if archived_markets:
-            assert all(m.archived for m in archived_markets)
+            assert all(map(attrgetter('archived'), archived_markets))
     
     def test_event_filtering(self, api):
         """Test event filtering capabilities."""
@@ -298,15 +285,13 @@ class TestPolymarketAPIIntegration:
         )
         
         if events:
-            assert all(e.volume >= 50000 for e in events)
-            assert all(e.active for e in events)
+            assert min(map(attrgetter('volume'), events)) >= 50000
+            assert all(map(attrgetter('active'), events))
     
-    def test_market_creation_date(self, api):
+    def test_market_creation_date(self, sample_data):
         """Test that created_at is populated for markets from Gamma."""
-        markets = api.gamma_client.get_markets(limit=5)
-        
         # Check if any markets have created_at
-        markets_with_dates = [m for m in markets if m.created_at is not None]
+        markets_with_dates = [m for m in sample_data.markets if m.created_at is not None]
         
         if markets_with_dates:
             market = markets_with_dates[0]
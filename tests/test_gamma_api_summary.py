@@ -5,172 +5,177 @@ This file documents all the new parameters and their usage.
 Run with: python tests/test_gamma_api_summary.py
 """
 
-from polymarket.api.api import GammaAPIClient
+import sys
 
 
-def print_section(title):
-    """Print a section header."""
-    print(f"\n{'=' * 60}")
-    print(f" {title}")
-    print(f"{'=' * 60}\n")
+def _section(title):
+    """Format a section header."""
+    return f"\n{'=' * 60}\n {title}\n{'=' * 60}\n\n"
+
+
+# Built once at import; printing it is a single write
+_SUMMARY_TEXT = (
+    _section("GAMMA API PARAMETER CAPABILITIES")
+    + """\
+The GammaAPIClient now supports ALL available parameters from the Gamma API:
+
+1. MARKET FILTERING PARAMETERS:
+   Basic Parameters:
+   - limit: Maximum number of results (default: 100)
+   - offset: Pagination offset (default: 0)
+   - order: Sort field ('volume', 'liquidity', 'created', 'end_date')
+   - ascending: Sort direction (default: False)
+   - active: Filter by active status
+   - closed: Filter by closed status
+   - archived: Filter by archived status
+
+   Multiple Value Parameters (can specify multiple):
+   - id: List of specific market IDs
+   - slug: List of specific market slugs
+   - clob_token_ids: Filter by CLOB token IDs
+   - condition_ids: Filter by condition IDs
+
+   Volume and Liquidity Filters:
+   - volume_num_min: Minimum volume
+   - volume_num_max: Maximum volume
+   - liquidity_num_min: Minimum liquidity
+   - liquidity_num_max: Maximum liquidity
+
+   Date Range Filters:
+   - start_date_min: Minimum start date (ISO format)
+   - start_date_max: Maximum start date
+   - end_date_min: Minimum end date
+   - end_date_max: Maximum end date
+
+   Tag and Feature Filters:
+   - tag_id: Filter by tag ID
+   - related_tags: Include markets with related tags
+   - enableOrderBook: Filter markets tradeable via CLOB
+
+2. EVENT FILTERING PARAMETERS:
+   All basic parameters plus:
+   - tag: Filter by tag label
+   - tag_slug: Filter by tag slug
+   - Event-specific volume/liquidity parameters
+"""
+    + _section("USAGE EXAMPLES")
+    + """\
+# Get high volume markets
+markets = gamma_client.get_markets(
+    volume_num_min=1000000,  # $1M minimum
+    order='volume',
+    ascending=False,
+    limit=10
+)
+
+# Get markets by multiple IDs
+markets = gamma_client.get_markets(
+    id=[123, 456, 789],
+    limit=3
+)
+
+# Complex query with multiple filters
+markets = gamma_client.get_markets(
+    active=True,
+    volume_num_min=100000,
+    volume_num_max=5000000,
+    liquidity_num_min=50000,
+    tag_id=5,
+    related_tags=True,
+    start_date_min='2024-01-01T00:00:00Z',
+    order='liquidity',
+    limit=50
+)
+"""
+    + _section("HELPER METHODS")
+    + """\
+New helper methods for common use cases:
+
+1. get_markets_by_ids(market_ids: List[int])
+   - Fetch multiple markets by their IDs
+
+2. get_markets_by_condition_ids(condition_ids: List[str])
+   - Get markets by condition IDs
+
+3. get_markets_by_tags(tag_id: int, include_related: bool)
+   - Get markets by tag with optional related tags
+
+4. get_events_by_ids(event_ids: List[int])
+   - Fetch multiple events by their IDs
+
+5. get_events_by_tags(tag_id: int, include_related: bool)
+   - Get events by tag with optional related tags
+"""
+    + _section("CLI ENHANCEMENTS")
+    + """\
+Enhanced search command:
+$ mango search 'bitcoin' \\
+    --min-volume 50000 \\
+    --max-liquidity 1000000 \\
+    --tag 5 \\
+    --start-after 2024-01-01
+
+New markets-advanced command with ALL parameters:
+$ mango markets-advanced \\
+    --min-volume 100000 \\
+    --max-volume 5000000 \\
+    --ids 123 456 789 \\
+    --tag 5 \\
+    --related-tags \\
+    --clob-only \\
+    --sort liquidity \\
+    --format json \\
+    -o markets.json
+
+New tags command for tag-based discovery:
+$ mango tags 17 --type markets --limit 50
+$ mango tags 5 --type events --related
+"""
+    + _section("BENEFITS")
+    + """\
+1. Complete Gamma API Coverage
+   - Access to ALL filtering capabilities
+   - No need for manual API calls
+
+2. Advanced Market Research
+   - Filter by volume/liquidity ranges
+   - Date-based filtering
+   - Tag-based categorization
+
+3. Bulk Operations
+   - Query multiple markets/events by IDs
+   - Efficient data retrieval
+
+4. Historical Analysis
+   - Access archived markets
+   - Time-based filtering
+
+5. Programmatic Access
+   - All features available via Python API
+   - Type-safe parameter handling
+"""
+    + _section("TESTING")
+    + """\
+Comprehensive test coverage includes:
+- Unit tests for all parameters (test_gamma_api_parameters.py)
+- CLI command tests (test_mango_cli_advanced.py)
+- Edge case handling (test_api_edge_cases.py)
+- Backward compatibility (test_backward_compatibility.py)
+- Integration tests (test_gamma_api_integration.py)
+
+Total: 74+ unit tests ensuring robust functionality
+
+============================================================
+ Implementation Complete!
+============================================================
+"""
+)
 
 
 def demonstrate_gamma_api_parameters():
     """Demonstrate all available Gamma API parameters."""
-    
-    print_section("GAMMA API PARAMETER CAPABILITIES")
-    
-    print("The GammaAPIClient now supports ALL available parameters from the Gamma API:")
-    
-    print("\n1. MARKET FILTERING PARAMETERS:")
-    print("   Basic Parameters:")
-    print("   - limit: Maximum number of results (default: 100)")
-    print("   - offset: Pagination offset (default: 0)")
-    print("   - order: Sort field ('volume', 'liquidity', 'created', 'end_date')")
-    print("   - ascending: Sort direction (default: False)")
-    print("   - active: Filter by active status")
-    print("   - closed: Filter by closed status")
-    print("   - archived: Filter by archived status")
-    
-    print("\n   Multiple Value Parameters (can specify multiple):")
-    print("   - id: List of specific market IDs")
-    print("   - slug: List of specific market slugs")
-    print("   - clob_token_ids: Filter by CLOB token IDs")
-    print("   - condition_ids: Filter by condition IDs")
-    
-    print("\n   Volume and Liquidity Filters:")
-    print("   - volume_num_min: Minimum volume")
-    print("   - volume_num_max: Maximum volume")
-    print("   - liquidity_num_min: Minimum liquidity")
-    print("   - liquidity_num_max: Maximum liquidity")
-    
-    print("\n   Date Range Filters:")
-    print("   - start_date_min: Minimum start date (ISO format)")
-    print("   - start_date_max: Maximum start date")
-    print("   - end_date_min: Minimum end date")
-    print("   - end_date_max: Maximum end date")
-    
-    print("\n   Tag and Feature Filters:")
-    print("   - tag_id: Filter by tag ID")
-    print("   - related_tags: Include markets with related tags")
-    print("   - enableOrderBook: Filter markets tradeable via CLOB")
-    
-    print("\n2. EVENT FILTERING PARAMETERS:")
-    print("   All basic parameters plus:")
-    print("   - tag: Filter by tag label")
-    print("   - tag_slug: Filter by tag slug")
-    print("   - Event-specific volume/liquidity parameters")
-    
-    print_section("USAGE EXAMPLES")
-    
-    print("# Get high volume markets")
-    print("markets = gamma_client.get_markets(")
-    print("    volume_num_min=1000000,  # $1M minimum")
-    print("    order='volume',")
-    print("    ascending=False,")
-    print("    limit=10")
-    print(")")
-    
-    print("\n# Get markets by multiple IDs")
-    print("markets = gamma_client.get_markets(")
-    print("    id=[123, 456, 789],")
-    print("    limit=3")
-    print(")")
-    
-    print("\n# Complex query with multiple filters")
-    print("markets = gamma_client.get_markets(")
-    print("    active=True,")
-    print("    volume_num_min=100000,")
-    print("    volume_num_max=5000000,")
-    print("    liquidity_num_min=50000,")
-    print("    tag_id=5,")
-    print("    related_tags=True,")
-    print("    start_date_min='2024-01-01T00:00:00Z',")
-    print("    order='liquidity',")
-    print("    limit=50")
-    print(")")
-    
-    print_section("HELPER METHODS")
-    
-    print("New helper methods for common use cases:")
-    print("\n1. get_markets_by_ids(market_ids: List[int])")
-    print("   - Fetch multiple markets by their IDs")
-    
-    print("\n2. get_markets_by_condition_ids(condition_ids: List[str])")
-    print("   - Get markets by condition IDs")
-    
-    print("\n3. get_markets_by_tags(tag_id: int, include_related: bool)")
-    print("   - Get markets by tag with optional related tags")
-    
-    print("\n4. get_events_by_ids(event_ids: List[int])")
-    print("   - Fetch multiple events by their IDs")
-    
-    print("\n5. get_events_by_tags(tag_id: int, include_related: bool)")
-    print("   - Get events by tag with optional related tags")
-    
-    print_section("CLI ENHANCEMENTS")
-    
-    print("Enhanced search command:")
-    print("$ mango search 'bitcoin' \\")
-    print("    --min-volume 50000 \\")
-    print("    --max-liquidity 1000000 \\")
-    print("    --tag 5 \\")
-    print("    --start-after 2024-01-01")
-    
-    print("\nNew markets-advanced command with ALL parameters:")
-    print("$ mango markets-advanced \\")
-    print("    --min-volume 100000 \\")
-    print("    --max-volume 5000000 \\")
-    print("    --ids 123 456 789 \\")
-    print("    --tag 5 \\")
-    print("    --related-tags \\")
-    print("    --clob-only \\")
-    print("    --sort liquidity \\")
-    print("    --format json \\")
-    print("    -o markets.json")
-    
-    print("\nNew tags command for tag-based discovery:")
-    print("$ mango tags 17 --type markets --limit 50")
-    print("$ mango tags 5 --type events --related")
-    
-    print_section("BENEFITS")
-    
-    print("1. Complete Gamma API Coverage")
-    print("   - Access to ALL filtering capabilities")
-    print("   - No need for manual API calls")
-    
-    print("\n2. Advanced Market Research")
-    print("   - Filter by volume/liquidity ranges")
-    print("   - Date-based filtering")
-    print("   - Tag-based categorization")
-    
-    print("\n3. Bulk Operations")
-    print("   - Query multiple markets/events by IDs")
-    print("   - Efficient data retrieval")
-    
-    print("\n4. Historical Analysis")
-    print("   - Access archived markets")
-    print("   - Time-based filtering")
-    
-    print("\n5. Programmatic Access")
-    print("   - All features available via Python API")
-    print("   - Type-safe parameter handling")
-    
-    print_section("TESTING")
-    
-    print("Comprehensive test coverage includes:")
-    print("- Unit tests for all parameters (test_gamma_api_parameters.py)")
-    print("- CLI command tests (test_mango_cli_advanced.py)")
-    print("- Edge case handling (test_api_edge_cases.py)")
-    print("- Backward compatibility (test_backward_compatibility.py)")
-    print("- Integration tests (test_gamma_api_integration.py)")
-    
-    print("\nTotal: 74+ unit tests ensuring robust functionality")
-    
-    print("\n" + "=" * 60)
-    print(" Implementation Complete!")
-    print("=" * 60)
+    sys.stdout.write(_SUMMARY_TEXT)
 
 
 if __name__ == "__main__":
-    demonstrate_gamma_api_parameters()
\ No newline at end of file
+    demonstrate_gamma_api_parameters()
@@ -2,16 +2,124 @@
 Unit tests for API clients.
 """
 
+import os
+import threading
+import time
 import pytest
-from unittest.mock import Mock, MagicMock, patch
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
 from datetime import datetime
 import httpx
 
-from polymarket.api.api import BaseAPIClient, CLOBAPIClient, GammaAPIClient, PolymarketAPI
+from polymarket.api.api import (
+    BaseAPIClient, CLOBAPIClient, GammaAPIClient, PolymarketAPI, RateLimiter
+)
 from polymarket.api.data_api import DataAPIClient
-from polymarket.models.models import Market, Event, PriceHistory, TimeInterval
+from polymarket.utils.cache import MetadataCache
+from polymarket.utils.config import MAX_CONCURRENT_REQUESTS
+from polymarket.models.models import Event, PriceHistory, TimeInterval
 from polymarket.models.orderbook import OrderBook
-from polymarket.utils.exceptions import APIError, RateLimitError, MarketNotFoundError
+from polymarket.utils.exceptions import (
+    APIError, RateLimitError, MarketNotFoundError, IntervalTooLongError
+)
+from tests.fixtures.models import SAMPLE_MARKET, make_market
+from tests.fixtures.transport import mock_http_client
+
+
+# Market whose token IDs key the CLOB payloads below
+TOKEN_MARKET = make_market(condition_id="0x123", token_ids=["0xtoken1", "0xtoken2"])
+
+# CLOB search response with one market
+CLOB_SEARCH_RESPONSE = {
+    "markets": [
+        {
+            "condition_id": "0x123",
+            "question": "Test market?",
+            "outcomes": ["Yes", "No"],
+            "tokens": [{"token_id": "0x1"}, {"token_id": "0x2"}],
+            "active": True
+        }
+    ]
+}
+
+# CLOB order books keyed by token ID
+CLOB_ORDER_BOOKS_RESPONSE = {
+    "0xtoken1": {
+        "bids": [{"price": "0.45", "size": "1000"}],
+        "asks": [{"price": "0.46", "size": "1500"}]
+    },
+    "0xtoken2": {
+        "bids": [{"price": "0.54", "size": "2000"}],
+        "asks": [{"price": "0.55", "size": "2500"}]
+    }
+}
+
+# Gamma market payload
+GAMMA_MARKET_RESPONSE = {
+    "id": "market-123",
+    "slug": "test-market",
+    "conditionId": "0x123",
+    "question": "Test market?",
+    "outcomes": ["Yes", "No"],
+    "active": True,
+    "volume": "1000000"
+}
+
+# Gamma event payload with one nested market
+GAMMA_EVENT_RESPONSE = {
+    "id": "event-123",
+    "slug": "test-event",
+    "title": "Test Event",
+    "description": "Test description",
+    "markets": [
+        {
+            "id": "market-1",
+            "slug": "market-1",
+            "conditionId": "0x1",
+            "question": "Market 1?",
+            "outcomes": ["Yes", "No"]
+        }
+    ],
+    "liquidity": "10000000",
+    "volume": "50000000"
+}
+
+# Data API positions for one user
+DATA_POSITIONS_RESPONSE = {
+    "positions": [
+        {
+            "market": {
+                "condition_id": "0x123",
+                "question": "Test market?",
+                "slug": "test-market"
+            },
+            "outcome": "Yes",
+            "size": "1000",
+            "average_price": "0.45",
+            "current_price": "0.50",
+            "value": "500",
+            "pnl": "50"
+        }
+    ]
+}
+
+# Data API holders of one outcome
+DATA_HOLDERS_RESPONSE = {
+    "holders": [
+        {
+            "user": "0xholder1",
+            "outcome": "Yes",
+            "size": "10000",
+            "value": "5000"
+        },
+        {
+            "user": "0xholder2",
+            "outcome": "Yes",
+            "size": "5000",
+            "value": "2500"
+        }
+    ]
+}
 
 
 class TestBaseAPIClient:
@@ -25,37 +133,35 @@ class TestBaseAPIClient:
         assert client.api_key == "test-key"
         assert isinstance(client.client, httpx.Client)
     
-    @patch('httpx.Client.get')
-    def test_get_request(self, mock_get):
+    def test_get_request(self):
         """Test GET request."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"result": "success"}
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        seen = []
         
-        client = BaseAPIClient("https://api.example.com")
-        result = client._get("/test")
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json={"result": "success"})
         
-        assert result == {"result": "success"}
-        mock_get.assert_called_once()
-    
-    @patch('httpx.Client.get')
-    def test_rate_limit_error(self, mock_get):
-        """Test rate limit error handling."""
-        mock_response = Mock()
-        mock_response.status_code = 429
-        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "429 Too Many Requests",
-            request=Mock(),
-            response=mock_response
-        )
-        mock_get.return_value = mock_response
+        client = BaseAPIClient("https://api.example.com", http_client=mock_http_client(handler))
+        response = client._request_with_retry('GET', '/test')
         
-        client = BaseAPIClient("https://api.example.com")
+        assert response.json() == {"result": "success"}
+        assert len(seen) == 1
+        assert str(seen[0].url) == "https://api.example.com/test"
+    
+    @pytest.mark.parametrize("status, exc", [
+        (429, RateLimitError),
+        (404, APIError),
+        (500, APIError),
+        (503, APIError),
+    ])
+    @patch('polymarket.api.api.time.sleep')
+    def test_error_mapping(self, mock_sleep, status, exc):
+        """Test HTTP error statuses surface as the matching library exception."""
+        client = GammaAPIClient(http_client=mock_http_client(lambda request: httpx.Response(status)))
         
-        with pytest.raises(RateLimitError):
-            client._get("/test")
+        with pytest.raises(APIError) as excinfo:
+            client._request_with_retry('GET', '/test')
+        assert type(excinfo.value) is exc
     
     def test_close(self):
         """Test client closure."""
@@ -64,23 +170,131 @@ class TestBaseAPIClient:
         # Should not raise any errors
 
 
+class TestSharedHTTPClient:
+    """Test connection pool sharing across API clients."""
+    
+    def test_polymarket_api_shares_one_client(self):
+        """Test all API clients send requests through one pooled client."""
+        api = PolymarketAPI()
+        
+        assert api.gamma_client.client is api.http_client
+        assert api.clob_client.client is api.http_client
+        assert api.data_client.client is api.http_client
+        api.close()
+    
+    def test_polymarket_api_leaves_injected_client_open(self):
+        """Test an injected HTTP client is shared but left for the caller to close."""
+        http_client = mock_http_client(lambda request: httpx.Response(200, json=[]))
+        api = PolymarketAPI(http_client=http_client)
+        
+        assert api.gamma_client.client is http_client
+        api.close()
+        assert not http_client.is_closed
+        http_client.close()
+    
+    def test_requests_use_client_base_url_and_headers(self):
+        """Test shared client routes by base URL and sends CLOB auth header."""
+        seen = []
+        
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json={"history": []})
+        
+        http_client = mock_http_client(handler)
+        client = CLOBAPIClient(api_key="test-key", http_client=http_client)
+        client._request_with_retry('GET', '/prices-history', params={'market': '0x1'})
+        client.close()
+        
+        assert str(seen[0].url).startswith(client.base_url + "/prices-history")
+        assert seen[0].headers['Authorization'] == "Bearer test-key"
+        assert not http_client.is_closed  # shared client is owned by the caller
+    
+    def test_event_revalidated_with_etag(self, tmp_path):
+        """Test an expired event is revalidated with If-None-Match and reused on 304."""
+        seen = []
+        
+        def handler(request):
+            seen.append(request.headers.get('If-None-Match'))
+            if request.headers.get('If-None-Match') == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json=[{"id": "1", "slug": "some-event", "title": "Event"}],
+                                  headers={"ETag": '"v1"'})
+        
+        client = GammaAPIClient(http_client=mock_http_client(handler))
+        client.metadata_cache = MetadataCache(cache_dir=tmp_path, ttl=0, enabled=True)
+        
+        first = client.get_event_by_slug("some-event")
+        os.utime(client.metadata_cache._path("events", "some-event"), (0, 0))
+        second = client.get_event_by_slug("some-event")
+        
+        assert seen == [None, '"v1"']
+        assert first.title == second.title == "Event"
+
+
+class TestRateLimiter:
+    """Test header-driven RateLimiter."""
+    
+    @patch('polymarket.api.api.time.sleep')
+    def test_no_delay_with_healthy_budget(self, mock_sleep):
+        """Test requests are not delayed while budget is above watermark."""
+        limiter = RateLimiter(low_watermark=5)
+        limiter.update({"X-RateLimit-Remaining": "50", "X-RateLimit-Reset": "60"})
+        
+        limiter.acquire()
+        
+        mock_sleep.assert_not_called()
+    
+    @patch('polymarket.api.api.time.sleep')
+    def test_paces_when_budget_low(self, mock_sleep):
+        """Test requests are spread over the reset window when budget is low."""
+        limiter = RateLimiter(low_watermark=5)
+        limiter.update({"X-RateLimit-Remaining": "2", "X-RateLimit-Reset": "10"})
+        
+        limiter.acquire()
+        
+        mock_sleep.assert_called_once()
+        assert 0 < mock_sleep.call_args[0][0] <= 5
+    
+    @patch('polymarket.api.api.time.sleep')
+    def test_paced_callers_reserve_distinct_slots(self, mock_sleep):
+        """Test back-to-back paced callers are staggered, not woken together."""
+        limiter = RateLimiter(low_watermark=5)
+        limiter.update({"X-RateLimit-Remaining": "2", "X-RateLimit-Reset": "10"})
+        
+        limiter.acquire()
+        limiter.acquire()
+        
+        first, second = (call[0][0] for call in mock_sleep.call_args_list)
+        assert first == pytest.approx(5, abs=0.1)
+        assert second == pytest.approx(10, abs=0.1)
+    
+    @patch('polymarket.api.api.time.sleep')
+    def test_retry_after_blocks(self, mock_sleep):
+        """Test Retry-After header blocks the next request."""
+        limiter = RateLimiter()
+        limiter.update({"Retry-After": "3"})
+        
+        assert limiter.blocked
+        limiter.acquire()
+        
+        assert 0 < mock_sleep.call_args[0][0] <= 3
+    
+    def test_ignores_malformed_headers(self):
+        """Test malformed or missing headers leave the limiter untouched."""
+        limiter = RateLimiter()
+        limiter.update({"X-RateLimit-Remaining": "n/a"})
+        limiter.update(Mock())
+        
+        assert not limiter.blocked
+
+
 class TestCLOBAPIClient:
     """Test CLOBAPIClient class."""
     
     @patch('polymarket.api.api.BaseAPIClient._get')
     def test_search_markets(self, mock_get):
         """Test market search."""
-        mock_get.return_value = {
-            "markets": [
-                {
-                    "condition_id": "0x123",
-                    "question": "Test market?",
-                    "outcomes": ["Yes", "No"],
-                    "tokens": [{"token_id": "0x1"}, {"token_id": "0x2"}],
-                    "active": True
-                }
-            ]
-        }
+        mock_get.return_value = CLOB_SEARCH_RESPONSE
         
         client = CLOBAPIClient()
         markets = client.search_markets("test", limit=10)
@@ -108,18 +322,9 @@ class TestCLOBAPIClient:
             }
         ]
         
-        market = Market(
-            id="1",
-            slug="test",
-            condition_id="0x123",
-            question="Test?",
-            outcomes=["Yes", "No"],
-            token_ids=["0xtoken1", "0xtoken2"]
-        )
-        
         client = CLOBAPIClient()
         histories = client.get_price_history(
-            market,
+            TOKEN_MARKET,
             interval=TimeInterval.ONE_HOUR,
             start_ts=1704110400,
             end_ts=1704117600
@@ -131,31 +336,75 @@ class TestCLOBAPIClient:
         assert len(histories["Yes"].price_points) == 2
         assert histories["Yes"].price_points[0].price == 0.45
     
+    @patch('polymarket.api.api.CLOBAPIClient.get_price_history')
+    def test_get_market_prices_all_outcomes_keeps_outcome_order(self, mock_history):
+        """Test concurrent per-outcome requests are mapped back to outcomes."""
+        mock_history.side_effect = lambda token_id, *args: PriceHistory(
+            market_id=token_id,
+            token_id=token_id,
+            outcome='',
+            interval=TimeInterval.ONE_HOUR,
+            start_time=None,
+            end_time=None
+        )
+        
+        client = CLOBAPIClient()
+        histories = client.get_market_prices_all_outcomes(
+            ["0xtoken1", "0xtoken2", "0xtoken3"], ["A", "B", "C"]
+        )
+        
+        assert list(histories) == ["A", "B", "C"]
+        assert [h.token_id for h in histories.values()] == ["0xtoken1", "0xtoken2", "0xtoken3"]
+        assert histories["B"].outcome == "B"
+        assert mock_history.call_count == 3
+    
+    def test_get_market_prices_all_outcomes_shares_one_cap(self):
+        """Test concurrent markets fan out through one bounded pool."""
+        lock = threading.Lock()
+        in_flight = [0, 0]  # current, peak
+        
+        def fake_history(token_id, *args):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight[1], in_flight[0])
+            time.sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+            return None
+        
+        client = CLOBAPIClient()
+        with patch.object(client, 'get_price_history', side_effect=fake_history), \
+             ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as markets_pool:
+            list(markets_pool.map(
+                lambda _: client.get_market_prices_all_outcomes(["0x1", "0x2", "0x3"], ["A", "B", "C"]),
+                range(MAX_CONCURRENT_REQUESTS)
+            ))
+        client.close()
+        
+        assert in_flight[1] <= MAX_CONCURRENT_REQUESTS
+    
+    def test_get_price_history_interval_too_long(self):
+        """Test an over-long range raises IntervalTooLongError instead of returning None."""
+        def handler(request):
+            if 'startTs' in request.url.params:
+                return httpx.Response(
+                    400, json={"error": "invalid filters: 'startTs' and 'endTs' interval is too long"}
+                )
+            return httpx.Response(400, json={"error": "bad market"})
+        
+        client = CLOBAPIClient(http_client=mock_http_client(handler))
+        
+        with pytest.raises(IntervalTooLongError):
+            client.get_price_history("0x1", "1h", start_ts=1, end_ts=2)
+        assert client.get_price_history("0x1", "1h") is None
+    
     @patch('polymarket.api.api.BaseAPIClient._get')
     def test_get_order_books(self, mock_get):
         """Test getting order books."""
-        mock_get.return_value = {
-            "0xtoken1": {
-                "bids": [{"price": "0.45", "size": "1000"}],
-                "asks": [{"price": "0.46", "size": "1500"}]
-            },
-            "0xtoken2": {
-                "bids": [{"price": "0.54", "size": "2000"}],
-                "asks": [{"price": "0.55", "size": "2500"}]
-            }
-        }
-        
-        market = Market(
-            id="1",
-            slug="test",
-            condition_id="0x123",
-            question="Test?",
-            outcomes=["Yes", "No"],
-            token_ids=["0xtoken1", "0xtoken2"]
-        )
+        mock_get.return_value = CLOB_ORDER_BOOKS_RESPONSE
         
         client = CLOBAPIClient()
-        order_books = client.get_order_books(market)
+        order_books = client.get_order_books(TOKEN_MARKET)
         
         assert "Yes" in order_books.books
         assert "No" in order_books.books
@@ -169,15 +418,7 @@ class TestGammaAPIClient:
     @patch('polymarket.api.api.BaseAPIClient._get')
     def test_get_market(self, mock_get):
         """Test getting market by slug."""
-        mock_get.return_value = {
-            "id": "market-123",
-            "slug": "test-market",
-            "conditionId": "0x123",
-            "question": "Test market?",
-            "outcomes": ["Yes", "No"],
-            "active": True,
-            "volume": "1000000"
-        }
+        mock_get.return_value = GAMMA_MARKET_RESPONSE
         
         client = GammaAPIClient()
         market = client.get_market("test-market")
@@ -190,23 +431,7 @@ class TestGammaAPIClient:
     @patch('polymarket.api.api.BaseAPIClient._get')
     def test_get_event(self, mock_get):
         """Test getting event by slug."""
-        mock_get.return_value = {
-            "id": "event-123",
-            "slug": "test-event",
-            "title": "Test Event",
-            "description": "Test description",
-            "markets": [
-                {
-                    "id": "market-1",
-                    "slug": "market-1",
-                    "conditionId": "0x1",
-                    "question": "Market 1?",
-                    "outcomes": ["Yes", "No"]
-                }
-            ],
-            "liquidity": "10000000",
-            "volume": "50000000"
-        }
+        mock_get.return_value = GAMMA_EVENT_RESPONSE
         
         client = GammaAPIClient()
         event = client.get_event("test-event")
@@ -224,23 +449,7 @@ class TestDataAPIClient:
     @patch('polymarket.api.data_api.BaseAPIClient._get')
     def test_get_user_positions(self, mock_get):
         """Test getting user positions."""
-        mock_get.return_value = {
-            "positions": [
-                {
-                    "market": {
-                        "condition_id": "0x123",
-                        "question": "Test market?",
-                        "slug": "test-market"
-                    },
-                    "outcome": "Yes",
-                    "size": "1000",
-                    "average_price": "0.45",
-                    "current_price": "0.50",
-                    "value": "500",
-                    "pnl": "50"
-                }
-            ]
-        }
+        mock_get.return_value = DATA_POSITIONS_RESPONSE
         
         client = DataAPIClient()
         positions = client.get_user_positions("0xuser123")
@@ -253,22 +462,7 @@ class TestDataAPIClient:
     @patch('polymarket.api.data_api.BaseAPIClient._get')
     def test_get_market_holders(self, mock_get):
         """Test getting market holders."""
-        mock_get.return_value = {
-            "holders": [
-                {
-                    "user": "0xholder1",
-                    "outcome": "Yes",
-                    "size": "10000",
-                    "value": "5000"
-                },
-                {
-                    "user": "0xholder2",
-                    "outcome": "Yes",
-                    "size": "5000",
-                    "value": "2500"
-                }
-            ]
-        }
+        mock_get.return_value = DATA_HOLDERS_RESPONSE
         
         client = DataAPIClient()
         holders = client.get_market_holders("0x123", outcome="Yes")
@@ -284,15 +478,7 @@ class TestPolymarketAPI:
     @patch('polymarket.api.api.CLOBAPIClient.get_market')
     def test_get_market_clob_success(self, mock_clob_get):
         """Test getting market with CLOB success."""
-        mock_market = Market(
-            id="1",
-            slug="test",
-            condition_id="0x123",
-            question="Test?",
-            outcomes=["Yes", "No"],
-            token_ids=["0x1", "0x2"]
-        )
-        mock_clob_get.return_value = mock_market
+        mock_clob_get.return_value = SAMPLE_MARKET
         
         api = PolymarketAPI()
         market = api.get_market("test")
@@ -306,18 +492,35 @@ class TestPolymarketAPI:
         """Test fallback to Gamma API when CLOB fails."""
         mock_clob_get.return_value = None
         
-        mock_market = Market(
-            id="1",
-            slug="test",
-            condition_id="0x123",
-            question="Test?",
-            outcomes=["Yes", "No"]
-        )
-        mock_gamma_get.return_value = mock_market
+        mock_gamma_get.return_value = make_market(token_ids=[])
         
         api = PolymarketAPI()
         market = api.get_market("test")
         
         assert market.slug == "test"
         mock_clob_get.assert_called_once()
-        mock_gamma_get.assert_called_once()
\ No newline at end of file
+        mock_gamma_get.assert_called_once()
+    
+    def test_search_markets_merges_gamma_results(self):
+        """Test Gamma results fill in after CLOB results without duplicates."""
+        api = PolymarketAPI()
+        with patch.object(api.clob_client, 'search_markets', return_value=[make_market(slug="a")]), \
+             patch.object(api.gamma_client, 'search_markets',
+                          return_value=[make_market(slug=slug) for slug in "abc"]) as gamma_search:
+            results = api.search_markets("test", limit=2)
+        api.close()
+        
+        assert [m.slug for m in results] == ["a", "b"]
+        gamma_search.assert_called_once_with("test", 1)
+    
+    def test_search_markets_skips_gamma_when_clob_fills_limit(self):
+        """Test the Gamma search never runs once CLOB results fill the limit."""
+        api = PolymarketAPI()
+        with patch.object(api.clob_client, 'search_markets',
+                          return_value=[make_market(slug=slug) for slug in "ab"]), \
+             patch.object(api.gamma_client, 'search_markets') as gamma_search:
+            results = api.search_markets("test", limit=2)
+        api.close()
+        
+        assert [m.slug for m in results] == ["a", "b"]
+        gamma_search.assert_not_called()
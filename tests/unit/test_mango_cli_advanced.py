@@ -4,50 +4,140 @@ Comprehensive tests for mango CLI advanced features.
 
 import pytest
 import json
-from unittest.mock import Mock, patch, MagicMock, call
-from io import StringIO
+from unittest.mock import patch
 import sys
+from types import MappingProxyType, SimpleNamespace
 
-from mango_cli import MangoCLI, create_parser
+from mango_cli import create_parser
+from tests.fixtures.models import SAMPLE_MARKET, make_market
+
+
+# Read-only markets-advanced arguments shared by the command tests
+MARKETS_ADVANCED_BASIC_KWARGS = MappingProxyType({
+    'limit': 50,
+    'offset': 0,
+    'sort': 'volume',
+    'ascending': False,
+    'format': 'table'
+})
+
+MARKETS_ADVANCED_COMPLEX_KWARGS = MappingProxyType({
+    'limit': 100,
+    'offset': 50,
+    'sort': 'liquidity',
+    'ascending': True,
+    'format': 'json',
+    'output': 'test_output.json',
+    'active': True,
+    'closed': False,
+    'archived': False,
+    'ids': [123, 456, 789],
+    'slugs': ['market-1', 'market-2'],
+    'condition_ids': ['0xcond1', '0xcond2'],
+    'token_ids': ['0xtoken1', '0xtoken2'],
+    'min_volume': 100000,
+    'max_volume': 5000000,
+    'min_liquidity': 50000,
+    'max_liquidity': 1000000,
+    'tag': 5,
+    'related_tags': True,
+    'clob_only': True,
+    'start_after': '2024-01-01',
+    'start_before': '2024-06-30',
+    'end_after': '2024-07-01',
+    'end_before': '2024-12-31'
+})
+
+
+# (argv, expected parsed attributes) for the argument parsing tests
+PARSER_CASES = [
+    ([
+        'search', 'bitcoin',
+        '--limit', '50',
+        '--inactive',
+        '--archived',
+        '--min-volume', '100000',
+        '--max-volume', '5000000',
+        '--min-liquidity', '50000',
+        '--max-liquidity', '1000000',
+        '--tag', '5',
+        '--start-after', '2024-01-01',
+        '--end-before', '2024-12-31'
+    ], {
+        'command': 'search', 'query': 'bitcoin', 'limit': 50,
+        'inactive': True, 'archived': True,
+        'min_volume': 100000, 'max_volume': 5000000,
+        'min_liquidity': 50000, 'max_liquidity': 1000000,
+        'tag': 5, 'start_after': '2024-01-01', 'end_before': '2024-12-31'
+    }),
+    ([
+        'markets-advanced',
+        '--ids', '123', '456',
+        '--slugs', 'market-1', 'market-2',
+        '--condition-ids', '0x1', '0x2',
+        '--token-ids', '0xa', '0xb',
+        '--tag', '5',
+        '--related-tags',
+        '--min-volume', '100000',
+        '--max-volume', '5000000',
+        '--active',
+        '--clob-only',
+        '--sort', 'liquidity',
+        '--ascending',
+        '--format', 'json',
+        '-o', 'output.json'
+    ], {
+        'command': 'markets-advanced', 'ids': [123, 456],
+        'slugs': ['market-1', 'market-2'], 'condition_ids': ['0x1', '0x2'],
+        'token_ids': ['0xa', '0xb'], 'tag': 5, 'related_tags': True,
+        'min_volume': 100000, 'max_volume': 5000000, 'active': True,
+        'clob_only': True, 'sort': 'liquidity', 'ascending': True,
+        'format': 'json', 'output': 'output.json'
+    }),
+    (['tags', '17', '--type', 'events', '--related', '--limit', '100'], {
+        'command': 'tags', 'tag_id': 17, 'type': 'events', 'related': True, 'limit': 100
+    }),
+    # Defaults
+    (['search', 'test'], {
+        'limit': 20, 'inactive': False, 'archived': False,
+        'min_volume': 0, 'max_volume': None
+    }),
+    (['markets-advanced'], {
+        'limit': 100, 'offset': 0, 'sort': 'volume', 'ascending': False, 'format': 'table'
+    }),
+    (['tags', '5'], {'type': 'markets', 'related': False, 'limit': 50}),
+]
+PARSER_CASE_IDS = [
+    'search', 'markets-advanced', 'tags',
+    'search-defaults', 'markets-advanced-defaults', 'tags-defaults',
+]
 
 
 class TestMangoCLIAdvancedSearch:
     """Test advanced search functionality in mango CLI."""
     
-    @pytest.fixture
-    def cli(self):
-        """Create MangoCLI instance."""
-        with patch('mango_cli.PolymarketAPI'):
-            return MangoCLI()
-    
     @pytest.fixture
     def sample_markets(self):
         """Create sample market objects."""
-        markets = []
-        for i in range(3):
-            market = Mock()
-            market.id = i + 1
-            market.slug = f"test-market-{i+1}"
-            market.question = f"Will test {i+1} happen?"
-            market.volume = (i + 1) * 100000
-            market.liquidity = (i + 1) * 50000
-            market.active = True
-            market.archived = False
-            markets.append(market)
-        return markets
+        return [
+            make_market(
+                id=i + 1,
+                slug=f"test-market-{i+1}",
+                question=f"Will test {i+1} happen?",
+                volume=(i + 1) * 100000,
+                liquidity=(i + 1) * 50000
+            )
+            for i in range(3)
+        ]
     
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_cmd_search_basic(self, mock_stdout, cli):
+    def test_cmd_search_basic(self, cli, capsys):
         """Test basic search command."""
-        cli.api.gamma_client.get_markets.return_value = []
-        
         cli.cmd_search("bitcoin", limit=10)
         
         cli.api.gamma_client.get_markets.assert_called_once()
-        assert "No markets found" in mock_stdout.getvalue()
+        assert "No markets found" in capsys.readouterr().out
     
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_cmd_search_with_filters(self, mock_stdout, cli, sample_markets):
+    def test_cmd_search_with_filters(self, cli, sample_markets, capsys):
         """Test search with all filter parameters."""
         cli.api.gamma_client.get_markets.return_value = sample_markets
         
@@ -66,209 +156,140 @@ class TestMangoCLIAdvancedSearch:
         )
         
         # Verify API call parameters
-        call_args = cli.api.gamma_client.get_markets.call_args[1]
-        assert call_args['limit'] == 1000  # Gets more to filter
-        assert call_args['active'] == True
-        assert call_args['archived'] == False
-        assert call_args['volume_num_min'] == 50000
-        assert call_args['volume_num_max'] == 1000000
-        assert call_args['liquidity_num_min'] == 25000
-        assert call_args['liquidity_num_max'] == 500000
-        assert call_args['tag_id'] == 5
-        assert call_args['start_date_min'] == "2024-01-01T00:00:00Z"
-        assert call_args['end_date_max'] == "2024-12-31T23:59:59Z"
-        
-        output = mock_stdout.getvalue()
+        call_args = cli.api.gamma_client.get_markets.call_args.kwargs
+        expected = {
+            'limit': 1000,  # Gets more to filter
+            'active': True,
+            'archived': False,
+            'volume_num_min': 50000,
+            'volume_num_max': 1000000,
+            'liquidity_num_min': 25000,
+            'liquidity_num_max': 500000,
+            'tag_id': 5,
+            'start_date_min': "2024-01-01T00:00:00Z",
+            'end_date_max': "2024-12-31T23:59:59Z"
+        }
+        assert {key: call_args.get(key) for key in expected} == expected
+        
+        output = capsys.readouterr().out
         assert "Found 3 markets" in output
         assert "test-market-1" in output
     
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_cmd_search_query_filtering(self, mock_stdout, cli, sample_markets):
+    def test_cmd_search_query_filtering(self, cli, sample_markets, capsys):
         """Test that search properly filters by query text."""
         # Add a market that doesn't match
-        non_matching = Mock()
-        non_matching.slug = "other-market"
-        non_matching.question = "Different topic?"
-        non_matching.volume = 500000
-        non_matching.liquidity = 100000
-        non_matching.active = True
-        non_matching.archived = False
+        non_matching = make_market(
+            slug="other-market",
+            question="Different topic?",
+            volume=500000,
+            liquidity=100000
+        )
         
         all_markets = sample_markets + [non_matching]
         cli.api.gamma_client.get_markets.return_value = all_markets
         
         cli.cmd_search("test", limit=10)
         
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         assert "Found 3 markets" in output  # Only test markets
         assert "other-market" not in output
     
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_cmd_search_archived_status(self, mock_stdout, cli):
+    def test_cmd_search_archived_status(self, cli, capsys):
         """Test archived market display."""
-        archived_market = Mock()
-        archived_market.slug = "archived-market"
-        archived_market.question = "Old question?"
-        archived_market.volume = 100000
-        archived_market.liquidity = 50000
-        archived_market.active = False
-        archived_market.archived = True
+        archived_market = make_market(
+            slug="archived-market",
+            question="Old question?",
+            volume=100000,
+            liquidity=50000,
+            active=False,
+            archived=True
+        )
         
         cli.api.gamma_client.get_markets.return_value = [archived_market]
         
         cli.cmd_search("old", archived=True)
         
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         assert "Archived" in output
 
 
 class TestMangoCLIMarketsAdvanced:
     """Test markets-advanced command functionality."""
     
-    @pytest.fixture
-    def cli(self):
-        """Create MangoCLI instance."""
-        with patch('mango_cli.PolymarketAPI'):
-            return MangoCLI()
-    
-    @pytest.fixture
-    def kwargs_basic(self):
-        """Basic kwargs for markets-advanced."""
-        return {
-            'limit': 50,
-            'offset': 0,
-            'sort': 'volume',
-            'ascending': False,
-            'format': 'table'
-        }
-    
-    @pytest.fixture
-    def kwargs_complex(self):
-        """Complex kwargs with all parameters."""
-        return {
-            'limit': 100,
-            'offset': 50,
-            'sort': 'liquidity',
-            'ascending': True,
-            'format': 'json',
-            'output': 'test_output.json',
-            'active': True,
-            'closed': False,
-            'archived': False,
-            'ids': [123, 456, 789],
-            'slugs': ['market-1', 'market-2'],
-            'condition_ids': ['0xcond1', '0xcond2'],
-            'token_ids': ['0xtoken1', '0xtoken2'],
-            'min_volume': 100000,
-            'max_volume': 5000000,
-            'min_liquidity': 50000,
-            'max_liquidity': 1000000,
-            'tag': 5,
-            'related_tags': True,
-            'clob_only': True,
-            'start_after': '2024-01-01',
-            'start_before': '2024-06-30',
-            'end_after': '2024-07-01',
-            'end_before': '2024-12-31'
-        }
-    
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_cmd_markets_advanced_basic(self, mock_stdout, cli, kwargs_basic):
+    def test_cmd_markets_advanced_basic(self, cli, capsys):
         """Test basic markets-advanced command."""
-        cli.api.gamma_client.get_markets.return_value = []
-        
-        cli.cmd_markets_advanced(**kwargs_basic)
+        cli.cmd_markets_advanced(**MARKETS_ADVANCED_BASIC_KWARGS)
         
         cli.api.gamma_client.get_markets.assert_called_once()
-        assert "No markets found" in mock_stdout.getvalue()
+        assert "No markets found" in capsys.readouterr().out
     
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_cmd_markets_advanced_complex_filters(self, mock_stdout, cli, kwargs_complex):
+    def test_cmd_markets_advanced_complex_filters(self, cli, tmp_path):
         """Test markets-advanced with all parameters."""
-        market = Mock()
-        market.id = 123
-        market.slug = "test-market"
-        market.question = "Test question?"
-        market.condition_id = "0x123"
-        market.volume = 1000000
-        market.liquidity = 200000
-        market.active = True
-        market.closed = False
-        market.archived = False
-        market.outcomes = ["Yes", "No"]
-        market.token_ids = ["0xtoken1", "0xtoken2"]
-        market.created_at = None
-        market.end_date = None
+        market = make_market(
+            id=123,
+            slug="test-market",
+            question="Test question?",
+            condition_id="0x123",
+            volume=1000000,
+            liquidity=200000,
+            token_ids=["0xtoken1", "0xtoken2"]
+        )
         
         cli.api.gamma_client.get_markets.return_value = [market]
         
-        # Mock file writing
-        with patch('builtins.open', create=True) as mock_open:
-            mock_file = MagicMock()
-            mock_open.return_value.__enter__.return_value = mock_file
-            
-            cli.cmd_markets_advanced(**kwargs_complex)
+        output_path = tmp_path / 'test_output.json'
+        cli.cmd_markets_advanced(**{**MARKETS_ADVANCED_COMPLEX_KWARGS, 'output': str(output_path)})
         
         # Verify API call
-        call_args = cli.api.gamma_client.get_markets.call_args[1]
-        assert call_args['limit'] == 100
-        assert call_args['offset'] == 50
-        assert call_args['order'] == 'liquidity'
-        assert call_args['ascending'] == True
-        assert call_args['active'] == True
-        assert call_args['id'] == [123, 456, 789]
-        assert call_args['slug'] == ['market-1', 'market-2']
-        assert call_args['volume_num_min'] == 100000
-        assert call_args['tag_id'] == 5
-        assert call_args['enableOrderBook'] == True
+        call_args = cli.api.gamma_client.get_markets.call_args.kwargs
+        expected = {
+            'limit': 100,
+            'offset': 50,
+            'order': 'liquidity',
+            'ascending': True,
+            'active': True,
+            'id': [123, 456, 789],
+            'slug': ['market-1', 'market-2'],
+            'volume_num_min': 100000,
+            'tag_id': 5,
+            'enableOrderBook': True
+        }
+        assert {key: call_args.get(key) for key in expected} == expected
         
         # Verify file was written
-        mock_open.assert_called_once_with('test_output.json', 'w')
-        mock_file.write.assert_called()
+        saved = json.loads(output_path.read_text())
+        assert [m['slug'] for m in saved] == ['test-market']
+        assert saved[0]['token_ids'] == ["0xtoken1", "0xtoken2"]
     
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_cmd_markets_advanced_table_output(self, mock_stdout, cli, kwargs_basic):
+    def test_cmd_markets_advanced_table_output(self, cli, capsys):
         """Test table output format."""
-        markets = []
-        for i in range(3):
-            market = Mock()
-            market.id = i + 1
-            market.slug = f"market-{i+1}"
-            market.question = f"Question {i+1}?"
-            market.volume = (i + 1) * 100000
-            market.liquidity = (i + 1) * 50000
-            market.active = True if i < 2 else False
-            market.archived = True if i == 2 else False
-            markets.append(market)
+        markets = [
+            make_market(
+                id=i + 1,
+                slug=f"market-{i+1}",
+                question=f"Question {i+1}?",
+                volume=(i + 1) * 100000,
+                liquidity=(i + 1) * 50000,
+                active=i < 2,
+                archived=i == 2
+            )
+            for i in range(3)
+        ]
         
         cli.api.gamma_client.get_markets.return_value = markets
         
-        cli.cmd_markets_advanced(**kwargs_basic)
+        cli.cmd_markets_advanced(**MARKETS_ADVANCED_BASIC_KWARGS)
         
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         assert "Found 3 markets" in output
         assert "market-1" in output
         assert "Active" in output
         assert "Archived" in output
     
-    @patch('sys.stdout', new_callable=StringIO)
     @patch('json.dump')
-    def test_cmd_markets_advanced_json_output_stdout(self, mock_json_dump, mock_stdout, cli):
+    def test_cmd_markets_advanced_json_output_stdout(self, mock_json_dump, cli, capsys):
         """Test JSON output to stdout."""
-        market = Mock()
-        market.id = 1
-        market.slug = "test"
-        market.question = "Test?"
-        market.condition_id = "0x123"
-        market.volume = 100000
-        market.liquidity = 50000
-        market.active = True
-        market.closed = False
-        market.archived = False
-        market.outcomes = ["Yes", "No"]
-        market.token_ids = ["0x1", "0x2"]
-        market.created_at = None
-        market.end_date = None
+        market = make_market(id=1, condition_id="0x123", volume=100000, liquidity=50000)
         
         cli.api.gamma_client.get_markets.return_value = [market]
         
@@ -283,13 +304,11 @@ class TestMangoCLIMarketsAdvanced:
         cli.cmd_markets_advanced(**kwargs)
         
         # Verify JSON output structure
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         assert "Found 1 markets" in output
     
     def test_cmd_markets_advanced_date_conversion(self, cli):
         """Test date parameter conversion."""
-        cli.api.gamma_client.get_markets.return_value = []
-        
         kwargs = {
             'start_after': '2024-01-01',
             'start_before': '2024-06-30',
@@ -299,33 +318,29 @@ class TestMangoCLIMarketsAdvanced:
         
         cli.cmd_markets_advanced(**kwargs)
         
-        call_args = cli.api.gamma_client.get_markets.call_args[1]
-        assert call_args['start_date_min'] == '2024-01-01T00:00:00Z'
-        assert call_args['start_date_max'] == '2024-06-30T23:59:59Z'
-        assert call_args['end_date_min'] == '2024-07-01T00:00:00Z'
-        assert call_args['end_date_max'] == '2024-12-31T23:59:59Z'
+        call_args = cli.api.gamma_client.get_markets.call_args.kwargs
+        expected = {
+            'start_date_min': '2024-01-01T00:00:00Z',
+            'start_date_max': '2024-06-30T23:59:59Z',
+            'end_date_min': '2024-07-01T00:00:00Z',
+            'end_date_max': '2024-12-31T23:59:59Z'
+        }
+        assert {key: call_args.get(key) for key in expected} == expected
 
 
 class TestMangoCLITags:
     """Test tags command functionality."""
     
-    @pytest.fixture
-    def cli(self):
-        """Create MangoCLI instance."""
-        with patch('mango_cli.PolymarketAPI'):
-            return MangoCLI()
-    
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_cmd_tags_markets(self, mock_stdout, cli):
+    def test_cmd_tags_markets(self, cli, capsys):
         """Test tags command for markets."""
-        markets = []
-        for i in range(3):
-            market = Mock()
-            market.slug = f"tagged-market-{i+1}"
-            market.question = f"Tagged question {i+1}?"
-            market.volume = (i + 1) * 100000
-            market.active = True
-            markets.append(market)
+        markets = [
+            make_market(
+                slug=f"tagged-market-{i+1}",
+                question=f"Tagged question {i+1}?",
+                volume=(i + 1) * 100000
+            )
+            for i in range(3)
+        ]
         
         cli.api.gamma_client.get_markets_by_tags.return_value = markets
         
@@ -333,23 +348,23 @@ class TestMangoCLITags:
         
         cli.api.gamma_client.get_markets_by_tags.assert_called_once_with(5, include_related=False)
         
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         assert "Searching for markets with tag ID 5" in output
         assert "Found 3 markets" in output
         assert "tagged-market-1" in output
     
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_cmd_tags_events(self, mock_stdout, cli):
+    def test_cmd_tags_events(self, cli, capsys):
         """Test tags command for events."""
-        events = []
-        for i in range(2):
-            event = Mock()
-            event.slug = f"tagged-event-{i+1}"
-            event.title = f"Tagged Event {i+1}"
-            event.markets = [Mock() for _ in range(i + 2)]
-            event.volume = (i + 1) * 500000
-            event.active = True
-            events.append(event)
+        events = [
+            SimpleNamespace(
+                slug=f"tagged-event-{i+1}",
+                title=f"Tagged Event {i+1}",
+                markets=[SAMPLE_MARKET] * (i + 2),
+                volume=(i + 1) * 500000,
+                active=True
+            )
+            for i in range(2)
+        ]
         
         cli.api.gamma_client.get_events_by_tags.return_value = events
         
@@ -357,155 +372,50 @@ class TestMangoCLITags:
         
         cli.api.gamma_client.get_events_by_tags.assert_called_once_with(10, include_related=True)
         
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         assert "Searching for events with tag ID 10" in output
         assert "Found 2 events" in output
         assert "tagged-event-1" in output
         assert "2" in output  # Number of markets
     
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_cmd_tags_no_results(self, mock_stdout, cli):
+    def test_cmd_tags_no_results(self, cli, capsys):
         """Test tags command with no results."""
-        cli.api.gamma_client.get_markets_by_tags.return_value = []
-        
         cli.cmd_tags(tag_id=99, type="markets", related=False, limit=10)
         
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         assert "No markets found with tag ID 99" in output
     
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_cmd_tags_limit_applied(self, mock_stdout, cli):
+    def test_cmd_tags_limit_applied(self, cli, capsys):
         """Test that limit is properly applied."""
         # Create more markets than limit
-        markets = [Mock() for _ in range(10)]
-        for i, market in enumerate(markets):
-            market.slug = f"market-{i}"
-            market.question = f"Question {i}?"
-            market.volume = 100000
-            market.active = True
+        markets = [
+            make_market(slug=f"market-{i}", question=f"Question {i}?", volume=100000)
+            for i in range(10)
+        ]
         
         cli.api.gamma_client.get_markets_by_tags.return_value = markets
         
         cli.cmd_tags(tag_id=5, type="markets", related=False, limit=3)
         
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         assert "Found 3 markets" in output  # Should only show 3
         assert "market-0" in output
         assert "market-2" in output
         assert "market-3" not in output  # Beyond limit
 
 
+@pytest.fixture(scope="module")
+def parser():
+    """Build the parser once; parse_args does not mutate it."""
+    return create_parser()
+
+
 class TestMangoCLIArgumentParsing:
     """Test CLI argument parsing."""
     
-    def test_search_parser(self):
-        """Test search command parser."""
-        parser = create_parser()
-        
-        args = parser.parse_args([
-            'search', 'bitcoin',
-            '--limit', '50',
-            '--inactive',
-            '--archived',
-            '--min-volume', '100000',
-            '--max-volume', '5000000',
-            '--min-liquidity', '50000',
-            '--max-liquidity', '1000000',
-            '--tag', '5',
-            '--start-after', '2024-01-01',
-            '--end-before', '2024-12-31'
-        ])
-        
-        assert args.command == 'search'
-        assert args.query == 'bitcoin'
-        assert args.limit == 50
-        assert args.inactive == True
-        assert args.archived == True
-        assert args.min_volume == 100000
-        assert args.max_volume == 5000000
-        assert args.min_liquidity == 50000
-        assert args.max_liquidity == 1000000
-        assert args.tag == 5
-        assert args.start_after == '2024-01-01'
-        assert args.end_before == '2024-12-31'
-    
-    def test_markets_advanced_parser(self):
-        """Test markets-advanced command parser."""
-        parser = create_parser()
-        
-        args = parser.parse_args([
-            'markets-advanced',
-            '--ids', '123', '456',
-            '--slugs', 'market-1', 'market-2',
-            '--condition-ids', '0x1', '0x2',
-            '--token-ids', '0xa', '0xb',
-            '--tag', '5',
-            '--related-tags',
-            '--min-volume', '100000',
-            '--max-volume', '5000000',
-            '--active',
-            '--clob-only',
-            '--sort', 'liquidity',
-            '--ascending',
-            '--format', 'json',
-            '-o', 'output.json'
-        ])
-        
-        assert args.command == 'markets-advanced'
-        assert args.ids == [123, 456]
-        assert args.slugs == ['market-1', 'market-2']
-        assert args.condition_ids == ['0x1', '0x2']
-        assert args.token_ids == ['0xa', '0xb']
-        assert args.tag == 5
-        assert args.related_tags == True
-        assert args.min_volume == 100000
-        assert args.max_volume == 5000000
-        assert args.active == True
-        assert args.clob_only == True
-        assert args.sort == 'liquidity'
-        assert args.ascending == True
-        assert args.format == 'json'
-        assert args.output == 'output.json'
-    
-    def test_tags_parser(self):
-        """Test tags command parser."""
-        parser = create_parser()
-        
-        args = parser.parse_args([
-            'tags', '17',
-            '--type', 'events',
-            '--related',
-            '--limit', '100'
-        ])
-        
-        assert args.command == 'tags'
-        assert args.tag_id == 17
-        assert args.type == 'events'
-        assert args.related == True
-        assert args.limit == 100
-    
-    def test_parser_defaults(self):
-        """Test parser default values."""
-        parser = create_parser()
-        
-        # Test search defaults
-        args = parser.parse_args(['search', 'test'])
-        assert args.limit == 20
-        assert args.inactive == False
-        assert args.archived == False
-        assert args.min_volume == 0
-        assert args.max_volume is None
-        
-        # Test markets-advanced defaults
-        args = parser.parse_args(['markets-advanced'])
-        assert args.limit == 100
-        assert args.offset == 0
-        assert args.sort == 'volume'
-        assert args.ascending == False
-        assert args.format == 'table'
-        
-        # Test tags defaults
-        args = parser.parse_args(['tags', '5'])
-        assert args.type == 'markets'
-        assert args.related == False
-        assert args.limit == 50
\ No newline at end of file
+    @pytest.mark.parametrize("argv,expected", PARSER_CASES, ids=PARSER_CASE_IDS)
+    def test_parse_args(self, parser, argv, expected):
+        """Test that each command line parses to the expected arguments."""
+        args = parser.parse_args(argv)
+        
+        assert {key: getattr(args, key) for key in expected} == expected
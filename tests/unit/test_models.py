@@ -2,6 +2,7 @@
 Unit tests for data models.
 """
 
+import numpy as np
 import pytest
 from datetime import datetime
 from polymarket.models.models import (
@@ -11,12 +12,16 @@ from polymarket.models.models import (
 from polymarket.models.orderbook import OrderBook, OrderLevel, MarketOrderBooks
 
 
+# Every hour of 2024-01-01, built once for the price tests
+HOURLY_TIMESTAMPS = tuple(datetime(2024, 1, 1, hour) for hour in range(24))
+
+
 class TestPricePoint:
     """Test PricePoint model."""
     
     def test_initialization(self):
         """Test PricePoint initialization."""
-        timestamp = datetime(2024, 1, 1, 12, 0)
+        timestamp = HOURLY_TIMESTAMPS[12]
         pp = PricePoint(timestamp=timestamp, price=0.45)
         
         assert pp.timestamp == timestamp
@@ -37,7 +42,7 @@ class TestPriceHistory:
     def test_initialization(self):
         """Test PriceHistory initialization."""
         price_points = [
-            PricePoint(timestamp=datetime(2024, 1, 1, i), price=0.45 + i * 0.01)
+            PricePoint(timestamp=HOURLY_TIMESTAMPS[i], price=0.45 + i * 0.01)
             for i in range(5)
         ]
         
@@ -58,9 +63,9 @@ class TestPriceHistory:
     def test_properties(self):
         """Test computed properties."""
         price_points = [
-            PricePoint(timestamp=datetime(2024, 1, 1, 0), price=0.40),
-            PricePoint(timestamp=datetime(2024, 1, 1, 1), price=0.45),
-            PricePoint(timestamp=datetime(2024, 1, 1, 2), price=0.50),
+            PricePoint(timestamp=HOURLY_TIMESTAMPS[0], price=0.40),
+            PricePoint(timestamp=HOURLY_TIMESTAMPS[1], price=0.45),
+            PricePoint(timestamp=HOURLY_TIMESTAMPS[2], price=0.50),
         ]
         
         history = PriceHistory(
@@ -77,6 +82,29 @@ class TestPriceHistory:
         assert history.price_change == 0.10
         assert history.price_change_percent == 25.0
     
+    def test_array_views(self):
+        """Test prices and timestamps arrays track the price points."""
+        history = PriceHistory(
+            market_id="1",
+            token_id="0x1",
+            outcome="Yes",
+            interval=TimeInterval.ONE_HOUR,
+            start_time=None,
+            end_time=None,
+            price_points=[
+                PricePoint(timestamp=HOURLY_TIMESTAMPS[i], price=0.40 + i * 0.05)
+                for i in range(3)
+            ]
+        )
+    
+        assert history.prices.dtype == np.float64
+        assert history.prices.tolist() == [point.price for point in history.price_points]
+        assert history.timestamps.astype(datetime).tolist() == list(HOURLY_TIMESTAMPS[:3])
+    
+        history.price_points.append(PricePoint(timestamp=HOURLY_TIMESTAMPS[3], price=0.60))
+        assert history.prices[-1] == 0.60
+        assert len(history.timestamps) == 4
+    
     def test_empty_history(self):
         """Test properties with empty history."""
         history = PriceHistory(
@@ -154,7 +182,25 @@ class TestMarket:
             neg_risk_market_id="group-123"
         )
         assert market3.is_inactive_negrisk_option() is False
-    
+
+    def test_has_tradeable_tokens(self):
+        """Test tradeable token detection."""
+        def make_market(token_ids):
+            return Market(
+                slug="test",
+                condition_id="0x1",
+                question="Test?",
+                outcomes=["Yes", "No"],
+                token_ids=token_ids,
+                active=True,
+                closed=False
+            )
+
+        assert make_market(["0x1", "0x2"]).has_tradeable_tokens is True
+        assert make_market(["", "0x2"]).has_tradeable_tokens is True
+        assert make_market(["", ""]).has_tradeable_tokens is False
+        assert make_market([]).has_tradeable_tokens is False
+
     def test_from_gamma_api(self):
         """Test creating Market from Gamma API data."""
         data = {
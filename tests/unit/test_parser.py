@@ -10,9 +10,10 @@ from polymarket.utils.exceptions import InvalidURLError
 class TestPolymarketURLParser:
     """Test PolymarketURLParser class."""
     
-    def setup_method(self):
-        """Set up test instance."""
-        self.parser = PolymarketURLParser()
+    @pytest.fixture(autouse=True)
+    def _bind_parser(self, url_parser):
+        """Use the session's shared parser instance."""
+        self.parser = url_parser
     
     def test_parse_event_market_url(self):
         """Test parsing event/market URLs."""
@@ -122,4 +123,18 @@ class TestPolymarketURLParser:
     def test_build_market_url(self):
         """Test build_market_url method."""
         url = self.parser.build_market_url("event-slug", "market-slug")
-        assert url == "https://polymarket.com/event/event-slug/market-slug"
\ No newline at end of file
+        assert url == "https://polymarket.com/event/event-slug/market-slug"
+    
+    def test_parse_is_cached(self):
+        """Test repeated parses reuse the cached result without sharing dicts."""
+        url = "https://polymarket.com/event/cached-event"
+        PolymarketURLParser._parse_cached.cache_clear()
+        
+        first = self.parser.parse(url)
+        assert self.parser.is_event_url(url) is True
+        first['type'] = 'mutated'
+        
+        assert self.parser.parse(url)['type'] == 'event'
+        info = PolymarketURLParser._parse_cached.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
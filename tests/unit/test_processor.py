@@ -8,7 +8,7 @@ from io import StringIO
 from datetime import datetime
 from pathlib import Path
 
-from polymarket.utils.processor import DataProcessor
+from polymarket.utils.processor import DataProcessor, EventCSVWriter
 from polymarket.models.models import (
     Market, PriceHistory, PricePoint, MarketHistoricalData, 
     Event, EventHistoricalData
@@ -118,6 +118,48 @@ class TestDataProcessor:
         assert stats['change'] == 0.2
         assert stats['change_percent'] == 50.0
     
+    def test_calculate_statistics_volatility(self):
+        """Test volatility is the sample std of period returns."""
+        history = PriceHistory(
+            market_id="1",
+            token_id="0x1",
+            outcome="Yes",
+            interval="1h",
+            start_time=None,
+            end_time=None,
+            price_points=[
+                PricePoint(timestamp=datetime(2024, 1, 1, i), price=price)
+                for i, price in enumerate([0.5, 0.6, 0.3])
+            ]
+        )
+        
+        stats = DataProcessor.calculate_statistics(history)
+        
+        expected = pd.Series([0.5, 0.6, 0.3]).pct_change().dropna().std()
+        assert stats['volatility'] == round(expected, 4)
+        assert stats['median'] == 0.5
+    
+    def test_history_to_frame(self):
+        """Test a history converts to a timestamp-indexed price column."""
+        history = PriceHistory(
+            market_id="1",
+            token_id="0x1",
+            outcome="Yes",
+            interval="1h",
+            start_time=None,
+            end_time=None,
+            price_points=[
+                PricePoint(timestamp=datetime(2024, 1, 1, i), price=0.1 * (i + 1))
+                for i in range(3)
+            ]
+        )
+        
+        df = DataProcessor.history_to_frame(history, "Yes_price")
+        
+        assert df.index.name == "timestamp"
+        assert list(df.index) == [datetime(2024, 1, 1, i) for i in range(3)]
+        assert df["Yes_price"].tolist() == [0.1, 0.2, 0.1 * 3]
+    
     def test_calculate_statistics_empty_history(self):
         """Test statistics with empty history."""
         history = PriceHistory(
@@ -125,6 +167,8 @@ class TestDataProcessor:
             token_id="0x1",
             outcome="Yes",
             interval="1h",
+            start_time=None,
+            end_time=None,
             price_points=[]
         )
         
@@ -134,6 +178,7 @@ class TestDataProcessor:
         assert stats['mean'] == 0
         assert stats['min'] == 0
         assert stats['max'] == 0
+        assert isinstance(stats['mean'], float)
     
     def test_to_csv(self, sample_market, sample_price_history):
         """Test CSV generation."""
@@ -275,4 +320,87 @@ class TestDataProcessor:
         assert output_path.exists()
         content = output_path.read_text()
         assert "timestamp,test-market_yes" in content
-        assert "2024-01-01" in content
\ No newline at end of file
+        assert "2024-01-01" in content
+
+
+class TestEventCSVWriter:
+    """Test incremental EventCSVWriter."""
+    
+    @staticmethod
+    def _market_data(slug, title, points):
+        market = Market(
+            id=slug,
+            slug=slug,
+            condition_id="0x1",
+            question=f"{title}?",
+            outcomes=["Yes"],
+            token_ids=["0x1"],
+            active=True,
+            closed=False,
+            group_item_title=title
+        )
+        history = PriceHistory(
+            market_id=slug,
+            token_id="0x1",
+            outcome="Yes",
+            interval="1h",
+            start_time=None,
+            end_time=None,
+            price_points=[
+                PricePoint(timestamp=datetime(2024, 1, 1, hour), price=price)
+                for hour, price in points
+            ]
+        )
+        return MarketHistoricalData(market=market, price_histories={"Yes": history})
+    
+    def test_merges_and_forward_fills(self, tmp_path):
+        """Test markets added one at a time merge into forward-filled rows."""
+        output_path = tmp_path / "event.csv"
+        
+        with EventCSVWriter(output_path) as writer:
+            writer.add_market(self._market_data("a-win", "Team A", [(0, 0.1), (2, 0.3)]))
+            writer.add_market(self._market_data("b-win", "Team B", [(1, 0.5)]))
+        
+        assert writer.has_data
+        assert writer.rows_written == 3
+        assert output_path.read_text().splitlines() == [
+            "timestamp,team_a_yes,team_b_yes",
+            "2024-01-01T00:00:00,0.1,",
+            "2024-01-01T01:00:00,0.1,0.5",
+            "2024-01-01T02:00:00,0.3,0.5",
+        ]
+    
+    def test_chunksize_does_not_change_output(self, tmp_path):
+        """Test flushing every row yields the same file as buffered writes."""
+        outputs = []
+        for chunksize in (None, 1):
+            output_path = tmp_path / f"event-{chunksize}.csv"
+            with EventCSVWriter(output_path, chunksize) as writer:
+                writer.add_market(self._market_data("a-win", "Team A", [(0, 0.1), (2, 0.3)]))
+                writer.add_market(self._market_data("b-win", "Team B", [(1, 0.5)]))
+            outputs.append(output_path.read_bytes())
+        
+        assert outputs[0] == outputs[1]
+    
+    def test_error_discards_output(self, tmp_path):
+        """Test an exception inside the context skips writing the file."""
+        output_path = tmp_path / "event.csv"
+        
+        with pytest.raises(RuntimeError):
+            with EventCSVWriter(output_path) as writer:
+                writer.add_market(self._market_data("a-win", "Team A", [(0, 0.1)]))
+                raise RuntimeError("boom")
+        
+        assert not output_path.exists()
+    
+    def test_spill_failure_raises_export_error(self, tmp_path, mocker):
+        """Test a failure on the background spill thread surfaces on close."""
+        output_path = tmp_path / "event.csv"
+        writer = EventCSVWriter(output_path)
+        mocker.patch.object(writer, '_spill_market', side_effect=OSError("disk full"))
+        
+        writer.add_market(self._market_data("a-win", "Team A", [(0, 0.1)]))
+        
+        with pytest.raises(ExportError, match="disk full"):
+            writer.close()
+        assert not output_path.exists()
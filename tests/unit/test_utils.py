@@ -2,8 +2,14 @@
 Unit tests for utility functions.
 """
 
+import os
 import pytest
-from polymarket.utils.utils import get_column_prefix, format_price, format_volume
+from datetime import datetime
+from polymarket.utils.utils import (
+    get_column_prefix, date_to_timestamp, estimate_price_points, exceeds_memory_budget,
+    loads_json, format_price, format_volume
+)
+from polymarket.utils.cache import MetadataCache
 from polymarket.models.models import Market
 
 
@@ -99,6 +105,97 @@ class TestFormatPrice:
         assert format_price(0.0001, precision=3) == "$0.000"
 
 
+class TestDateToTimestamp:
+    """Test date_to_timestamp function."""
+    
+    def test_matches_strptime(self):
+        """Test parsing agrees with the strptime-based conversion."""
+        for value in ["2024-01-01", "2024-02-29", "2025-12-31"]:
+            expected = int(datetime.strptime(value, "%Y-%m-%d").timestamp())
+            assert date_to_timestamp(value) == expected
+    
+    def test_invalid_date(self):
+        """Test invalid dates raise ValueError."""
+        with pytest.raises(ValueError):
+            date_to_timestamp("2024-13-01")
+    
+    @pytest.mark.parametrize("value", ["20240101", "2024-W01-1", "2024-01-01T00:00"])
+    def test_rejects_other_iso_forms(self, value):
+        """Test only the YYYY-MM-DD form is accepted."""
+        with pytest.raises(ValueError):
+            date_to_timestamp(value)
+
+
+class TestEstimatePricePoints:
+    """Test estimate_price_points function."""
+    
+    @staticmethod
+    def _market(token_ids):
+        return Market(
+            slug="test",
+            condition_id="0x1",
+            question="Test?",
+            outcomes=["Yes", "No"],
+            token_ids=token_ids,
+            active=True,
+            closed=False
+        )
+    
+    def test_scales_with_interval_and_days(self):
+        """Test estimate is outcomes x days x points per day."""
+        markets = [self._market(["0x1", "0x2"]) for _ in range(5)]
+        
+        assert estimate_price_points(markets, "1m", 365) == 10 * 365 * 1440
+        assert estimate_price_points(markets, "1d", 30) == 10 * 30
+    
+    def test_skips_inactive_markets_and_uses_dates(self):
+        """Test inactive markets are ignored and date ranges define the span."""
+        markets = [self._market(["0x1", "0x2"]), self._market(["", ""])]
+        
+        estimate = estimate_price_points(
+            markets, "1h", 30, start_date="2024-01-01", end_date="2024-01-11"
+        )
+        
+        assert estimate == 2 * 10 * 24
+    
+    def test_fidelity_overrides_interval(self):
+        """Test fidelity in minutes sets the point density."""
+        markets = [self._market(["0x1", "0x2"])]
+        
+        assert estimate_price_points(markets, "1d", 1, fidelity=5) == 2 * 288
+
+
+class TestExceedsMemoryBudget:
+    """Test exceeds_memory_budget function."""
+    
+    def test_compares_projection_to_available_memory(self):
+        """Test points are weighed against half of available memory."""
+        assert exceeds_memory_budget(1_000, memory=10**9) is False
+        assert exceeds_memory_budget(10**8, memory=10**9) is True
+    
+    def test_unknown_memory_never_exceeds(self, mocker):
+        """Test an undetectable memory size does not force streaming."""
+        mocker.patch('polymarket.utils.utils.available_memory', return_value=None)
+        
+        assert exceeds_memory_budget(10**12) is False
+
+
+class TestLoadsJson:
+    """Test loads_json function."""
+    
+    def test_decodes_bytes(self):
+        """Test raw response bytes decode to Python values."""
+        assert loads_json(b'{"history": [{"t": 1, "p": 0.5}]}') == {"history": [{"t": 1, "p": 0.5}]}
+    
+    def test_stdlib_fallback(self, mocker):
+        """Test decoding falls back to json when orjson is unavailable."""
+        mocker.patch('polymarket.utils.utils.orjson', None)
+        
+        assert loads_json(b'[1, 2.5]') == [1, 2.5]
+        with pytest.raises(ValueError):
+            loads_json(b'{')
+
+
 class TestFormatVolume:
     """Test format_volume function."""
     
@@ -126,4 +223,47 @@ class TestFormatVolume:
         """Test precision in formatting."""
         assert format_volume(1_234_567) == "$1.2M"
         assert format_volume(1_234) == "$1.2k"
-        assert format_volume(123.456) == "$123.46"
\ No newline at end of file
+        assert format_volume(123.456) == "$123.46"
+
+
+class TestMetadataCache:
+    """Test MetadataCache on-disk cache."""
+    
+    def test_round_trip(self, tmp_path):
+        """Test stored payloads are returned on the next read."""
+        cache = MetadataCache(cache_dir=tmp_path, ttl=60, enabled=True)
+        cache.set("events", "some-event", {"slug": "some-event", "markets": []})
+        
+        assert cache.get("events", "some-event") == {"slug": "some-event", "markets": []}
+        assert cache.get("events", "other-event") is None
+    
+    def test_expired_entry_is_miss(self, tmp_path):
+        """Test entries older than the TTL are ignored."""
+        cache = MetadataCache(cache_dir=tmp_path, ttl=60, enabled=True)
+        cache.set("events", "old-event", {"slug": "old-event"})
+        path = cache._path("events", "old-event")
+        os.utime(path, (0, 0))
+        
+        assert cache.get("events", "old-event") is None
+    
+    def test_stale_entry_keeps_etag_for_revalidation(self, tmp_path):
+        """Test expired entries stored with an ETag can be revalidated."""
+        cache = MetadataCache(cache_dir=tmp_path, ttl=60, enabled=True)
+        cache.set("events", "old-event", {"slug": "old-event"}, etag='"v1"')
+        cache.set("events", "no-etag", {"slug": "no-etag"})
+        os.utime(cache._path("events", "old-event"), (0, 0))
+        
+        assert cache.get("events", "old-event") is None
+        assert cache.get_stale("events", "old-event") == ({"slug": "old-event"}, '"v1"')
+        assert cache.get_stale("events", "no-etag") is None
+        
+        cache.touch("events", "old-event")
+        assert cache.get("events", "old-event") == {"slug": "old-event"}
+    
+    def test_disabled_cache_never_writes(self, tmp_path):
+        """Test a disabled cache is a no-op."""
+        cache = MetadataCache(cache_dir=tmp_path, enabled=False)
+        cache.set("events", "some-event", {"slug": "some-event"})
+        
+        assert cache.get("events", "some-event") is None
+        assert not any(tmp_path.iterdir())